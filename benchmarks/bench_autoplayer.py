@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Autoplayer frame-loop benchmark.
+
+Runs a headless 60 FPS frame loop in which the autoplayer plays a game,
+with planning in a worker thread and in a worker process, and reports
+the time spent in the autoplayer per frame, how late frames started
+and how many pieces were placed. Planning in a thread shares the GIL
+with the frame loop, which shows up as lateness on a busy machine.
+
+Usage:
+    python benchmarks/bench_autoplayer.py [--seconds S] [--fps N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tetris.autoplayer import AutoPlayer
+from tetris.core import GameCore
+from tetris.constants import GAME_STATES
+
+
+def run_loop(use_process: bool, seconds: float, fps: int) -> None:
+    """Run the frame loop and print its statistics."""
+    player = AutoPlayer(actions_per_frame=2, use_process=use_process)
+    game = GameCore(seed=0)
+    frame = 1.0 / fps
+    update_times, lateness = [], []
+    pieces = 0
+    next_frame = time.perf_counter()
+    deadline = next_frame + seconds
+    try:
+        while next_frame < deadline:
+            now = time.perf_counter()
+            if now < next_frame:
+                time.sleep(next_frame - now)
+            lateness.append(max(0.0, time.perf_counter() - next_frame))
+            next_frame += frame
+            
+            if game.state == GAME_STATES["GAME_OVER"]:
+                game = GameCore(seed=pieces)
+            piece = game.current_piece
+            start = time.perf_counter()
+            player.update(game)
+            update_times.append(time.perf_counter() - start)
+            pieces += game.current_piece is not piece
+            game.update()
+    finally:
+        player.close()
+    
+    lateness.sort()
+    mode = "process" if use_process else "thread"
+    print(f"{mode:<8} {len(update_times)} frames, {pieces} pieces, "
+          f"update mean {statistics.fmean(update_times) * 1e3:.3f} ms "
+          f"max {max(update_times) * 1e3:.3f} ms, "
+          f"late p99 {lateness[int(len(lateness) * 0.99)] * 1e3:.2f} ms "
+          f"max {lateness[-1] * 1e3:.2f} ms")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--fps", type=int, default=60)
+    args = parser.parse_args()
+    
+    for use_process in (False, True):
+        run_loop(use_process, args.seconds, args.fps)
+
+
+if __name__ == "__main__":
+    main()
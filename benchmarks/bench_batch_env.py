@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Batched environment throughput benchmark.
+
+Steps N games in lockstep with BatchEnv under a random action stream
+and reports board-steps per second (games times steps over wall time)
+for several batch sizes, next to a loop of N Simulator games.
+
+A BatchEnv step costs a fixed number of NumPy calls whatever the number
+of games, so a single game is far slower than a Simulator. The batch
+breaks even with the loop at about 64 games and wins above that, by
+about 1.5 times at 128 games, 3 times at 256 and 5 to 6 times at 1024
+on the machine the numbers were taken on.
+
+Usage:
+    python benchmarks/bench_batch_env.py [--steps N] [--sizes 1 64 128 1024]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from tetris.batch_env import BATCH_ACTIONS, BatchEnv
+from tetris.simulator import Simulator
+
+
+def bench_batch(num_games: int, steps: int) -> float:
+    """Step a batch of games and return board-steps per second."""
+    env = BatchEnv(num_games, seed=0)
+    actions = np.random.default_rng(0).integers(0, len(BATCH_ACTIONS), (64, num_games))
+    step = env.step
+    start = time.perf_counter()
+    for i in range(steps):
+        step(actions[i & 63])
+    return num_games * steps / (time.perf_counter() - start)
+
+
+def bench_loop(num_games: int, steps: int) -> float:
+    """Step the same number of Simulator games one by one and return board-steps/s."""
+    sims = [Simulator(seed=seed) for seed in range(num_games)]
+    codes = np.random.default_rng(0).integers(0, len(BATCH_ACTIONS), (64, num_games)).tolist()
+    start = time.perf_counter()
+    for i in range(steps):
+        for sim, code in zip(sims, codes[i & 63]):
+            if sim.step(BATCH_ACTIONS[code]).game_over:
+                sim.reset()
+    return num_games * steps / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--steps", type=int, default=200, help="lockstep ticks per batch size")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 64, 128, 1024])
+    args = parser.parse_args()
+    
+    print(f"{'games':>6} {'BatchEnv':>16} {'Simulator loop':>18} {'speedup':>8}")
+    for size in args.sizes:
+        batch = bench_batch(size, args.steps)
+        loop = bench_loop(size, args.steps)
+        print(f"{size:>6} {batch:>12,.0f} b-s/s {loop:>14,.0f} b-s/s {batch / loop:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
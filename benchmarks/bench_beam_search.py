@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Beam-search planner benchmark.
+
+Plays headless games with the beam-search planner for both visible
+depths and several beam widths, inline and with worker processes, and
+reports lines cleared, time per move and placements evaluated per
+second. Depth 1 is the greedy heuristic.
+
+Usage:
+    python benchmarks/bench_beam_search.py [--pieces N] [--seed S] [--workers N]
+"""
+
+import argparse
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tetris.beam_search import BeamSearch, play_beam_game
+from tetris.simulator import Simulator
+
+SETTINGS = ((1, 1), (2, 4), (2, 8), (2, 16), (2, 32))
+
+
+def run(depth: int, beam_width: int, workers: int, pieces: int, seed: int) -> None:
+    """Play one game and print its statistics."""
+    with BeamSearch(beam_width=beam_width, workers=workers) as planner:
+        result, nodes, seconds = play_beam_game(planner, Simulator(), seed, depth, pieces)
+    print(f"depth {depth} width {beam_width:>2} workers {workers}: "
+          f"{result.lines:>3} lines in {result.pieces} pieces, "
+          f"{seconds / max(1, result.pieces) * 1e3:7.2f} ms/move, "
+          f"{nodes / seconds:8.0f} nodes/s")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pieces", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    
+    for depth, beam_width in SETTINGS:
+        run(depth, beam_width, 0, args.pieces, args.seed)
+    for depth, beam_width in SETTINGS[-2:]:
+        run(depth, beam_width, args.workers, args.pieces, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for settled blocks.
+
+Fills the visible grid of several games with settled blocks and reports
+the bytes allocated per locked cell, including the block objects, their
+colors and the registry and matrix entries that index them.
+
+Usage:
+    python benchmarks/bench_block_memory.py [--games N]
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from tetris.block import Block
+from tetris.constants import GRID_WIDTH, GRID_HEIGHT
+from tetris.game import TetrisGame
+
+
+def fill_game(game: TetrisGame) -> int:
+    """Fill every visible cell below the spawn row with settled blocks."""
+    cells = 0
+    for y in range(1, GRID_HEIGHT):
+        for x in range(GRID_WIDTH):
+            Block(game, x, y)
+            cells += 1
+    game.update_matrix()
+    return cells
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=200, help="number of boards to fill")
+    args = parser.parse_args()
+    
+    surface = pygame.Surface((1, 1))
+    games = [TetrisGame(surface, 0, 0, 1, 1) for _ in range(args.games)]
+    
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    cells = sum(fill_game(game) for game in games)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    print(f"boards:               {args.games}")
+    print(f"locked cells:         {cells}")
+    print(f"bytes per locked cell: {(after - before) / cells:.1f}")
+
+
+if __name__ == "__main__":
+    main()
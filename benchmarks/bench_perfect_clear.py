@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Perfect-clear solver benchmark.
+
+Builds a set of puzzle boards by carving pieces of PIECE_CONFIGURATIONS
+out of full bottom rows, solves each one in the calling process and
+with the top of the search split across worker processes, and reports
+the solve time, the placements searched and the search rate.
+
+Usage:
+    python benchmarks/bench_perfect_clear.py [--seeds N] [--workers N] [--hard]
+"""
+
+import argparse
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tetris.perfect_clear import PerfectClearSolver, puzzle_board
+
+# (lines, pieces) of the puzzles
+PUZZLES = ((2, 2), (2, 4), (3, 4), (4, 6), (4, 8))
+HARD_PUZZLES = ((4, 10), (6, 12))
+
+
+def run(puzzles, seeds: int, workers: int) -> None:
+    """Solve every puzzle and print the solve times."""
+    total_seconds = 0.0
+    total_nodes = 0
+    solved = 0
+    with PerfectClearSolver(workers=workers) as solver:
+        for lines, count in puzzles:
+            for seed in range(seeds):
+                board, pieces = puzzle_board(lines, count, seed)
+                result = solver.solve(board, pieces)
+                total_seconds += result.seconds
+                total_nodes += result.nodes
+                solved += result.solved
+                print(f"  {lines} lines {len(pieces):>2} pieces seed {seed}: "
+                      f"{'solved' if result.solved else 'no clear':<8} "
+                      f"{result.seconds * 1e3:9.1f} ms {result.nodes:>8} nodes "
+                      f"{result.nodes / max(result.seconds, 1e-9):8.0f} nodes/s")
+    print(f"workers {workers}: {solved} solved in {total_seconds:.2f}s, "
+          f"{total_nodes / max(total_seconds, 1e-9):.0f} nodes/s")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seeds", type=int, default=2)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--hard", action="store_true", help="add puzzles with more pieces")
+    args = parser.parse_args()
+    
+    puzzles = PUZZLES + HARD_PUZZLES if args.hard else PUZZLES
+    for workers in (0, args.workers):
+        run(puzzles, args.seeds, workers)
+
+
+if __name__ == "__main__":
+    main()
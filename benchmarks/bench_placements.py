@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Placement enumeration benchmark.
+
+Plays seeded games choosing random reachable placements and reports the
+time to enumerate the placements of each spawning piece, from scratch
+and through the memoising generator when the same games are replayed.
+
+Usage:
+    python benchmarks/bench_placements.py [--games N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tetris.constants import GAME_STATES
+from tetris.placements import PlacementGenerator, enumerate_placements
+from tetris.simulator import Simulator
+
+
+def play(games: int, generator: PlacementGenerator = None) -> tuple:
+    """Play games on random placements and return (spawns, placements, seconds enumerating)."""
+    sim = Simulator()
+    spawns = found = 0
+    elapsed = 0.0
+    for seed in range(games):
+        rng = random.Random(seed)
+        sim.reset(seed)
+        while sim.state == GAME_STATES["PLAYING"]:
+            start = time.perf_counter()
+            if generator is None:
+                placements = enumerate_placements(sim.board.rows, sim.piece_type)
+            else:
+                placements = generator.placements(sim.board, sim.piece_type)
+            elapsed += time.perf_counter() - start
+            spawns += 1
+            found += len(placements)
+            if not placements:
+                break
+            for action in rng.choice(placements).path:
+                sim.apply_action(action)
+    return spawns, found, elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=50)
+    args = parser.parse_args()
+    
+    spawns, found, elapsed = play(args.games)
+    print(f"{spawns} spawns, {found / spawns:.1f} placements each")
+    print(f"BFS       {elapsed / spawns * 1e3:8.3f} ms/spawn")
+    
+    generator = PlacementGenerator()
+    play(args.games, generator)
+    spawns, _, elapsed = play(args.games, generator)
+    stats = generator.stats()
+    print(f"memoised  {elapsed / spawns * 1e3:8.3f} ms/spawn on replayed games "
+          f"(hit rate {stats.hit_rate:.0%}, {stats.size} entries)")
+
+
+if __name__ == "__main__":
+    main()
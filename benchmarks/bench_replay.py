@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Replay verification benchmark.
+
+Records games driven by random inputs and gravity, then reports the
+encoded size per event and how many replays per minute are decoded and
+verified at CPU speed, with the Simulator (the default) and with
+GameCore.
+
+Usage:
+    python benchmarks/bench_replay.py [--games N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import List
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tetris.core import GameCore
+from tetris.constants import ACTIONS, GAME_STATES
+from tetris.replay import decode_replay, encode_replay, play_replay
+
+
+def record_games(games: int) -> List[bytes]:
+    """Play seeded games with random inputs and return their encoded replays."""
+    actions = list(ACTIONS.values())
+    replays = []
+    for seed in range(games):
+        rng = random.Random(seed)
+        game = GameCore(seed=seed)
+        game.start_recording()
+        while game.state == GAME_STATES["PLAYING"]:
+            # Mostly sideways moves and rotations, as a player would press
+            game.step(rng.choice(actions[:5]) if rng.random() < 0.8 else None)
+        replays.append(encode_replay(game.get_replay()))
+    return replays
+
+
+def replays_per_minute(replays: List[bytes], core: bool) -> float:
+    """Decode and verify every replay and return replays per minute."""
+    start = time.perf_counter()
+    for data in replays:
+        replay = decode_replay(data)
+        game = GameCore(seed=replay.seed) if core else None
+        score, lines, _ = play_replay(replay, game)
+        if (score, lines) != (replay.score, replay.lines):
+            raise RuntimeError(f"Replay of seed {replay.seed} does not verify")
+    return len(replays) * 60 / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=500)
+    args = parser.parse_args()
+    
+    replays = record_games(args.games)
+    events = sum(len(decode_replay(data).events) for data in replays)
+    size = sum(len(data) for data in replays)
+    print(f"{len(replays)} replays, {events / len(replays):.0f} events each, "
+          f"{size / events:.2f} bytes/event")
+    print(f"Simulator {replays_per_minute(replays, False):>12,.0f} replays/min")
+    print(f"GameCore  {replays_per_minute(replays, True):>12,.0f} replays/min")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Rotation throughput benchmark.
+
+Rotates a piece back and forth in open space and against the right wall,
+where every rotation needs a kick, and reports rotate calls per second.
+
+Usage:
+    python benchmarks/bench_rotation.py [--rotations N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from tetris.constants import PIECE_TYPES
+from tetris.game import TetrisGame
+from tetris.piece import Piece
+
+
+def measure(game: TetrisGame, piece_type: int, against_wall: bool, rotations: int) -> float:
+    """Rotate one piece repeatedly and return rotations per second."""
+    piece = Piece(game, piece_type)
+    for _ in range(6):
+        piece.move("DOWN")
+    if against_wall:
+        while piece.move("RIGHT"):
+            pass
+    
+    rotate = piece.rotate
+    start = time.perf_counter()
+    for _ in range(rotations // 2):
+        rotate("CW")
+        rotate("CCW")
+    elapsed = time.perf_counter() - start
+    return rotations / elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rotations", type=int, default=200000, help="rotate calls per case")
+    args = parser.parse_args()
+    
+    game = TetrisGame(pygame.Surface((1, 1)), 0, 0, 1, 1)
+    for piece_type, name in PIECE_TYPES.items():
+        open_rate = measure(game, piece_type, False, args.rotations)
+        wall_rate = measure(game, piece_type, True, args.rotations)
+        print(f"{name:<11} open: {open_rate:>10,.0f} rot/s   wall: {wall_rate:>10,.0f} rot/s")
+
+
+if __name__ == "__main__":
+    main()
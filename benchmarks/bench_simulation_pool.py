@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Simulation pool scaling benchmark.
+
+Plays the same seed sweep in the calling process and with process pools
+of growing size, and reports games per second and the parallel
+efficiency relative to the single-process run.
+
+Usage:
+    python benchmarks/bench_simulation_pool.py [--games N] [--max-workers N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tetris.simulation import DEFAULT_CHUNK_SIZE, run_simulations
+
+
+def games_per_second(games: int, workers: int, chunk_size: int) -> float:
+    """Play a sweep of games and return games per second."""
+    start = time.perf_counter()
+    run_simulations(range(games), workers=workers, chunk_size=chunk_size)
+    return games / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=4000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+    
+    baseline = games_per_second(args.games, 0, args.chunk_size)
+    print(f"{'inline':>8} {baseline:>10,.0f} games/s")
+    workers = 1
+    while workers <= args.max_workers:
+        rate = games_per_second(args.games, workers, args.chunk_size)
+        efficiency = rate / (baseline * workers)
+        print(f"{workers:>8} {rate:>10,.0f} games/s  efficiency {efficiency:6.1%}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Headless simulation throughput benchmark.
+
+Plays games on the standard board with the block-free Simulator and
+reports piece placements per second for direct placements (rotate and
+shift at spawn, then hard drop) and game ticks per second for ``step``
+driven by a random action stream. GameCore, which keeps Block objects,
+is measured on the same placement workload for comparison, and the
+buffered piece sequence against one generator call per piece. Every
+game is seeded, so runs are reproducible.
+
+Usage:
+    python benchmarks/bench_simulator.py [--placements N] [--steps N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import List, Tuple
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tetris.core import GameCore
+from tetris.constants import ACTIONS, GRID_WIDTH, GAME_STATES
+from tetris.rotation import NUM_ORIENTATIONS
+from tetris.rng import PieceSequence
+from tetris.simulator import Simulator
+
+TARGET_PLACEMENTS_PER_SECOND = 100000
+
+
+def random_placements(count: int) -> List[Tuple[int, int]]:
+    """Build a fixed table of (orientation, column) placements."""
+    rng = random.Random(0)
+    return [(rng.randrange(NUM_ORIENTATIONS), rng.randrange(GRID_WIDTH)) for _ in range(count)]
+
+
+def bench_placements(placements: int) -> Tuple[float, int]:
+    """Place pieces with Simulator.place and return placements/s and games."""
+    table = random_placements(4096)
+    sim = Simulator(seed=0)
+    place = sim.place
+    placed = games = 0
+    i = 0
+    start = time.perf_counter()
+    while placed < placements:
+        result = place(*table[i & 4095])
+        i += 1
+        if result.locked:
+            placed += 1
+            if result.game_over:
+                sim.reset()
+                games += 1
+    return placed / (time.perf_counter() - start), games
+
+
+def bench_core_placements(placements: int) -> float:
+    """Place pieces with GameCore actions and return placements/s."""
+    table = random_placements(4096)
+    core = GameCore(seed=0)
+    placed = 0
+    i = 0
+    start = time.perf_counter()
+    while placed < placements:
+        orientation, x = table[i & 4095]
+        i += 1
+        piece = core.current_piece
+        for _ in range(orientation):
+            piece.rotate("CW")
+        while piece.center_x < x and piece.move("RIGHT"):
+            pass
+        while piece.center_x > x and piece.move("LEFT"):
+            pass
+        core.hard_drop()
+        placed += 1
+        if core.state == GAME_STATES["GAME_OVER"]:
+            core = GameCore(seed=placed)
+    return placed / (time.perf_counter() - start)
+
+
+def bench_steps(steps: int) -> float:
+    """Drive Simulator.step with random actions and return steps/s."""
+    rng = random.Random(0)
+    # Mostly sideways moves and rotations, with the odd hard drop
+    choices = [ACTIONS["LEFT"], ACTIONS["RIGHT"], ACTIONS["ROTATE_CW"],
+               ACTIONS["ROTATE_CCW"], None, None, ACTIONS["HARD_DROP"]]
+    actions = [rng.choice(choices) for _ in range(4096)]
+    sim = Simulator(seed=0)
+    step = sim.step
+    start = time.perf_counter()
+    for i in range(steps):
+        if step(actions[i & 4095]).game_over:
+            sim.reset()
+    return steps / (time.perf_counter() - start)
+
+
+def bench_piece_draws(draws: int) -> Tuple[float, float]:
+    """Return piece draws per second for randint and for PieceSequence."""
+    rng = random.Random(0)
+    randint = rng.randint
+    start = time.perf_counter()
+    for _ in range(draws):
+        randint(0, 6)
+    direct = draws / (time.perf_counter() - start)
+    
+    take = PieceSequence(random.Random(0)).next
+    start = time.perf_counter()
+    for _ in range(draws):
+        take()
+    return direct, draws / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--placements", type=int, default=300000)
+    parser.add_argument("--steps", type=int, default=300000)
+    args = parser.parse_args()
+    
+    rate, games = bench_placements(args.placements)
+    status = "ok" if rate >= TARGET_PLACEMENTS_PER_SECOND else "below target"
+    print(f"Simulator.place  {rate:>12,.0f} placements/s  ({games} games, "
+          f"target {TARGET_PLACEMENTS_PER_SECOND:,}: {status})")
+    
+    core_rate = bench_core_placements(args.placements // 10)
+    print(f"GameCore         {core_rate:>12,.0f} placements/s  ({rate / core_rate:.1f}x slower)")
+    
+    step_rate = bench_steps(args.steps)
+    print(f"Simulator.step   {step_rate:>12,.0f} steps/s")
+    
+    direct, buffered = bench_piece_draws(args.placements)
+    print(f"piece draws      {buffered:>12,.0f} /s buffered, {direct:,.0f} /s with randint")
+
+
+if __name__ == "__main__":
+    main()
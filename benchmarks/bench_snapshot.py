@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Snapshot and restore benchmark.
+
+Plays a few seeded games to a mid-game position, then reports how many
+snapshot+restore pairs per second the Simulator and GameCore sustain,
+against deep-copying the GameCore as a baseline. The drop rows hard-drop
+a piece between the snapshot and the restore, as a search does, so the
+restore has to undo a lock.
+
+Usage:
+    python benchmarks/bench_snapshot.py [--pieces N] [--seconds S]
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+from typing import Callable
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tetris.core import GameCore
+from tetris.constants import ACTIONS, GAME_STATES
+from tetris.simulator import Simulator
+
+
+def rate(operation: Callable[[], object], seconds: float) -> float:
+    """Call an operation repeatedly for about a duration and return calls per second."""
+    calls = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            operation()
+        calls += 100
+    return calls / (time.perf_counter() - start)
+
+
+def mid_game_core(pieces: int) -> GameCore:
+    """Place pieces by random sideways moves, keeping the lowest of a few tries."""
+    rng = random.Random(1)
+    game = GameCore(seed=1)
+    moves = [ACTIONS["LEFT"], ACTIONS["RIGHT"], ACTIONS["ROTATE_CW"]]
+    for _ in range(pieces):
+        snapshot = game.snapshot()
+        tries = []
+        for _ in range(8):
+            sequence = [rng.choice(moves) for _ in range(rng.randrange(6))] + [ACTIONS["HARD_DROP"]]
+            for action in sequence:
+                game.apply_action(action)
+            tries.append((game.state != GAME_STATES["PLAYING"], game.matrix.profile.max_height, sequence))
+            game.restore(snapshot)
+        game_over, _, sequence = min(tries, key=lambda attempt: attempt[:2])
+        if game_over:
+            break
+        for action in sequence:
+            game.apply_action(action)
+    return game
+
+
+def drop_and_undo(game) -> Callable[[], None]:
+    """Make an operation that hard-drops a piece and restores the game."""
+    def operation() -> None:
+        snapshot = game.snapshot()
+        game.hard_drop()
+        game.restore(snapshot)
+    return operation
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pieces", type=int, default=15)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+    
+    game = mid_game_core(args.pieces)
+    sim = Simulator(seed=1)
+    sim.board.rows = game.matrix.rows
+    print(f"{len(game.blocks)} blocks, snapshot of {len(game.snapshot().colors)} colors")
+    
+    results = [
+        ("Simulator snapshot+restore", rate(lambda: sim.restore(sim.snapshot()), args.seconds)),
+        ("GameCore snapshot+restore", rate(lambda: game.restore(game.snapshot()), args.seconds)),
+        ("Simulator drop+restore", rate(drop_and_undo(sim), args.seconds)),
+        ("GameCore drop+restore", rate(drop_and_undo(game), args.seconds)),
+        ("GameCore deepcopy", rate(lambda: copy.deepcopy(game), args.seconds)),
+    ]
+    for name, per_second in results:
+        print(f"{name:<28} {per_second:>12,.0f} pairs/s  {1e6 / per_second:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
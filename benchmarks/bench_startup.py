@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Startup time benchmark.
+
+Reports the cumulative import time of ``import tetris`` and of the
+headless core as measured by ``python -X importtime``, and the wall
+time from launching a fresh interpreter running main.py to its first
+rendered frame (using SDL's dummy video driver). Each figure is the
+best of several runs in fresh interpreters.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imports main.py, builds the game runner and renders one frame
+FIRST_FRAME_SCRIPT = """
+import main
+import pygame
+from tetris.runner import GameRunner
+runner = GameRunner()
+runner._handle_events()
+runner._update_game()
+runner._draw_ui()
+runner.game.draw()
+pygame.display.update()
+"""
+
+
+def _environment() -> dict:
+    """Environment for the child interpreters."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = PROJECT_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    env["SDL_VIDEODRIVER"] = "dummy"
+    env["SDL_AUDIODRIVER"] = "dummy"
+    return env
+
+
+def import_time(module: str, runs: int) -> float:
+    """Return the best cumulative import time of a module in milliseconds."""
+    best = float("inf")
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=PROJECT_ROOT, env=_environment(), capture_output=True, text=True, check=True,
+        )
+        for line in result.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == module:
+                best = min(best, int(fields[1]) / 1000)
+    return best
+
+
+def wall_time(code: str, runs: int) -> float:
+    """Return the best wall time of a fresh interpreter running code, in milliseconds."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, env=_environment(),
+                       stderr=subprocess.DEVNULL, check=True)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def main() -> None:
+    """Run the startup benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    
+    print("python -X importtime (cumulative, best of %d):" % args.runs)
+    for module in ("tetris", "tetris.core", "tetris.game"):
+        print(f"  import {module:<12} {import_time(module, args.runs):8.1f} ms")
+    
+    interpreter = wall_time("pass", args.runs)
+    first_frame = wall_time(FIRST_FRAME_SCRIPT, args.runs)
+    print(f"\nwall time (best of {args.runs}):")
+    print(f"  empty interpreter   {interpreter:8.1f} ms")
+    print(f"  main.py to frame    {first_frame:8.1f} ms")
+    print(f"  of which the game   {first_frame - interpreter:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
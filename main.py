@@ -14,22 +14,38 @@ Features:
 - Enhanced user interface
 
 Usage:
-    python main.py
+    python main.py [--seed N] [--record FILE] [--autoplay]
+    python main.py --replay FILE
 
 Controls:
     - Arrow Keys: Move pieces
+    - Up / Z: Rotate pieces
+    - Space: Hard drop
     - ESC: Quit game
     - R: Restart game (when game over)
     - D: Debug matrix (development)
 """
 
-from tetris.runner import run_game
+import argparse
+
+from tetris.replay import load_replay
+from tetris.runner import run_game, run_replay
 
 
 def main():
     """Main entry point for the Tetris game."""
+    parser = argparse.ArgumentParser(description="myLTetris - A Python Tetris Game")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the piece sequence")
+    parser.add_argument("--record", metavar="FILE", help="write a replay of each game to FILE, FILE-2...")
+    parser.add_argument("--replay", metavar="FILE", help="watch the replay stored in FILE")
+    parser.add_argument("--autoplay", action="store_true", help="let the heuristic bot play (demo)")
+    args = parser.parse_args()
+    
     try:
-        run_game()
+        if args.replay:
+            run_replay(load_replay(args.replay))
+        else:
+            run_game(args.seed, args.record, args.autoplay)
     except KeyboardInterrupt:
         print("\nGame interrupted by user. Thanks for playing!")
     except Exception as e:
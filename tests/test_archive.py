@@ -0,0 +1,120 @@
+"""
+Unit tests for the replay archive.
+"""
+
+import os
+import struct
+import tempfile
+import unittest
+
+from tetris.archive import (
+    ARCHIVE_MAGIC, ARCHIVE_VERSION, ArchiveError, ReplayArchive, append_replays
+)
+from tetris.replay import Replay, encode_replay
+
+
+def make_replay(index):
+    """Build a small replay whose fields depend on an index."""
+    return Replay(1000 + index, tuple((tick * 3, tick % 8) for tick in range(index + 1)),
+                  100 * index, index)
+
+
+class TestReplayArchive(unittest.TestCase):
+    """Test cases for the replay archive."""
+    
+    def setUp(self):
+        """Set up a temporary archive path."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "games.ltra")
+    
+    def tearDown(self):
+        """Remove the temporary files."""
+        self.directory.cleanup()
+    
+    def test_append_and_read(self):
+        """Test that appended replays are found by game id."""
+        replays = [make_replay(i) for i in range(20)]
+        self.assertEqual(append_replays(self.path, replays), list(range(20)))
+        with ReplayArchive(self.path) as archive:
+            self.assertEqual(len(archive), 20)
+            for game_id, replay in enumerate(replays):
+                self.assertEqual(archive.replay(game_id), replay)
+                self.assertEqual(archive.read(game_id), encode_replay(replay))
+                entry = archive.entry(game_id)
+                self.assertEqual((entry.game_id, entry.seed, entry.score, entry.lines),
+                                 (game_id, replay.seed, replay.score, replay.lines))
+    
+    def test_append_keeps_previous_games(self):
+        """Test that later appends extend the archive."""
+        append_replays(self.path, [make_replay(i) for i in range(3)])
+        self.assertEqual(append_replays(self.path, [make_replay(i) for i in range(3, 5)]), [3, 4])
+        with ReplayArchive(self.path) as archive:
+            self.assertEqual(list(archive.scores()), [0, 100, 200, 300, 400])
+            self.assertEqual(archive.replay(1), make_replay(1))
+            self.assertEqual(archive.replay(4), make_replay(4))
+    
+    def test_empty_archive(self):
+        """Test an archive without games."""
+        self.assertEqual(append_replays(self.path, []), [])
+        with ReplayArchive(self.path) as archive:
+            self.assertEqual(len(archive), 0)
+            self.assertEqual(list(archive.entries()), [])
+            with self.assertRaises(IndexError):
+                archive.entry(0)
+    
+    def test_negative_seeds(self):
+        """Test that negative seeds round-trip through the index and the replays."""
+        replays = [make_replay(0)._replace(seed=-5), make_replay(1)._replace(seed=-2 ** 63)]
+        append_replays(self.path, replays)
+        with ReplayArchive(self.path) as archive:
+            self.assertEqual([entry.seed for entry in archive.entries()], [-5, -2 ** 63])
+            self.assertEqual([archive.replay(i) for i in range(2)], replays)
+    
+    def test_unindexable_replay_writes_nothing(self):
+        """Test that a seed outside the index range is rejected before any write."""
+        append_replays(self.path, [make_replay(0)])
+        size = os.path.getsize(self.path)
+        with self.assertRaises(ArchiveError):
+            append_replays(self.path, [make_replay(1), make_replay(2)._replace(seed=2 ** 64)])
+        self.assertEqual(os.path.getsize(self.path), size)
+        with ReplayArchive(self.path) as archive:
+            self.assertEqual(len(archive), 1)
+    
+    def test_reads_and_upgrades_version_1(self):
+        """Test that a version 1 archive, with unsigned seeds, is read and upgraded on append."""
+        old = make_replay(0)._replace(seed=2 ** 63 - 1)
+        data = encode_replay(old)
+        header = struct.Struct("<4sHHQQ")
+        with open(self.path, "wb") as file:
+            file.write(header.pack(ARCHIVE_MAGIC, 1, 0, 1, header.size + len(data)))
+            file.write(data)
+            file.write(struct.pack("<QQIIQQ", 0, header.size, len(data), old.lines, old.seed,
+                                   old.score))
+        with ReplayArchive(self.path) as archive:
+            self.assertEqual(archive.entry(0).seed, old.seed)
+        append_replays(self.path, [make_replay(1)._replace(seed=-1)])
+        with open(self.path, "rb") as file:
+            self.assertEqual(header.unpack(file.read(header.size))[1], ARCHIVE_VERSION)
+        with ReplayArchive(self.path) as archive:
+            self.assertEqual([entry.seed for entry in archive.entries()], [old.seed, -1])
+            self.assertEqual(archive.replay(0), old)
+    
+    def test_invalid_files(self):
+        """Test that files which are not archives are rejected."""
+        with open(self.path, "wb") as file:
+            file.write(b"LTR1" + bytes(40))
+        with self.assertRaises(ArchiveError):
+            ReplayArchive(self.path)
+        with open(self.path, "wb") as file:
+            file.write(ARCHIVE_MAGIC)
+        with self.assertRaises(ArchiveError):
+            append_replays(self.path, [make_replay(0)])
+        for data in (b"", ARCHIVE_MAGIC + bytes(4)):
+            with open(self.path, "wb") as file:
+                file.write(data)
+            with self.assertRaises(ArchiveError):
+                ReplayArchive(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
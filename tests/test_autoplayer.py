@@ -0,0 +1,109 @@
+"""
+Unit tests for the heuristic autoplayer.
+"""
+
+import time
+import unittest
+
+from tetris.autoplayer import (
+    DEFAULT_WEIGHTS, AutoPlayer, HeuristicWeights, best_placement, evaluate,
+    play_heuristic_game, plan, PlanRequest
+)
+from tetris.board import Board
+from tetris.core import GameCore
+from tetris.constants import GAME_STATES, GRID_WIDTH, GRID_HEIGHT
+from tetris.simulator import Simulator
+
+
+def run_frames(player, game, frames):
+    """Call update once per frame, sleeping a little so the worker can plan."""
+    for _ in range(frames):
+        if game.state != GAME_STATES["PLAYING"]:
+            break
+        player.update(game)
+        time.sleep(0.001)
+
+
+class TestHeuristic(unittest.TestCase):
+    """Test cases for the placement heuristic."""
+    
+    def test_evaluate_weights_features(self):
+        """Test that the score is the weighted sum of the features."""
+        board = Board()
+        board.fill_row_mask(GRID_HEIGHT - 1, 0b1)
+        board.fill_row_mask(GRID_HEIGHT - 3, 0b1)
+        weights = HeuristicWeights(aggregate_height=-1, holes=-10, bumpiness=-100, lines=1000)
+        # Height 3, one hole, bumpiness 3, two lines
+        self.assertEqual(evaluate(board.profile, 2, weights), -3 - 10 - 300 + 2000)
+    
+    def test_best_placement_clears_line(self):
+        """Test that the bot fills a one-column well with a vertical bar."""
+        sim = Simulator(seed=0)
+        for y in range(GRID_HEIGHT - 4, GRID_HEIGHT):
+            sim.board.fill_row_mask(y, (1 << GRID_WIDTH) - 1 - 1)
+        sim.piece_type = 6  # Vertical bar
+        placement = best_placement(sim, DEFAULT_WEIGHTS)
+        self.assertEqual((placement.x, placement.y), (0, GRID_HEIGHT - 1))
+        # The simulator is left as it was
+        self.assertEqual((sim.x, sim.y, sim.pieces_placed), (5, 0, 0))
+    
+    def test_heuristic_game_clears_lines(self):
+        """Test that the heuristic plays far better than random placements."""
+        result = play_heuristic_game(Simulator(), seed=1, max_pieces=60)
+        self.assertEqual(result.pieces, 60)
+        self.assertGreater(result.lines, 10)
+    
+    def test_plan_request(self):
+        """Test planning from a copy of a game's state."""
+        game = GameCore(seed=3)
+        piece = game.current_piece
+        request = PlanRequest(7, tuple(game.matrix.rows), tuple(game.matrix.heights),
+                              tuple(game.matrix.column_counts), game.matrix.zobrist,
+                              piece.piece_type, piece.orientation, piece.center_x,
+                              piece.center_y, DEFAULT_WEIGHTS)
+        request_id, path = plan(request)
+        self.assertEqual(request_id, 7)
+        for action in path:
+            game.apply_action(action)
+        self.assertIsNot(game.current_piece, piece)
+
+
+class TestAutoPlayer(unittest.TestCase):
+    """Test cases for the AutoPlayer class."""
+    
+    def test_plays_a_game_in_a_thread(self):
+        """Test that the autoplayer places pieces through its worker thread."""
+        game = GameCore(seed=4)
+        player = AutoPlayer(actions_per_frame=3)
+        try:
+            run_frames(player, game, 400)
+        finally:
+            player.close()
+        self.assertGreater(player.plans_received, 5)
+        self.assertGreater(game.lines_cleared + len(game.blocks), 20)
+    
+    def test_update_never_waits_for_the_plan(self):
+        """Test that the first frame returns before any plan can be used."""
+        game = GameCore(seed=5)
+        player = AutoPlayer(frame_budget=0.001)
+        try:
+            start = time.perf_counter()
+            player.update(game)
+            self.assertLess(time.perf_counter() - start, 0.05)
+        finally:
+            player.close()
+    
+    def test_zero_budget_applies_nothing(self):
+        """Test that no input is applied once the frame budget is spent."""
+        game = GameCore(seed=6)
+        player = AutoPlayer(frame_budget=0.0)
+        try:
+            run_frames(player, game, 50)
+        finally:
+            player.close()
+        self.assertEqual(game.matrix.rows, Board().rows)
+        self.assertGreaterEqual(player.plans_received, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
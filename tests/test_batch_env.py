@@ -0,0 +1,112 @@
+"""
+Unit tests for the BatchEnv class.
+"""
+
+import unittest
+from unittest import mock
+
+from tetris.constants import ACTIONS, GRID_WIDTH, GRID_HEIGHT
+from tetris.rng import PIECE_BUFFER_SIZE, PieceSequence
+from tetris.simulator import Simulator
+
+try:
+    import numpy as np
+    from tetris.batch_env import ACTION_CODES, BATCH_ACTIONS, BatchEnv
+except ImportError:  # pragma: no cover - numpy is optional
+    BatchEnv = None
+
+
+@unittest.skipIf(BatchEnv is None, "numpy is not installed")
+class TestBatchEnv(unittest.TestCase):
+    """Test cases for the BatchEnv class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.env = BatchEnv(4, seed=0)
+    
+    def test_initialization(self):
+        """Test that every game starts empty with a piece at the spawn."""
+        self.assertEqual(self.env.rows.shape, (4, GRID_HEIGHT))
+        self.assertFalse(self.env.rows.any())
+        self.assertTrue((self.env.x == 5).all())
+        self.assertTrue((self.env.y == 0).all())
+    
+    def test_hard_drop_and_line_clear(self):
+        """Test locking pieces and clearing lines in some games only."""
+        bottom = GRID_HEIGHT - 1
+        self.env.rows[:, bottom] = (1 << GRID_WIDTH) - 1 - 1  # Gap in column 0
+        self.env.piece_type[:] = 6  # I
+        self.env.x[:] = 0
+        hard_drop = ACTION_CODES[ACTIONS["HARD_DROP"]]
+        result = self.env.step([hard_drop, 0, hard_drop, 0])
+        self.assertEqual(result.locked.tolist(), [True, False, True, False])
+        self.assertEqual(result.lines.tolist(), [1, 0, 1, 0])
+        self.assertEqual(result.score.tolist(), [100, 0, 100, 0])
+        self.assertEqual(self.env.rows[0, bottom], 1)
+        self.assertEqual(self.env.lines_cleared.tolist(), [1, 0, 1, 0])
+    
+    def test_top_out_resets_game(self):
+        """Test that a game that tops out is restarted automatically."""
+        self.env.rows[1, 1:] = (1 << GRID_WIDTH) - 2
+        self.env.score[1] = 500
+        hard_drop = ACTION_CODES[ACTIONS["HARD_DROP"]]
+        result = self.env.step([0, hard_drop, 0, 0])
+        self.assertEqual(result.done.tolist(), [False, True, False, False])
+        self.assertFalse(self.env.rows[1].any())
+        self.assertEqual(self.env.score[1], 0)
+        self.assertEqual(self.env.games_finished, 1)
+    
+    def test_sequences_independent_of_other_games(self):
+        """Test that resetting one game does not shift the pieces of another."""
+        other = BatchEnv(4, seed=0)
+        other.reset(np.array([1, 2]))
+        for env in (self.env, other):
+            env.reset(np.array([0, 3]))
+        self.assertEqual(self.env.piece_type[[0, 3]].tolist(), other.piece_type[[0, 3]].tolist())
+        self.assertEqual(self.env.next_piece_type[[0, 3]].tolist(),
+                         other.next_piece_type[[0, 3]].tolist())
+    
+    def test_piece_queue_refills(self):
+        """Test that spawns read the queued pieces, in stream order across refills."""
+        env = BatchEnv(2, seed=7)
+        sims = [Simulator(seed=7 + g) for g in range(2)]
+        hard_drop = ACTION_CODES[ACTIONS["HARD_DROP"]]
+        # Every piece after the first queue comes from a refill, never one by one
+        with mock.patch.object(PieceSequence, "next", side_effect=AssertionError):
+            for _ in range(PIECE_BUFFER_SIZE + 50):
+                env.step([hard_drop, hard_drop])
+                for g, sim in enumerate(sims):
+                    if sim.step(ACTIONS["HARD_DROP"]).game_over:
+                        sim.reset()
+                    self.assertEqual((sim.piece_type, sim.next_piece_type),
+                                     (env.piece_type[g], env.next_piece_type[g]))
+    
+    def test_matches_simulator(self):
+        """Test that every game follows the same rules as Simulator."""
+        num_games = 16
+        env = BatchEnv(num_games, seed=3)
+        # Game g draws the pieces of Simulator(3 + g), restarts included
+        sims = [Simulator(seed=3 + g) for g in range(num_games)]
+        rng = np.random.default_rng(5)
+        for step in range(600):
+            for g, sim in enumerate(sims):
+                self.assertEqual((sim.piece_type, sim.next_piece_type),
+                                 (env.piece_type[g], env.next_piece_type[g]))
+            actions = rng.integers(0, len(BATCH_ACTIONS), num_games)
+            result = env.step(actions)
+            for g, sim in enumerate(sims):
+                expected = sim.step(BATCH_ACTIONS[actions[g]])
+                self.assertEqual(
+                    (bool(result.moved[g]), bool(result.locked[g]),
+                     int(result.lines[g]), int(result.score[g]), bool(result.done[g])),
+                    tuple(expected))
+                if expected.game_over:
+                    sim.reset()
+                self.assertEqual(sim.board.rows[:GRID_HEIGHT], env.rows[g].tolist())
+                self.assertEqual((sim.x, sim.y, sim.orientation),
+                                 (env.x[g], env.y[g], env.orientation[g]))
+        self.assertGreater(env.games_finished, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Unit tests for the beam-search planner.
+"""
+
+import unittest
+
+from tetris.autoplayer import DEFAULT_WEIGHTS, best_placement, play_heuristic_game
+from tetris.beam_search import BeamSearch, play_beam_game, preview_pieces
+from tetris.core import GameCore
+from tetris.constants import GAME_STATES, GRID_WIDTH, GRID_HEIGHT
+from tetris.simulator import Simulator
+
+
+class TestBeamSearch(unittest.TestCase):
+    """Test cases for the BeamSearch planner."""
+    
+    def test_depth_one_matches_greedy(self):
+        """Test that a one-piece search plays like the greedy heuristic."""
+        with BeamSearch(DEFAULT_WEIGHTS) as planner:
+            result, _, _ = play_beam_game(planner, Simulator(), seed=1, depth=1, max_pieces=40)
+        self.assertEqual(result, play_heuristic_game(Simulator(), seed=1, max_pieces=40))
+    
+    def test_search_reports_nodes(self):
+        """Test that the search counts the placements it evaluated."""
+        sim = Simulator(seed=4)
+        with BeamSearch(beam_width=4) as planner:
+            result = planner.search_game(sim, depth=2)
+        self.assertEqual(result.depth, 2)
+        self.assertIsNotNone(result.placement)
+        # The first level alone evaluates every placement of the current piece
+        self.assertGreater(result.nodes, 9)
+        self.assertGreater(result.nodes_per_second, 0)
+        # The game itself is not touched
+        self.assertEqual(sim.pieces_placed, 0)
+    
+    def test_lookahead_keeps_well_for_bar(self):
+        """Test that the search leaves a well open when a bar comes next."""
+        sim = Simulator(seed=0)
+        for y in range(GRID_HEIGHT - 4, GRID_HEIGHT):
+            sim.board.fill_row_mask(y, (1 << GRID_WIDTH) - 1 - 1)
+        with BeamSearch() as planner:
+            # A square first, then a vertical bar for the well
+            result = planner.search(sim.board, [0, 6])
+        self.assertGreater(result.placement.x, 0)
+        self.assertEqual(result.depth, 2)
+    
+    def test_top_out_returns_none(self):
+        """Test that a full board has no placement."""
+        sim = Simulator(seed=0)
+        for y in range(GRID_HEIGHT):
+            sim.board.fill_row_mask(y, (1 << GRID_WIDTH) - 1 - (1 << (y % GRID_WIDTH)))
+        with BeamSearch() as planner:
+            result = planner.search(sim.board, [0, 1])
+        self.assertIsNone(result.placement)
+        self.assertEqual(result.depth, 0)
+    
+    def test_workers_match_inline(self):
+        """Test that expanding in worker processes finds an equally good move."""
+        sim = Simulator(seed=2)
+        for _ in range(5):
+            sim.orientation, sim.x, sim.y = best_placement(sim)[:3]
+            sim.lock()
+        pieces = preview_pieces(sim)
+        with BeamSearch(workers=0) as inline, BeamSearch(workers=2) as pooled:
+            expected = inline.search(sim.board, pieces)
+            result = pooled.search(sim.board, pieces)
+        self.assertAlmostEqual(result.score, expected.score)
+        self.assertEqual(result.nodes, expected.nodes)
+    
+    def test_preview_pieces(self):
+        """Test the visible piece sequence of both game engines."""
+        sim = Simulator(seed=5)
+        self.assertEqual(preview_pieces(sim), [sim.piece_type, sim.next_piece_type])
+        with self.assertRaises(ValueError):
+            preview_pieces(sim, 2)
+        with self.assertRaises(ValueError):
+            BeamSearch().search_game(sim, depth=3)
+        game = GameCore(seed=5)
+        self.assertEqual(preview_pieces(game, 1),
+                         [game.current_piece.piece_type, game.next_piece_type])
+    
+    def test_preview_pieces_game_over(self):
+        """Test that a finished game previews no pieces and has no placement."""
+        game = GameCore(seed=5)
+        while game.state == GAME_STATES["PLAYING"]:
+            game.hard_drop()
+        self.assertIsNone(game.current_piece)
+        self.assertEqual(preview_pieces(game), [])
+        sim = Simulator(seed=5)
+        while sim.state == GAME_STATES["PLAYING"]:
+            sim.hard_drop()
+        self.assertEqual(preview_pieces(sim), [])
+        with BeamSearch() as planner:
+            result = planner.search_game(game)
+        self.assertIsNone(result.placement)
+        self.assertEqual(result.depth, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,7 @@ import pygame
 # Initialize pygame for testing
 pygame.init()
 
-from tetris.block import Block
+from tetris.block import Block, COLOR_PALETTE
 from tetris.constants import BLOCK_OFFSET_X, BLOCK_OFFSET_Y, BLOCK_SIZE, BLOCK_RENDER_SIZE
 
 
@@ -27,7 +27,8 @@ class TestBlock(unittest.TestCase):
         """Test block initialization."""
         self.assertEqual(self.block.x, 5)
         self.assertEqual(self.block.y, 3)
-        self.assertEqual(self.block.game, self.mock_game)
+        self.assertFalse(hasattr(self.block, "game"))
+        self.assertFalse(hasattr(self.block, "__dict__"))
         self.assertIsInstance(self.block.color, tuple)
         self.assertEqual(len(self.block.color), 3)
         self.mock_game.add_block.assert_called_once_with(self.block)
@@ -35,6 +36,7 @@ class TestBlock(unittest.TestCase):
     def test_color_generation(self):
         """Test random color generation."""
         color = self.block._generate_random_color()
+        self.assertIn(color, COLOR_PALETTE)
         self.assertIsInstance(color, tuple)
         self.assertEqual(len(color), 3)
         for component in color:
@@ -44,26 +46,26 @@ class TestBlock(unittest.TestCase):
     def test_can_move_to_valid_position(self):
         """Test movement to valid position."""
         self.mock_game.is_position_occupied.return_value = False
-        self.assertTrue(self.block.can_move_to(6, 4))
+        self.assertTrue(self.block.can_move_to(self.mock_game, 6, 4))
     
     def test_can_move_to_occupied_position(self):
         """Test movement to occupied position."""
         self.mock_game.is_position_occupied.return_value = True
-        self.assertFalse(self.block.can_move_to(6, 4))
+        self.assertFalse(self.block.can_move_to(self.mock_game, 6, 4))
     
     def test_can_move_to_boundary_positions(self):
         """Test movement to boundary positions."""
         # Left boundary
-        self.assertFalse(self.block.can_move_to(-1, 4))
+        self.assertFalse(self.block.can_move_to(self.mock_game, -1, 4))
         # Right boundary
-        self.assertFalse(self.block.can_move_to(11, 4))
+        self.assertFalse(self.block.can_move_to(self.mock_game, 11, 4))
         # Bottom boundary
-        self.assertFalse(self.block.can_move_to(5, 15))
+        self.assertFalse(self.block.can_move_to(self.mock_game, 5, 15))
     
     def test_move_to_valid_position(self):
         """Test successful movement."""
         self.mock_game.is_position_occupied.return_value = False
-        result = self.block.move_to(6, 4)
+        result = self.block.move_to(self.mock_game, 6, 4)
         self.assertTrue(result)
         self.assertEqual(self.block.x, 6)
         self.assertEqual(self.block.y, 4)
@@ -72,7 +74,7 @@ class TestBlock(unittest.TestCase):
         """Test failed movement."""
         self.mock_game.is_position_occupied.return_value = True
         original_x, original_y = self.block.x, self.block.y
-        result = self.block.move_to(6, 4)
+        result = self.block.move_to(self.mock_game, 6, 4)
         self.assertFalse(result)
         self.assertEqual(self.block.x, original_x)
         self.assertEqual(self.block.y, original_y)
@@ -92,7 +94,7 @@ class TestBlock(unittest.TestCase):
     def test_destroy(self):
         """Test block destruction."""
         self.mock_game.remove_block = Mock()
-        self.block.destroy()
+        self.block.destroy(self.mock_game)
         self.mock_game.remove_block.assert_called_once_with(self.block)
     
     def test_get_color(self):
@@ -0,0 +1,193 @@
+"""
+Unit tests for the Board class.
+"""
+
+import unittest
+
+from tetris.board import Board, FULL_ROW_MASK
+from tetris.constants import GRID_WIDTH, GRID_HEIGHT, MATRIX_WIDTH, MATRIX_HEIGHT
+
+
+class TestBoard(unittest.TestCase):
+    """Test cases for the Board class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.board = Board()
+    
+    def test_board_initialization(self):
+        """Test board initialization."""
+        self.assertEqual(len(self.board.rows), MATRIX_HEIGHT)
+        self.assertTrue(all(row == 0 for row in self.board.rows))
+    
+    def test_set_get(self):
+        """Test setting and getting single cells."""
+        self.board.set(3, 7, 1)
+        self.assertEqual(self.board.get(3, 7), 1)
+        self.assertEqual(self.board.rows[7], 1 << 3)
+        
+        self.board.set(3, 7, 0)
+        self.assertEqual(self.board.get(3, 7), 0)
+        self.assertEqual(self.board.rows[7], 0)
+    
+    def test_column_major_view(self):
+        """Test the matrix[x][y] compatibility view."""
+        self.assertEqual(len(self.board), MATRIX_WIDTH)
+        self.assertEqual(len(self.board[0]), MATRIX_HEIGHT)
+        
+        self.board[4][9] = 1
+        self.assertEqual(self.board.get(4, 9), 1)
+        self.assertEqual(self.board[4][9], 1)
+        self.assertEqual(list(self.board[4]).count(1), 1)
+        
+        with self.assertRaises(IndexError):
+            self.board[MATRIX_WIDTH]
+        with self.assertRaises(IndexError):
+            self.board[0][MATRIX_HEIGHT]
+    
+    def test_row_full_and_empty(self):
+        """Test row mask checks."""
+        y = GRID_HEIGHT - 1
+        self.assertTrue(self.board.is_row_empty(y))
+        self.assertFalse(self.board.is_row_full(y))
+        
+        self.board.rows[y] = FULL_ROW_MASK >> 1
+        self.assertFalse(self.board.is_row_empty(y))
+        self.assertFalse(self.board.is_row_full(y))
+        
+        self.board.rows[y] = FULL_ROW_MASK
+        self.assertTrue(self.board.is_row_full(y))
+        
+        # Cells outside the visible grid do not count
+        self.board.rows[0] = 1 << GRID_WIDTH
+        self.assertTrue(self.board.is_row_empty(0))
+    
+    def test_remove_rows(self):
+        """Test removing rows shifts the rows above them down."""
+        bottom = GRID_HEIGHT - 1
+        self.board.rows[bottom] = FULL_ROW_MASK
+        self.board.rows[bottom - 1] = 0b101
+        self.board.rows[bottom - 2] = FULL_ROW_MASK
+        self.board.rows[bottom - 3] = 0b11
+        
+        self.board.remove_rows([bottom, bottom - 2])
+        
+        self.assertEqual(self.board.rows[bottom], 0b101)
+        self.assertEqual(self.board.rows[bottom - 1], 0b11)
+        self.assertEqual(self.board.rows[bottom - 2], 0)
+        self.assertEqual(self.board.rows[0], 0)
+        self.assertEqual(len(self.board.rows), MATRIX_HEIGHT)
+    
+    def test_collides(self):
+        """Test collision checks for groups of cells."""
+        self.assertFalse(self.board.collides([(0, 0), (5, 5)]))
+        self.assertFalse(self.board.collides([(5, -2)]))
+        
+        # Walls and floor
+        self.assertTrue(self.board.collides([(-1, 5)]))
+        self.assertTrue(self.board.collides([(GRID_WIDTH, 5)]))
+        self.assertTrue(self.board.collides([(5, GRID_HEIGHT)]))
+        
+        # Occupied cell
+        self.board.set(5, 5, 1)
+        self.assertTrue(self.board.collides([(4, 5), (5, 5)]))
+    
+    def test_column_heights(self):
+        """Test that column heights follow cell changes and row removal."""
+        self.assertEqual(self.board.heights, [0] * GRID_WIDTH)
+        
+        self.board.set(2, GRID_HEIGHT - 1, 1)
+        self.board.set(2, GRID_HEIGHT - 4, 1)
+        self.assertEqual(self.board.heights[2], 4)
+        
+        # Freeing the top cell drops to the next occupied cell
+        self.board.set(2, GRID_HEIGHT - 4, 0)
+        self.assertEqual(self.board.heights[2], 1)
+        
+        rows = [0] * MATRIX_HEIGHT
+        rows[GRID_HEIGHT - 2] = FULL_ROW_MASK
+        self.board.rows = rows
+        self.assertEqual(self.board.heights, [2] * GRID_WIDTH)
+        self.board.remove_rows([GRID_HEIGHT - 2])
+        self.assertEqual(self.board.heights, [0] * GRID_WIDTH)
+    
+    def test_surface_profile(self):
+        """Test heights, holes and wells of a small stack."""
+        bottom = GRID_HEIGHT - 1
+        # Column 0: two high with a hole, column 2: three high, column 1: a well
+        for x, y in [(0, bottom - 1), (2, bottom), (2, bottom - 1), (2, bottom - 2)]:
+            self.board.set(x, y, 1)
+        # Setting an occupied cell again changes nothing
+        self.board.set(2, bottom, 1)
+        
+        profile = self.board.profile
+        self.assertEqual(profile.heights[:4], (2, 0, 3, 0))
+        self.assertEqual(profile.holes[:4], (1, 0, 0, 0))
+        self.assertEqual(profile.wells[:4], (0, 2, 0, 0))
+        self.assertEqual(profile.wells[3], 0)
+        self.assertEqual(profile.aggregate_height, 5)
+        self.assertEqual(profile.max_height, 3)
+        self.assertEqual(profile.total_holes, 1)
+        self.assertEqual(profile.bumpiness, 2 + 3 + 3)
+        
+        # The profile is cached until the board changes
+        self.assertIs(self.board.profile, profile)
+        self.board.set(1, bottom, 1)
+        self.assertEqual(self.board.profile.wells[1], 1)
+    
+    def test_surface_profile_after_row_removal(self):
+        """Test the profile stays in step when rows are removed."""
+        bottom = GRID_HEIGHT - 1
+        self.board.rows = [0] * (bottom) + [FULL_ROW_MASK] + [0] * (MATRIX_HEIGHT - GRID_HEIGHT)
+        self.board.set(4, bottom - 2, 1)
+        self.assertEqual(self.board.profile.holes[4], 1)
+        
+        self.board.remove_rows([bottom])
+        
+        profile = self.board.profile
+        self.assertEqual(profile.heights[4], 2)
+        self.assertEqual(profile.holes[4], 1)
+        self.assertEqual(profile.total_holes, 1)
+        self.assertEqual(self.board.column_counts[4], 1)
+        self.assertEqual(profile.aggregate_height, 2)
+    
+    def test_drop_distance_from_heights(self):
+        """Test the landing distance of cells above the surface."""
+        square = [(5, -1), (6, -1), (5, 0), (6, 0)]
+        self.assertEqual(self.board.drop_distance(square), GRID_HEIGHT - 1)
+        
+        self.board.set(6, GRID_HEIGHT - 3, 1)
+        self.assertEqual(self.board.drop_distance(square), GRID_HEIGHT - 4)
+    
+    def test_drop_distance_under_overhang(self):
+        """Test the landing distance of cells tucked under an overhang."""
+        self.board.set(3, 5, 1)
+        self.board.set(3, GRID_HEIGHT - 1, 1)
+        tucked = [(3, 7), (4, 7)]
+        self.assertEqual(self.board.drop_distance(tucked), GRID_HEIGHT - 2 - 7)
+    
+    def test_clear(self):
+        """Test clearing the board."""
+        self.board.set(1, 1, 1)
+        self.board.set(2, 2, 1)
+        self.board.clear()
+        self.assertTrue(all(row == 0 for row in self.board.rows))
+        self.assertEqual(self.board.profile.aggregate_height, 0)
+        self.assertEqual(self.board.column_counts, [0] * GRID_WIDTH)
+    
+    def test_fill_row_mask(self):
+        """Test occupying several cells of a row at once."""
+        expected = Board()
+        for x in (1, 2, 4):
+            expected.set(x, 6, 1)
+        expected.set(2, 9, 1)
+        self.board.set(2, 9, 1)
+        self.board.fill_row_mask(6, 0b10110)
+        self.board.fill_row_mask(9, 0b100)  # Already occupied
+        self.assertEqual(self.board.rows, expected.rows)
+        self.assertEqual(self.board.heights, expected.heights)
+        self.assertEqual(self.board.column_counts, expected.column_counts)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+"""
+Unit tests for the GameCore class.
+
+These tests run the game without pygame to check that the core is
+usable headless.
+"""
+
+import unittest
+
+from tetris.block import Block
+from tetris.core import GameCore
+from tetris.constants import ACTIONS, GAME_STATES, GRID_HEIGHT, GRID_WIDTH
+from tetris.piece import Piece
+
+
+class TestGameCore(unittest.TestCase):
+    """Test cases for the GameCore class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.core = GameCore()
+    
+    def test_core_initialization(self):
+        """Test core initialization."""
+        self.assertEqual(self.core.state, GAME_STATES["PLAYING"])
+        self.assertEqual(self.core.score, 0)
+        self.assertIsNotNone(self.core.current_piece)
+        self.assertFalse(hasattr(self.core, "surface"))
+    
+    def test_apply_move_actions(self):
+        """Test moving and rotating the piece through actions."""
+        piece = self.core.current_piece
+        x = piece.center_x
+        self.assertTrue(self.core.apply_action(ACTIONS["LEFT"]))
+        self.assertEqual(piece.center_x, x - 1)
+        self.assertTrue(self.core.apply_action(ACTIONS["RIGHT"]))
+        self.assertEqual(piece.center_x, x)
+        self.assertTrue(self.core.apply_action(ACTIONS["DOWN"]))
+        self.assertEqual(piece.center_y, 1)
+        self.core.apply_action(ACTIONS["ROTATE_CW"])
+        self.core.apply_action(ACTIONS["ROTATE_CCW"])
+        self.assertEqual(piece.orientation, 0)
+    
+    def test_apply_hard_drop_locks_piece(self):
+        """Test that a hard drop locks the piece and spawns the next one."""
+        piece = self.core.current_piece
+        self.assertTrue(self.core.apply_action(ACTIONS["HARD_DROP"]))
+        self.assertIsNot(self.core.current_piece, piece)
+        self.assertGreater(self.core.get_surface_profile().max_height, 0)
+    
+    def test_apply_sonic_drop_keeps_piece(self):
+        """Test that a sonic drop lands the piece without locking it."""
+        piece = self.core.current_piece
+        self.assertTrue(self.core.apply_action(ACTIONS["SONIC_DROP"]))
+        self.assertIs(self.core.current_piece, piece)
+        self.assertFalse(self.core.apply_action(ACTIONS["SONIC_DROP"]))
+    
+    def test_apply_action_ignored_when_game_over(self):
+        """Test that actions are ignored once the game is over."""
+        self.core.state = GAME_STATES["GAME_OVER"]
+        self.assertFalse(self.core.apply_action(ACTIONS["LEFT"]))
+    
+    def test_apply_unknown_action(self):
+        """Test that unknown actions are ignored."""
+        self.assertFalse(self.core.apply_action("teleport"))
+    
+    def test_step_applies_action_and_gravity(self):
+        """Test that a step moves the piece and then lets it fall one row."""
+        piece = self.core.current_piece
+        x, y = piece.center_x, piece.center_y
+        result = self.core.step(ACTIONS["LEFT"])
+        self.assertTrue(result.moved)
+        self.assertFalse(result.locked)
+        self.assertEqual((piece.center_x, piece.center_y), (x - 1, y + 1))
+        self.core.step(gravity=False)
+        self.assertEqual(piece.center_y, y + 1)
+    
+    def test_step_reports_lock(self):
+        """Test that a hard drop step reports the lock without extra gravity."""
+        piece = self.core.current_piece
+        result = self.core.step(ACTIONS["HARD_DROP"])
+        self.assertTrue(result.locked)
+        self.assertEqual((result.lines, result.score, result.game_over), (0, 0, False))
+        self.assertEqual(self.core.current_piece.center_y, 0)
+        self.assertIsNot(self.core.current_piece, piece)
+    
+    def test_headless_game_until_game_over(self):
+        """Test playing a whole game with hard drops only."""
+        for _ in range(GRID_HEIGHT * 4):
+            if self.core.get_state() != GAME_STATES["PLAYING"]:
+                break
+            self.core.apply_action(ACTIONS["HARD_DROP"])
+            self.core.update()
+        self.assertEqual(self.core.get_state(), GAME_STATES["GAME_OVER"])
+    
+    def test_lock_above_grid_with_line_clear(self):
+        """Test that blocks locked above the grid do not fall into view on a line clear."""
+        core = GameCore(seed=0, debug=True)
+        for block in core.current_piece.blocks:
+            core.remove_block(block)
+        core.current_piece = None
+        # Column 4 open below row 1, column 5 open in row 1
+        for y in range(1, GRID_HEIGHT):
+            for x in range(GRID_WIDTH):
+                if x != (5 if y == 1 else 4):
+                    Block(core, x, y)
+        core.update_matrix()
+        core.current_piece = Piece(core, 6, core.rng.colors)
+        
+        # The vertical I lands in column 5 with three blocks above the grid
+        core.apply_action(ACTIONS["HARD_DROP"])
+        self.assertEqual(core.lines_cleared, 1)
+        self.assertTrue(core.check_matrix_consistency())
+        self.assertEqual(core.matrix.rows[0], 0)
+        self.assertEqual(core.get_row_blocks(0), [])
+        core.update()
+    
+    def test_snapshot_restore(self):
+        """Test that restoring a snapshot undoes later moves, blocks included."""
+        core = GameCore(seed=4)
+        for action in ("LEFT", "HARD_DROP", "ROTATE_CW", "RIGHT", "RIGHT", "HARD_DROP", "LEFT"):
+            core.step(ACTIONS[action])
+        snapshot = core.snapshot()
+        self.assertEqual(snapshot.pieces_placed, 2)
+        blocks = sorted((block.x, block.y, block.color) for block in core.blocks)
+        future = [core.step(ACTIONS["HARD_DROP"]) for _ in range(3)]
+        self.assertEqual(core.pieces_placed, 5)
+        
+        core.restore(snapshot)
+        self.assertEqual(core.pieces_placed, 2)
+        self.assertEqual(sorted((block.x, block.y, block.color) for block in core.blocks), blocks)
+        self.assertTrue(core.check_matrix_consistency())
+        self.assertEqual(core.snapshot(), snapshot)
+        self.assertEqual([core.step(ACTIONS["HARD_DROP"]) for _ in range(3)], future)
+    
+    def test_restore_reuses_blocks(self):
+        """Test that restoring moves the existing blocks instead of creating new ones."""
+        core = GameCore(seed=4)
+        core.hard_drop()
+        snapshot = core.snapshot()
+        blocks = set(core.blocks)
+        
+        core.hard_drop()
+        core.restore(snapshot)
+        self.assertEqual(set(core.blocks), blocks)
+        
+        for shift in ("LEFT", "RIGHT", "LEFT"):
+            for _ in range(4):
+                core.step(ACTIONS[shift], gravity=False)
+            core.step(ACTIONS["HARD_DROP"])
+        self.assertEqual(core.state, GAME_STATES["PLAYING"])
+        blocks = set(core.blocks)
+        core.restore(snapshot)
+        self.assertLessEqual(set(core.blocks), blocks)
+        self.assertTrue(core.check_matrix_consistency())
+        self.assertEqual(core.snapshot(), snapshot)
+    
+    def test_restore_truncates_recording(self):
+        """Test that inputs undone by a restore are dropped from the replay."""
+        core = GameCore(seed=4)
+        recorder = core.start_recording()
+        core.step(ACTIONS["LEFT"])
+        snapshot = core.snapshot()
+        events = list(recorder.events)
+        for _ in range(3):
+            core.step(ACTIONS["HARD_DROP"])
+        core.restore(snapshot)
+        self.assertEqual(recorder.events, events)
+        
+        core.step(ACTIONS["RIGHT"])
+        core.step(ACTIONS["HARD_DROP"])
+        expected = GameCore(seed=4)
+        expected.start_recording()
+        for action in ("LEFT", "RIGHT", "HARD_DROP"):
+            expected.step(ACTIONS[action])
+        self.assertEqual(core.get_replay(), expected.get_replay())
+
+
+if __name__ == '__main__':
+    unittest.main()
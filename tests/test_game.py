@@ -10,6 +10,7 @@ import pygame
 pygame.init()
 test_surface = pygame.Surface((500, 600))
 
+from tetris.block import Block
 from tetris.game import TetrisGame
 from tetris.constants import MATRIX_WIDTH, MATRIX_HEIGHT, GRID_WIDTH, GRID_HEIGHT, GAME_STATES
 
@@ -29,7 +30,7 @@ class TestTetrisGame(unittest.TestCase):
         self.assertEqual(self.game.score, 0)
         self.assertEqual(self.game.lines_cleared, 0)
         self.assertIsNotNone(self.game.current_piece)
-        self.assertIsInstance(self.game.blocks, list)
+        self.assertEqual(len(self.game.blocks), len(self.game.current_piece.blocks))
         self.assertEqual(len(self.game.matrix), MATRIX_WIDTH)
         self.assertEqual(len(self.game.matrix[0]), MATRIX_HEIGHT)
     
@@ -76,6 +77,29 @@ class TestTetrisGame(unittest.TestCase):
         self.assertTrue(self.game.is_position_occupied(MATRIX_WIDTH, 5))
         self.assertTrue(self.game.is_position_occupied(5, MATRIX_HEIGHT))
     
+    def test_is_position_occupied_excluding_piece(self):
+        """Test collision checks against settled blocks."""
+        piece = self.game.current_piece
+        self.assertFalse(self.game.is_position_occupied_excluding_piece(4, 10, piece))
+        
+        # A settled block is an obstacle once it is indexed
+        block = Block(self.game, 4, 10)
+        self.game.update_matrix()
+        self.assertTrue(self.game.is_position_occupied_excluding_piece(4, 10, piece))
+        
+        # Blocks of the piece itself are never obstacles
+        self.assertFalse(self.game.is_position_occupied_excluding_piece(
+            piece.blocks[0].x, piece.blocks[0].y, piece))
+        
+        # Removing the block frees the cell
+        self.game.remove_block(block)
+        self.assertFalse(self.game.is_position_occupied_excluding_piece(4, 10, piece))
+        
+        # Walls and floor are obstacles, the area above the grid is not
+        self.assertTrue(self.game.is_position_occupied_excluding_piece(-1, 5, piece))
+        self.assertTrue(self.game.is_position_occupied_excluding_piece(5, MATRIX_HEIGHT, piece))
+        self.assertFalse(self.game.is_position_occupied_excluding_piece(5, -1, piece))
+    
     def test_set_get_matrix_position(self):
         """Test matrix position setting and getting."""
         # Test valid position
@@ -133,7 +157,7 @@ class TestTetrisGame(unittest.TestCase):
         self.game.set_matrix_position(5, 0, 1)
         self.assertTrue(self.game.is_game_over())
     
-    @patch('tetris.game.Piece')
+    @patch('tetris.core.Piece')
     def test_spawn_new_piece(self, mock_piece_class):
         """Test spawning new pieces."""
         # Clear current piece
@@ -178,6 +202,12 @@ class TestTetrisGame(unittest.TestCase):
         mock_piece.reset_mock()
         self.game.handle_input(pygame.K_RIGHT)
         mock_piece.move.assert_called_with("RIGHT")
+        
+        # Test rotations
+        self.game.handle_input(pygame.K_UP)
+        mock_piece.rotate.assert_called_with("CW")
+        self.game.handle_input(pygame.K_z)
+        mock_piece.rotate.assert_called_with("CCW")
     
     def test_get_state(self):
         """Test getting game state."""
@@ -203,6 +233,138 @@ class TestTetrisGame(unittest.TestCase):
         # Should not crash
         self.game.draw()
     
+    def test_update_skips_clean_matrix(self):
+        """Test that update does not rebuild an unchanged matrix."""
+        with patch.object(self.game, 'update_matrix') as mock_update_matrix:
+            self.game.update()
+            mock_update_matrix.assert_not_called()
+            
+            self.game.mark_matrix_dirty()
+            self.game.update()
+            mock_update_matrix.assert_called_once()
+    
+    def test_lock_updates_matrix_incrementally(self):
+        """Test that a landed piece is written to the matrix without a rebuild."""
+        piece = self.game.current_piece
+        while self.game.current_piece is piece:
+            self.game.move_current_piece_down()
+        
+        for x, y in piece.get_block_positions():
+            self.assertEqual(self.game.get_matrix_value(x, y), 1)
+        self.assertTrue(self.game.check_matrix_consistency())
+    
+    def test_clear_line_shifts_matrix(self):
+        """Test that clearing a line keeps the matrix in sync."""
+        for block in self.game.current_piece.blocks:
+            self.game.remove_block(block)
+        self.game.current_piece.blocks = []
+        for x in range(GRID_WIDTH):
+            Block(self.game, x, GRID_HEIGHT - 1)
+        Block(self.game, 2, GRID_HEIGHT - 2)
+        self.game.update_matrix()
+        
+        self.game.clear_line(GRID_HEIGHT - 1)
+        
+        self.assertEqual(self.game.matrix.rows[GRID_HEIGHT - 1], 1 << 2)
+        self.assertEqual(self.game.matrix.rows[GRID_HEIGHT - 2], 0)
+        self.assertTrue(self.game.check_matrix_consistency())
+    
+    def _build_stack(self, full_rows, extra_cells):
+        """Replace the board with full rows plus a few extra blocks."""
+        for block in self.game.current_piece.blocks:
+            self.game.remove_block(block)
+        self.game.current_piece.blocks = []
+        for y in full_rows:
+            for x in range(GRID_WIDTH):
+                Block(self.game, x, y)
+        extra = [Block(self.game, x, y) for x, y in extra_cells]
+        self.game.update_matrix()
+        return extra
+    
+    def test_clear_adjacent_full_lines(self):
+        """Test clearing two adjacent full lines at once."""
+        bottom = GRID_HEIGHT - 1
+        above, higher = self._build_stack(
+            [bottom, bottom - 1], [(3, bottom - 2), (7, bottom - 4)])
+        
+        self.assertEqual(self.game.clear_full_lines(), 2)
+        
+        self.assertEqual((above.x, above.y), (3, bottom))
+        self.assertEqual((higher.x, higher.y), (7, bottom - 2))
+        self.assertEqual(len(self.game.blocks), 2)
+        self.assertEqual(self.game.matrix.rows[bottom], 1 << 3)
+        self.assertEqual(self.game.matrix.rows[bottom - 2], 1 << 7)
+        self.assertEqual(self.game.lines_cleared, 2)
+        self.assertEqual(self.game.score, 100 + 200)
+        self.assertTrue(self.game.check_matrix_consistency())
+    
+    def test_clear_split_full_lines(self):
+        """Test clearing full lines separated by a partial line."""
+        bottom = GRID_HEIGHT - 1
+        between, top, below_top = self._build_stack(
+            [bottom, bottom - 2, bottom - 3], [(0, bottom - 1), (5, bottom - 5), (9, bottom - 4)])
+        
+        self.assertEqual(self.game.clear_full_lines(), 3)
+        
+        # The partial row drops by one, the rows above all three by three
+        self.assertEqual((between.x, between.y), (0, bottom))
+        self.assertEqual((below_top.x, below_top.y), (9, bottom - 1))
+        self.assertEqual((top.x, top.y), (5, bottom - 2))
+        self.assertEqual(self.game.get_row_blocks(bottom), [between])
+        self.assertEqual(self.game.matrix.full_rows(), [])
+        self.assertEqual(self.game.lines_cleared, 3)
+        self.assertTrue(self.game.check_matrix_consistency())
+    
+    def test_sonic_drop(self):
+        """Test dropping a piece to its landing row without locking it."""
+        piece = self.game.current_piece
+        lowest = max(y for _, y in piece.get_block_positions())
+        
+        distance = self.game.sonic_drop()
+        
+        self.assertEqual(distance, GRID_HEIGHT - 1 - lowest)
+        self.assertIs(self.game.current_piece, piece)
+        self.assertFalse(piece.can_move("DOWN"))
+        self.assertEqual(self.game.matrix.rows[GRID_HEIGHT - 1], 0)
+    
+    def test_hard_drop(self):
+        """Test dropping a piece and locking it at once."""
+        piece = self.game.current_piece
+        
+        self.game.hard_drop()
+        
+        self.assertIsNot(self.game.current_piece, piece)
+        for x, y in piece.get_block_positions():
+            self.assertEqual(self.game.get_matrix_value(x, y), 1)
+        self.assertTrue(self.game.check_matrix_consistency())
+        
+        # Every piece spawns over column 5, so the next one stacks on top
+        height = self.game.matrix.heights[5]
+        self.game.hard_drop()
+        self.assertGreater(self.game.matrix.heights[5], height)
+    
+    def test_surface_profile(self):
+        """Test the surface profile follows locked pieces."""
+        profile = self.game.get_surface_profile()
+        self.assertEqual(profile.aggregate_height, 0)
+        
+        self.game.hard_drop()
+        
+        profile = self.game.get_surface_profile()
+        self.assertGreater(profile.max_height, 0)
+        self.assertEqual(sum(self.game.matrix.column_counts), 4)
+        self.assertEqual(profile.total_holes, sum(profile.holes))
+    
+    def test_debug_update_detects_inconsistent_matrix(self):
+        """Test the debug-mode consistency check."""
+        game = TetrisGame(self.surface, 20, 60, 360, 490, debug=True)
+        game.update()
+        
+        game.set_matrix_position(3, 10, 1)
+        self.assertFalse(game.check_matrix_consistency())
+        with self.assertRaises(RuntimeError):
+            game.update()
+    
     def test_update_method_exists(self):
         """Test that update method exists and can be called."""
         # Should not crash
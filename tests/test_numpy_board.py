@@ -0,0 +1,154 @@
+"""
+Unit tests for the NumpyBoard class.
+"""
+
+import unittest
+from unittest import mock
+
+import pygame
+
+from tetris.block import Block
+from tetris.board import Board, FULL_ROW_MASK, create_board
+from tetris.constants import GRID_WIDTH, GRID_HEIGHT
+
+try:
+    from tetris.numpy_board import NumpyBoard
+except ImportError:  # pragma: no cover - numpy is optional
+    NumpyBoard = None
+
+# Initialize pygame for testing
+pygame.init()
+test_surface = pygame.Surface((500, 600))
+
+from tetris.game import TetrisGame
+
+
+@unittest.skipIf(NumpyBoard is None, "numpy is not installed")
+class TestNumpyBoard(unittest.TestCase):
+    """Test cases for the NumpyBoard class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.board = NumpyBoard()
+        self.reference = Board()
+    
+    def _fill(self, rows):
+        """Load the same row masks into both boards."""
+        self.board.rows = list(rows)
+        self.reference.rows = list(rows)
+    
+    def test_create_board(self):
+        """Test backend selection."""
+        self.assertIsInstance(create_board("numpy"), NumpyBoard)
+        self.assertIsInstance(create_board("bitboard"), Board)
+        with self.assertRaises(ValueError):
+            create_board("unknown")
+    
+    def test_rows_round_trip(self):
+        """Test converting the array to and from row masks."""
+        rows = list(self.reference.rows)
+        rows[3] = 0b10101
+        rows[GRID_HEIGHT - 1] = FULL_ROW_MASK
+        self._fill(rows)
+        self.assertEqual(self.board.rows, rows)
+        self.assertEqual(self.board.get(2, 3), 1)
+        self.assertEqual(self.board[1][3], 0)
+    
+    def test_matches_bitboard(self):
+        """Test that row checks and compaction match the bitboard."""
+        rows = list(self.reference.rows)
+        rows[GRID_HEIGHT - 1] = FULL_ROW_MASK
+        rows[GRID_HEIGHT - 2] = 0b111
+        rows[GRID_HEIGHT - 3] = FULL_ROW_MASK
+        rows[GRID_HEIGHT - 4] = FULL_ROW_MASK
+        rows[GRID_HEIGHT - 5] = 0b1
+        self._fill(rows)
+        
+        self.assertEqual(self.board.full_rows(), self.reference.full_rows())
+        for y in range(GRID_HEIGHT):
+            self.assertEqual(self.board.is_row_full(y), self.reference.is_row_full(y))
+            self.assertEqual(self.board.is_row_empty(y), self.reference.is_row_empty(y))
+        
+        self.board.remove_rows(self.board.full_rows())
+        self.reference.remove_rows(self.reference.full_rows())
+        self.assertEqual(self.board.rows, self.reference.rows)
+        self.assertEqual(self.board.full_rows(), [])
+    
+    def test_heights_match_bitboard(self):
+        """Test that column heights match the bitboard after every change."""
+        for x, y in [(0, GRID_HEIGHT - 1), (0, 6), (4, 9), (10, GRID_HEIGHT - 2)]:
+            self.board.set(x, y, 1)
+            self.reference.set(x, y, 1)
+            self.assertEqual(self.board.heights, self.reference.heights)
+        self.board.set(0, 6, 0)
+        self.reference.set(0, 6, 0)
+        self.assertEqual(self.board.heights, self.reference.heights)
+        self.board.remove_rows([GRID_HEIGHT - 1])
+        self.reference.remove_rows([GRID_HEIGHT - 1])
+        self.assertEqual(self.board.heights, self.reference.heights)
+        self.assertEqual(self.board.profile, self.reference.profile)
+    
+    def test_cell_updates_skip_row_conversion(self):
+        """Test that filling cells keeps the aggregates without converting the array."""
+        with mock.patch.object(NumpyBoard, "rows", new_callable=mock.PropertyMock) as rows:
+            self.board.fill_row_mask(GRID_HEIGHT - 1, 0b1011)
+            self.board.fill_row_mask(GRID_HEIGHT - 3, 0b1)
+            self.board.set(0, GRID_HEIGHT - 3, 0)
+            cells = list(self.board.occupied_cells())
+        rows.assert_not_called()
+        self.reference.fill_row_mask(GRID_HEIGHT - 1, 0b1011)
+        self.reference.fill_row_mask(GRID_HEIGHT - 3, 0b1)
+        self.reference.set(0, GRID_HEIGHT - 3, 0)
+        self.assertEqual(cells, list(self.reference.occupied_cells()))
+        self.assertEqual(self.board.heights, self.reference.heights)
+        self.assertEqual(self.board.column_counts, self.reference.column_counts)
+        self.assertEqual(self.board.zobrist, self.reference.zobrist)
+    
+    def test_load_keeps_saved_aggregates(self):
+        """Test that loading takes the saved aggregates as given, like Board."""
+        self.reference.fill_row_mask(GRID_HEIGHT - 1, 0b110)
+        self.reference.fill_row_mask(GRID_HEIGHT - 2, 0b10)
+        saved = (self.reference.rows, self.reference.heights, self.reference.column_counts)
+        with mock.patch.object(NumpyBoard, "_update_profile") as update_profile:
+            self.board.load(*saved, zobrist=12345)
+        update_profile.assert_not_called()
+        self.assertEqual(self.board.rows, self.reference.rows)
+        self.assertEqual(self.board.heights, self.reference.heights)
+        self.assertEqual(self.board.column_counts, self.reference.column_counts)
+        self.assertEqual(self.board.zobrist, 12345)
+        self.board.load(*saved)
+        self.assertEqual(self.board.zobrist, self.reference.zobrist)
+        self.assertEqual(self.board.profile, self.reference.profile)
+    
+    def test_collides(self):
+        """Test collision checks for groups of cells."""
+        self.board.set(5, 5, 1)
+        self.assertTrue(self.board.collides([(5, 5)]))
+        self.assertTrue(self.board.collides([(GRID_WIDTH, 0)]))
+        self.assertFalse(self.board.collides([(4, 5), (5, -1)]))
+    
+    def test_game_scoring_matches_bitboard(self):
+        """Test that both backends clear lines with the same scoring."""
+        results = []
+        for backend in ("bitboard", "numpy"):
+            game = TetrisGame(test_surface, 20, 60, 360, 490, board_backend=backend)
+            for block in list(game.current_piece.blocks):
+                game.remove_block(block)
+            game.current_piece.blocks = []
+            for y in (GRID_HEIGHT - 1, GRID_HEIGHT - 3):
+                for x in range(GRID_WIDTH):
+                    Block(game, x, y)
+            Block(game, 0, GRID_HEIGHT - 2)
+            Block(game, 4, GRID_HEIGHT - 4)
+            game.update_matrix()
+            
+            cleared = game.clear_full_lines()
+            self.assertTrue(game.check_matrix_consistency())
+            results.append((cleared, game.score, game.lines_cleared, game.matrix.rows))
+        
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0][0], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Unit tests for the lazy attributes of the tetris package.
+"""
+
+import subprocess
+import sys
+import unittest
+
+import tetris
+from tetris import constants
+
+
+def _loads_pygame(code: str) -> bool:
+    """Run code in a fresh interpreter and report whether it loaded pygame."""
+    check = f"{code}\nimport sys\nsys.exit('pygame' in sys.modules)"
+    return subprocess.run([sys.executable, "-c", check]).returncode != 0
+
+
+class TestPackage(unittest.TestCase):
+    """Test cases for the tetris package namespace."""
+    
+    def test_import_does_not_load_pygame(self):
+        """Test that importing the package or the core leaves pygame unloaded."""
+        self.assertFalse(_loads_pygame("import tetris"))
+        self.assertFalse(_loads_pygame("import tetris.core"))
+        self.assertFalse(_loads_pygame("from tetris import GameCore, GRID_WIDTH"))
+    
+    def test_game_class_loads_pygame(self):
+        """Test that the pygame adapter is still reachable from the package."""
+        self.assertTrue(_loads_pygame("from tetris import TetrisGame"))
+    
+    def test_lazy_attributes(self):
+        """Test that public names resolve to the submodule objects."""
+        from tetris.core import GameCore
+        from tetris.game import TetrisGame
+        self.assertIs(tetris.GameCore, GameCore)
+        self.assertIs(tetris.TetrisGame, TetrisGame)
+        self.assertEqual(tetris.GRID_WIDTH, constants.GRID_WIDTH)
+        self.assertIn("GameCore", dir(tetris))
+        self.assertIn("GRID_HEIGHT", dir(tetris))
+    
+    def test_unknown_attribute(self):
+        """Test that unknown names raise AttributeError."""
+        with self.assertRaises(AttributeError):
+            tetris.NOT_A_CONSTANT
+        with self.assertRaises(AttributeError):
+            tetris._private
+
+
+if __name__ == '__main__':
+    unittest.main()
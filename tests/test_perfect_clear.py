@@ -0,0 +1,104 @@
+"""
+Unit tests for the perfect-clear solver.
+"""
+
+import unittest
+
+from tetris.board import Board
+from tetris.constants import GAME_STATES, GRID_WIDTH, GRID_HEIGHT
+from tetris.perfect_clear import (
+    COLUMN_PARITY, PerfectClearSolver, column_balance, puzzle_board, wall_segments_fit
+)
+from tetris.simulator import Simulator
+
+
+def replay_solution(board, pieces, solution):
+    """Lock the placements of a solution on a copy of a board and return it."""
+    sim = Simulator(seed=0)
+    sim.board.load(tuple(board.rows), tuple(board.heights), tuple(board.column_counts),
+                   board.zobrist)
+    for piece_type, placement in zip(pieces, solution):
+        sim.state = GAME_STATES["PLAYING"]
+        sim.piece_type = piece_type
+        sim.orientation, sim.x, sim.y = placement.orientation, placement.x, placement.y
+        sim.lock()
+    return sim.board
+
+
+class TestPruning(unittest.TestCase):
+    """Test cases for the pruning rules."""
+    
+    def test_column_parity(self):
+        """Test the balance change each piece type can make."""
+        # Square, L, L inverted, T, Z1, Z2, I
+        self.assertEqual([COLUMN_PARITY[piece] for piece in range(7)], [0, 2, 2, 2, 0, 0, 4])
+    
+    def test_column_balance(self):
+        """Test the even-minus-odd column cell count."""
+        self.assertEqual(column_balance([1] * GRID_WIDTH), 1)
+        self.assertEqual(column_balance([2, 0, 0, 3] + [0] * (GRID_WIDTH - 4)), -1)
+    
+    def test_wall_segments_fit(self):
+        """Test that walls split the empty cells into whole pieces."""
+        # Two empty cells on each side of a full column
+        self.assertFalse(wall_segments_fit([1, 2] + [2] * 8 + [1], 2))
+        # Four empty cells left of the wall
+        self.assertTrue(wall_segments_fit([0, 0, 2] + [2] * 8, 2))
+        self.assertTrue(wall_segments_fit([0] * 4 + [1] * 7, 1))
+
+
+class TestSolver(unittest.TestCase):
+    """Test cases for the PerfectClearSolver."""
+    
+    def test_puzzle_board(self):
+        """Test that a puzzle is the full rows minus the carved pieces."""
+        board, pieces = puzzle_board(3, 4, seed=1)
+        self.assertEqual(len(pieces), 4)
+        self.assertEqual(sum(board.column_counts), 3 * GRID_WIDTH - 4 * 4)
+        self.assertLessEqual(max(board.heights), 3)
+    
+    def test_solves_puzzles(self):
+        """Test that the solutions found empty the board."""
+        with PerfectClearSolver() as solver:
+            for lines, count, seed in ((2, 2, 0), (2, 4, 1), (3, 4, 2), (4, 6, 0)):
+                board, pieces = puzzle_board(lines, count, seed)
+                result = solver.solve(board, pieces)
+                self.assertTrue(result.solved, (lines, count, seed))
+                self.assertLessEqual(len(result.solution), count)
+                self.assertFalse(any(replay_solution(board, pieces, result.solution).rows))
+                # The board given is left as it was
+                self.assertEqual(sum(board.column_counts), lines * GRID_WIDTH - 4 * count)
+    
+    def test_cell_count_prunes_root(self):
+        """Test that an impossible cell count is rejected without searching."""
+        board = Board()
+        board.fill_row_mask(GRID_HEIGHT - 1, 0b1)
+        with PerfectClearSolver() as solver:
+            result = solver.solve(board, [0, 0])
+        self.assertFalse(result.solved)
+        self.assertEqual(result.nodes, 0)
+    
+    def test_failed_boards_are_memoised(self):
+        """Test that a second solve of a failing puzzle reuses the memo."""
+        board, _ = puzzle_board(2, 2, seed=0)
+        with PerfectClearSolver() as solver:
+            first = solver.solve(board, [3, 3])
+            second = solver.solve(board, [3, 3])
+        self.assertFalse(first.solved)
+        self.assertGreater(first.nodes, 0)
+        self.assertEqual(second.nodes, 0)
+    
+    def test_workers_solve_puzzle(self):
+        """Test a search split across worker processes."""
+        board, pieces = puzzle_board(4, 6, seed=1)
+        unsolvable, _ = puzzle_board(2, 2, seed=0)
+        with PerfectClearSolver(workers=2) as solver:
+            result = solver.solve(board, pieces)
+            failed = solver.solve(unsolvable, [3, 3])
+        self.assertTrue(result.solved)
+        self.assertFalse(any(replay_solution(board, pieces, result.solution).rows))
+        self.assertFalse(failed.solved)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,6 +11,7 @@ pygame.init()
 
 from tetris.piece import Piece
 from tetris.constants import PIECE_CONFIGURATIONS, DIRECTIONS
+from tetris.rotation import ROTATION_TABLES
 
 
 class TestPiece(unittest.TestCase):
@@ -126,6 +127,65 @@ class TestPiece(unittest.TestCase):
         self.assertFalse(result)
         self.assertFalse(piece.has_collided)
     
+    def test_rotate_clockwise(self):
+        """Test rotating a piece in open space."""
+        piece = Piece(self.mock_game, 3)  # T piece
+        for _ in range(5):
+            piece.move("DOWN")
+        center = (piece.center_x, piece.center_y)
+        
+        result = piece.rotate("CW")
+        
+        self.assertTrue(result)
+        self.assertEqual(piece.orientation, 1)
+        self.assertEqual((piece.center_x, piece.center_y), center)
+        expected = [(center[0] + dx, center[1] + dy) for dx, dy in ROTATION_TABLES[3][1]]
+        self.assertEqual(piece.get_block_positions(), expected)
+    
+    def test_rotate_back_and_forth(self):
+        """Test that a counter-clockwise turn undoes a clockwise one."""
+        piece = Piece(self.mock_game, 1)  # L piece
+        for _ in range(5):
+            piece.move("DOWN")
+        original = piece.get_block_positions()
+        
+        self.assertTrue(piece.rotate("CW"))
+        self.assertTrue(piece.rotate("CCW"))
+        self.assertEqual(piece.orientation, 0)
+        self.assertEqual(piece.get_block_positions(), original)
+    
+    def test_rotate_kicks_off_wall(self):
+        """Test that a blocked rotation is kicked away from the wall."""
+        piece = Piece(self.mock_game, 6)  # I piece
+        for _ in range(5):
+            piece.move("DOWN")
+        while piece.move("RIGHT"):
+            pass
+        
+        result = piece.rotate("CW")
+        
+        self.assertTrue(result)
+        self.assertLess(piece.center_x, 10)
+        for x, _ in piece.get_block_positions():
+            self.assertLess(x, 11)
+    
+    def test_rotate_blocked(self):
+        """Test that a rotation with no free kick leaves the piece unchanged."""
+        piece = Piece(self.mock_game, 3)
+        for _ in range(5):
+            piece.move("DOWN")
+        original = piece.get_block_positions()
+        self.mock_game.is_position_occupied_excluding_piece.return_value = True
+        
+        self.assertFalse(piece.rotate("CW"))
+        self.assertEqual(piece.orientation, 0)
+        self.assertEqual(piece.get_block_positions(), original)
+    
+    def test_rotate_invalid_direction(self):
+        """Test rotation with an unknown direction."""
+        piece = Piece(self.mock_game, 3)
+        self.assertFalse(piece.rotate("INVALID"))
+    
     def test_register_blocks(self):
         """Test block registration in game matrix."""
         piece = Piece(self.mock_game, 0)
@@ -0,0 +1,85 @@
+"""
+Unit tests for reachable placement enumeration.
+"""
+
+import random
+import unittest
+
+from tetris.board import Board
+from tetris.constants import ACTIONS, GRID_WIDTH, GRID_HEIGHT
+from tetris.placements import PlacementGenerator, enumerate_placements
+from tetris.simulator import Simulator
+
+
+def play_path(sim, path):
+    """Apply a placement path to a simulator and return the board rows after the lock."""
+    placed = sim.pieces_placed
+    for action in path:
+        sim.apply_action(action)
+    assert sim.pieces_placed == placed + 1
+    return sim.board.rows
+
+
+class TestPlacements(unittest.TestCase):
+    """Test cases for placement enumeration."""
+    
+    def test_empty_board_square(self):
+        """Test that a square can rest in every pair of columns on an empty board."""
+        sim = Simulator(seed=0)
+        placements = enumerate_placements(sim.board.rows, 0)
+        self.assertEqual(len(placements), GRID_WIDTH - 1)
+        self.assertTrue(all(placement.path[-1] == ACTIONS["HARD_DROP"] for placement in placements))
+        lengths = [len(placement.path) for placement in placements]
+        self.assertEqual(lengths, sorted(lengths))
+    
+    def test_paths_reach_their_placements(self):
+        """Test that following each path locks the piece at its placement."""
+        rng = random.Random(5)
+        sim = Simulator(seed=5)
+        for _ in range(8):
+            sim.place(rng.randrange(4), rng.randrange(2, GRID_WIDTH - 2))
+        snapshot = sim.snapshot()
+        placements = enumerate_placements(sim.board.rows, sim.piece_type)
+        self.assertTrue(placements)
+        seen = set()
+        for placement in placements:
+            sim.restore(snapshot)
+            expected = Simulator(seed=5)
+            expected.restore(snapshot)
+            expected.orientation, expected.x, expected.y = placement[:3]
+            expected.lock()
+            self.assertEqual(play_path(sim, placement.path), expected.board.rows)
+            seen.add(tuple(expected.board.rows))
+        self.assertEqual(len(seen), len(placements))
+    
+    def test_tuck_under_overhang(self):
+        """Test that a placement under an overhang is found, unlike a straight drop."""
+        board = Board()
+        # Overhang over columns 0-2, open to the right of column 3
+        board.fill_row_mask(GRID_HEIGHT - 3, 0b111)
+        board.fill_row_mask(GRID_HEIGHT - 2, 0b1)
+        board.fill_row_mask(GRID_HEIGHT - 1, 0b1)
+        positions = [placement[:3] for placement in enumerate_placements(board.rows, 0)]
+        # A square dropped at the floor right of the overhang and slid left
+        self.assertIn((0, 1, GRID_HEIGHT - 1), positions)
+        # A straight drop in the same columns lands on top of the overhang
+        self.assertIn((0, 1, GRID_HEIGHT - 4), positions)
+    
+    def test_blocked_spawn(self):
+        """Test that no placement exists when the piece does not fit at the spawn."""
+        rows = [(1 << GRID_WIDTH) - 1] * GRID_HEIGHT
+        self.assertEqual(enumerate_placements(rows, 3), [])
+    
+    def test_generator_caches_by_board(self):
+        """Test that the generator reuses results for the same board and piece."""
+        generator = PlacementGenerator(capacity=4)
+        sim = Simulator(seed=1)
+        first = generator.placements(sim.board, 2)
+        self.assertIs(generator.placements(sim.board, 2), first)
+        self.assertIsNot(generator.placements(sim.board, 3), first)
+        stats = generator.stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Unit tests for the BlockRegistry class.
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from tetris.registry import BlockRegistry
+
+
+def make_block(x, y):
+    """Create a stand-in block at a position."""
+    block = Mock()
+    block.x = x
+    block.y = y
+    return block
+
+
+class TestBlockRegistry(unittest.TestCase):
+    """Test cases for the BlockRegistry class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.registry = BlockRegistry()
+    
+    def test_add_remove(self):
+        """Test registering and unregistering blocks."""
+        block = make_block(1, 2)
+        self.registry.add(block)
+        self.assertIn(block, self.registry)
+        self.assertEqual(len(self.registry), 1)
+        self.assertEqual(list(self.registry.view()), [block])
+        
+        self.assertTrue(self.registry.remove(block))
+        self.assertNotIn(block, self.registry)
+        self.assertFalse(self.registry.remove(block))
+    
+    def test_unsettled_blocks_are_not_indexed(self):
+        """Test that blocks only enter the cell index when settled."""
+        block = make_block(3, 4)
+        self.registry.add(block)
+        self.assertIsNone(self.registry.occupant(3, 4))
+        self.assertEqual(self.registry.row(4), [])
+        
+        self.registry.settle(block)
+        self.assertIs(self.registry.occupant(3, 4), block)
+        self.assertEqual(self.registry.row(4), [block])
+        
+        self.registry.remove(block)
+        self.assertIsNone(self.registry.occupant(3, 4))
+        self.assertEqual(self.registry.row(4), [])
+    
+    def test_clear_row(self):
+        """Test clearing a row moves the rows above it down."""
+        bottom = [make_block(x, 10) for x in range(3)]
+        above = make_block(1, 9)
+        higher = make_block(2, 7)
+        below = make_block(0, 11)
+        for block in bottom + [above, higher, below]:
+            self.registry.add(block)
+            self.registry.settle(block)
+        
+        removed = self.registry.clear_row(10)
+        
+        self.assertEqual(set(map(id, removed)), set(map(id, bottom)))
+        self.assertEqual(len(self.registry), 3)
+        self.assertEqual((above.x, above.y), (1, 10))
+        self.assertEqual((higher.x, higher.y), (2, 8))
+        self.assertEqual((below.x, below.y), (0, 11))
+        self.assertIs(self.registry.occupant(1, 10), above)
+        self.assertIsNone(self.registry.occupant(1, 9))
+        self.assertEqual(self.registry.row(10), [above])
+        self.assertTrue(self.registry.is_consistent())
+    
+    def test_clear_rows(self):
+        """Test clearing split rows drops each row by the rows cleared below it."""
+        for x in range(2):
+            for y in (10, 8):
+                block = make_block(x, y)
+                self.registry.add(block)
+                self.registry.settle(block)
+        between = make_block(0, 9)
+        top = make_block(1, 6)
+        for block in (between, top):
+            self.registry.add(block)
+            self.registry.settle(block)
+        
+        removed = self.registry.clear_rows([8, 10])
+        
+        self.assertEqual(len(removed), 4)
+        self.assertEqual((between.x, between.y), (0, 10))
+        self.assertEqual((top.x, top.y), (1, 8))
+        self.assertEqual(self.registry.row(9), [])
+        self.assertIs(self.registry.occupant(1, 8), top)
+        self.assertTrue(self.registry.is_consistent())
+    
+    def test_reindex(self):
+        """Test rebuilding the cell and row indexes."""
+        block = make_block(5, 5)
+        self.registry.add(block)
+        self.registry.settle(block)
+        block.y = 6
+        
+        self.assertFalse(self.registry.is_consistent())
+        self.registry.reindex([block])
+        self.assertTrue(self.registry.is_consistent())
+        self.assertIs(self.registry.occupant(5, 6), block)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Unit tests for replay recording and playback.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from tetris.core import GameCore
+from tetris.constants import ACTIONS, GAME_STATES
+from tetris.replay import (
+    GRAVITY, REPLAY_MAGIC, Replay, ReplayError, decode_replay, encode_replay,
+    iter_actions, load_replay, play_replay, save_replay, verify_replay
+)
+
+
+def record_game(seed, steps=2000):
+    """Play a game with random actions and gravity and return it."""
+    rng = random.Random(seed)
+    game = GameCore(seed=seed)
+    game.start_recording()
+    actions = list(ACTIONS.values())
+    for _ in range(steps):
+        if game.state != GAME_STATES["PLAYING"]:
+            break
+        game.step(rng.choice(actions) if rng.random() < 0.7 else None)
+    return game
+
+
+class TestReplay(unittest.TestCase):
+    """Test cases for replay recording and playback."""
+    
+    def test_encode_decode_round_trip(self):
+        """Test that encoding keeps the seed, totals and events."""
+        replay = Replay(2 ** 63 + 5, ((0, 1), (0, 6), (3, 0), (300, 4)), 1200, 7)
+        data = encode_replay(replay)
+        self.assertTrue(data.startswith(REPLAY_MAGIC))
+        self.assertEqual(decode_replay(data), replay)
+    
+    def test_events_are_compact(self):
+        """Test that a recorded game takes about a byte per event."""
+        replay = record_game(3).get_replay()
+        size = len(encode_replay(replay)) - len(REPLAY_MAGIC)
+        self.assertLess(size, 2 * len(replay.events) + 16)
+    
+    def test_decode_errors(self):
+        """Test that malformed data is rejected."""
+        data = encode_replay(Replay(1, ((0, 1), (200, 2)), 0, 0))
+        with self.assertRaises(ReplayError):
+            decode_replay(b"XXXX" + data[4:])
+        with self.assertRaises(ReplayError):
+            decode_replay(data[:-1])
+        with self.assertRaises(ReplayError):
+            decode_replay(data + b"\x00")
+        with self.assertRaises(ReplayError):
+            encode_replay(Replay(1, ((5, 1), (4, 1)), 0, 0))
+        with self.assertRaises(ReplayError):
+            encode_replay(Replay(1, ((-1, 1),), 0, 0))
+        with self.assertRaises(ReplayError):
+            encode_replay(Replay(1, (), -10, 0))
+    
+    def test_negative_seeds(self):
+        """Test that negative seeds are stored and read back."""
+        for seed in (-1, -2 ** 63, 0, 1):
+            replay = Replay(seed, ((0, 1),), 0, 0)
+            self.assertEqual(decode_replay(encode_replay(replay)), replay)
+    
+    def test_decode_first_format(self):
+        """Test that replays of the first format, with an unsigned seed, still load."""
+        data = encode_replay(Replay(0, ((0, 1),), 0, 0))
+        self.assertEqual(decode_replay(b"LTR1\x07" + data[5:]), Replay(7, ((0, 1),), 0, 0))
+    
+    def test_recording_captures_actions_and_gravity(self):
+        """Test the events recorded by a game."""
+        game = GameCore(seed=1)
+        game.start_recording()
+        game.apply_action(ACTIONS["LEFT"])
+        game.update()
+        game.gravity_drop()
+        game.apply_action("teleport")
+        self.assertEqual(list(iter_actions(game.get_replay())),
+                         [(0, ACTIONS["LEFT"]), (1, GRAVITY)])
+    
+    def test_not_recording(self):
+        """Test that a game without a recorder has no replay."""
+        self.assertIsNone(GameCore(seed=1).get_replay())
+    
+    def test_replay_reproduces_game(self):
+        """Test that playing a replay gives the recorded game."""
+        for seed in range(5):
+            game = record_game(seed)
+            replay = game.get_replay()
+            self.assertTrue(verify_replay(replay))
+            replayed = GameCore(seed=seed)
+            play_replay(replay, replayed)
+            self.assertEqual(replayed.matrix.rows, game.matrix.rows)
+            self.assertEqual(replayed.state, game.state)
+    
+    def test_save_and_load(self):
+        """Test writing a replay to a file and reading it back."""
+        replay = record_game(4).get_replay()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "game.ltr")
+            save_replay(replay, path)
+            self.assertEqual(load_replay(path), replay)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Unit tests for the game random streams.
+"""
+
+import random
+import unittest
+
+from tetris.block import COLOR_PALETTE
+from tetris.core import GameCore
+from tetris.constants import PIECE_CONFIGURATIONS
+from tetris.rng import GameRandom, PieceSequence
+
+
+class TestPieceSequence(unittest.TestCase):
+    """Test cases for the PieceSequence class."""
+    
+    def test_sequence_does_not_depend_on_buffer_size(self):
+        """Test that buffering does not change the drawn piece types."""
+        small = PieceSequence(random.Random(3), buffer_size=5)
+        large = PieceSequence(random.Random(3))
+        self.assertEqual([small.next() for _ in range(40)], [large.next() for _ in range(40)])
+    
+    def test_piece_types_in_range(self):
+        """Test that every piece type exists."""
+        sequence = PieceSequence(random.Random(0))
+        self.assertTrue(all(sequence.next() in PIECE_CONFIGURATIONS for _ in range(1000)))
+    
+    def test_peek_does_not_consume(self):
+        """Test previewing upcoming pieces across a buffer refill."""
+        sequence = PieceSequence(random.Random(1), buffer_size=4)
+        sequence.next()
+        preview = sequence.peek(10)
+        self.assertEqual(len(preview), 10)
+        self.assertEqual([sequence.next() for _ in range(10)], preview)
+    
+    def test_getstate_setstate(self):
+        """Test going back to a saved position, within and across buffered chunks."""
+        sequence = PieceSequence(random.Random(2), buffer_size=8)
+        sequence.next()
+        state = sequence.getstate()
+        expected = [sequence.next() for _ in range(30)]
+        sequence.setstate(state)
+        self.assertEqual([sequence.next() for _ in range(30)], expected)
+        # A fresh sequence reaches the same position from the saved state
+        other = PieceSequence(random.Random(99), buffer_size=8)
+        other.setstate(state)
+        self.assertEqual([other.next() for _ in range(30)], expected)
+
+
+class TestGameRandom(unittest.TestCase):
+    """Test cases for the GameRandom class."""
+    
+    def test_same_seed_same_streams(self):
+        """Test that a seed reproduces both streams."""
+        first, second = GameRandom(42), GameRandom(42)
+        self.assertEqual(first.pieces.peek(20), second.pieces.peek(20))
+        self.assertEqual(first.colors.peek(20), second.colors.peek(20))
+    
+    def test_streams_are_independent(self):
+        """Test that drawing colors does not shift the piece sequence."""
+        first, second = GameRandom(42), GameRandom(42)
+        for _ in range(100):
+            first.colors.next()
+        self.assertEqual(first.pieces.peek(20), second.pieces.peek(20))
+    
+    def test_state_is_compact(self):
+        """Test that the saved colors position does not copy the generator."""
+        rng = GameRandom(7)
+        rng.colors.next()
+        state = rng.getstate()
+        colors = [rng.colors.choice(COLOR_PALETTE) for _ in range(10)]
+        self.assertIs(rng.getstate()[1][0], state[1][0])
+        rng.setstate(state)
+        self.assertEqual([rng.colors.choice(COLOR_PALETTE) for _ in range(10)], colors)
+    
+    def test_random_seed(self):
+        """Test that a seed is picked when none is given."""
+        self.assertIsInstance(GameRandom().seed, int)
+    
+    def test_seeded_game_is_reproducible(self):
+        """Test that two games with the same seed get the same pieces and colors."""
+        first, second = GameCore(seed=5), GameCore(seed=5)
+        # Drawing from the global generator must not matter
+        random.random()
+        for _ in range(5):
+            self.assertEqual(first.current_piece.piece_type, second.current_piece.piece_type)
+            self.assertEqual([block.color for block in first.current_piece.blocks],
+                             [block.color for block in second.current_piece.blocks])
+            first.hard_drop()
+            second.hard_drop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Unit tests for the rotation tables.
+"""
+
+import unittest
+
+from tetris.constants import PIECE_CONFIGURATIONS, PIECE_TYPES
+from tetris.rotation import KICK_TABLES, NUM_ORIENTATIONS, ROTATION_TABLES
+
+
+def normalize(offsets):
+    """Shift offsets so the shape can be compared regardless of position."""
+    min_x = min(dx for dx, _ in offsets)
+    min_y = min(dy for _, dy in offsets)
+    return sorted((dx - min_x, dy - min_y) for dx, dy in offsets)
+
+
+class TestRotationTables(unittest.TestCase):
+    """Test cases for the precomputed rotation and kick tables."""
+    
+    def test_every_piece_has_four_orientations(self):
+        """Test table shape for all piece types."""
+        self.assertEqual(set(ROTATION_TABLES), set(PIECE_TYPES))
+        for piece_type, orientations in ROTATION_TABLES.items():
+            self.assertEqual(len(orientations), NUM_ORIENTATIONS)
+            self.assertEqual(list(orientations[0]), PIECE_CONFIGURATIONS[piece_type])
+            for offsets in orientations:
+                self.assertEqual(len(set(offsets)), 4)
+    
+    def test_quarter_turns(self):
+        """Test that each orientation is the previous one turned clockwise."""
+        for piece_type, orientations in ROTATION_TABLES.items():
+            if PIECE_TYPES[piece_type] == "SQUARE":
+                continue
+            for orientation in range(NUM_ORIENTATIONS):
+                current = orientations[orientation]
+                following = orientations[(orientation + 1) % NUM_ORIENTATIONS]
+                self.assertEqual(following, tuple((-dy, dx) for dx, dy in current))
+    
+    def test_square_keeps_its_cells(self):
+        """Test that the square does not move when rotated."""
+        square = [key for key, name in PIECE_TYPES.items() if name == "SQUARE"][0]
+        self.assertEqual(len(set(ROTATION_TABLES[square])), 1)
+    
+    def test_kick_tables(self):
+        """Test kick tables cover every rotation and try the plain turn first."""
+        for piece_type, table in KICK_TABLES.items():
+            self.assertEqual(len(table), 2 * NUM_ORIENTATIONS)
+            for (source, target), kicks in table.items():
+                self.assertIn((target - source) % NUM_ORIENTATIONS, (1, NUM_ORIENTATIONS - 1))
+                self.assertEqual(kicks[0], (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ from unittest.mock import Mock, patch, MagicMock
 import pygame
 
 from tetris.runner import GameRunner
+from tetris.constants import GAME_STATES
 
 
 class TestGameRunner(unittest.TestCase):
@@ -111,6 +112,81 @@ class TestGameRunner(unittest.TestCase):
         # Check that text was rendered and blitted
         self.assertTrue(mock_font_instance.render.called)
         self.assertTrue(mock_screen.blit.called)
+    
+    @patch('tetris.runner.pygame.init')
+    @patch('tetris.runner.pygame.display.set_mode')
+    @patch('tetris.runner.pygame.time.Clock')
+    @patch('tetris.runner.pygame.font.SysFont')
+    @patch('tetris.runner.TetrisGame')
+    @patch('tetris.runner.pygame.key.set_repeat')
+    @patch('tetris.runner.save_replay')
+    def test_recording_saves_replay(self, mock_save_replay, mock_set_repeat, mock_game_class,
+                                    mock_font, mock_clock, mock_display, mock_init):
+        """Test that a recorded game is written to the replay file."""
+        mock_game_instance = Mock()
+        mock_game_class.return_value = mock_game_instance
+        
+        runner = GameRunner(seed=9, replay_path="game.ltr")
+        self.assertEqual(mock_game_class.call_args.kwargs["seed"], 9)
+        mock_game_instance.start_recording.assert_called_once()
+        
+        runner._save_replay()
+        mock_save_replay.assert_called_once_with(mock_game_instance.get_replay.return_value, "game.ltr")
+        runner._save_replay()
+        mock_save_replay.assert_called_once()
+    
+    @patch('tetris.runner.pygame.init')
+    @patch('tetris.runner.pygame.display.set_mode')
+    @patch('tetris.runner.pygame.time.Clock')
+    @patch('tetris.runner.pygame.font.SysFont')
+    @patch('tetris.runner.TetrisGame')
+    @patch('tetris.runner.pygame.key.set_repeat')
+    @patch('tetris.runner.pygame.event.get')
+    @patch('tetris.runner.save_replay')
+    def test_every_finished_game_is_saved(self, mock_save_replay, mock_event_get, mock_set_repeat,
+                                          mock_game_class, mock_font, mock_clock, mock_display,
+                                          mock_init):
+        """Test that games ended by the player are saved, each to its own file."""
+        first, second = Mock(), Mock()
+        mock_game_class.side_effect = [first, second]
+        runner = GameRunner(replay_path="games/game.ltr")
+        
+        # A hard drop tops out: the replay is written on the next update
+        first.get_state.return_value = GAME_STATES["GAME_OVER"]
+        runner._update_game()
+        mock_save_replay.assert_called_once_with(first.get_replay.return_value, "games/game.ltr")
+        
+        mock_event_get.return_value = [Mock(type=pygame.KEYDOWN, key=pygame.K_r)]
+        runner._handle_events()
+        self.assertIs(runner.game, second)
+        self.assertEqual(mock_save_replay.call_count, 1)
+        
+        second.get_state.return_value = GAME_STATES["PLAYING"]
+        runner._save_replay()
+        mock_save_replay.assert_called_with(second.get_replay.return_value, "games/game-2.ltr")
+    
+    @patch('tetris.runner.pygame.init')
+    @patch('tetris.runner.pygame.display.set_mode')
+    @patch('tetris.runner.pygame.time.Clock')
+    @patch('tetris.runner.pygame.font.SysFont')
+    @patch('tetris.runner.TetrisGame')
+    @patch('tetris.runner.pygame.key.set_repeat')
+    def test_autoplayer_plays_and_restarts(self, mock_set_repeat, mock_game_class,
+                                           mock_font, mock_clock, mock_display, mock_init):
+        """Test that the demo bot gets every frame and a new game after a loss."""
+        first, second = Mock(), Mock()
+        mock_game_class.side_effect = [first, second]
+        autoplayer = Mock()
+        runner = GameRunner(autoplayer=autoplayer)
+        
+        first.get_state.return_value = GAME_STATES["PLAYING"]
+        runner._update_autoplayer()
+        autoplayer.update.assert_called_with(first)
+        
+        first.get_state.return_value = GAME_STATES["GAME_OVER"]
+        runner._update_autoplayer()
+        self.assertIs(runner.game, second)
+        autoplayer.update.assert_called_with(second)
 
 
 if __name__ == '__main__':
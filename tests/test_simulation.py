@@ -0,0 +1,61 @@
+"""
+Unit tests for the simulation runner.
+"""
+
+import unittest
+
+from tetris.simulation import (
+    GameResult, iter_simulations, play_game, run_simulations, summarize
+)
+from tetris.simulator import Simulator
+
+
+class TestSimulation(unittest.TestCase):
+    """Test cases for the simulation runner."""
+    
+    def test_play_game_is_reproducible(self):
+        """Test that a seed always gives the same game on a reused simulator."""
+        sim = Simulator()
+        first = play_game(sim, 42)
+        play_game(sim, 7)
+        self.assertEqual(play_game(sim, 42), first)
+        self.assertGreater(first.pieces, 0)
+    
+    def test_max_pieces(self):
+        """Test that games stop at the piece limit."""
+        result = play_game(Simulator(), 1, max_pieces=3)
+        self.assertLessEqual(result.pieces, 3)
+    
+    def test_pool_matches_inline(self):
+        """Test that pooled games give the same results as inline ones."""
+        seeds = range(10)
+        inline = sorted(iter_simulations(seeds, workers=0))
+        pooled = sorted(iter_simulations(seeds, workers=2, chunk_size=3))
+        self.assertEqual(pooled, inline)
+        self.assertEqual([result.seed for result in pooled], list(seeds))
+    
+    def test_summarize(self):
+        """Test the aggregated distributions."""
+        results = [GameResult(seed, score, lines, 10)
+                   for seed, (score, lines) in enumerate([(0, 0), (100, 1), (300, 2), (600, 3)])]
+        summary = summarize(results)
+        self.assertEqual(summary.games, 4)
+        self.assertEqual(summary.score.mean, 250)
+        self.assertEqual(summary.score.median, 200)
+        self.assertEqual((summary.lines.minimum, summary.lines.maximum), (0, 3))
+        self.assertEqual(summary.pieces.stdev, 0)
+    
+    def test_summarize_empty(self):
+        """Test that an empty result set is rejected."""
+        with self.assertRaises(ValueError):
+            summarize([])
+    
+    def test_run_simulations(self):
+        """Test the end-to-end summary of a small sweep."""
+        summary = run_simulations(range(5), workers=0)
+        self.assertEqual(summary.games, 5)
+        self.assertEqual(summary.score.count, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
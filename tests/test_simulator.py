@@ -0,0 +1,152 @@
+"""
+Unit tests for the Simulator class.
+"""
+
+import random
+import unittest
+
+from tetris.core import GameCore
+from tetris.simulator import SHAPES, Simulator
+from tetris.constants import ACTIONS, GAME_STATES, GRID_WIDTH, GRID_HEIGHT
+from tetris.rotation import NUM_ORIENTATIONS, ROTATION_TABLES
+
+
+class TestSimulator(unittest.TestCase):
+    """Test cases for the Simulator class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.sim = Simulator()
+    
+    def _fill_rows(self, rows, gap=None):
+        """Fill rows of the board, leaving an optional gap column empty."""
+        mask = sum(1 << x for x in range(GRID_WIDTH) if x != gap)
+        for y in rows:
+            self.sim.board.fill_row_mask(y, mask)
+    
+    def test_shapes_match_rotation_tables(self):
+        """Test that every shape covers the cells of its orientation."""
+        for piece_type, shapes in SHAPES.items():
+            self.assertEqual(len(shapes), NUM_ORIENTATIONS)
+            for orientation, shape in enumerate(shapes):
+                cells = {(shape.min_dx + x, dy)
+                         for dy, mask in shape.row_masks
+                         for x in range(GRID_WIDTH) if mask >> x & 1}
+                self.assertEqual(cells, set(ROTATION_TABLES[piece_type][orientation]))
+    
+    def test_place_lands_on_floor(self):
+        """Test that a placement locks the piece on the floor."""
+        self.sim.piece_type = 6  # I
+        result = self.sim.place(0, 0)
+        self.assertTrue(result.moved)
+        self.assertTrue(result.locked)
+        self.assertEqual(self.sim.board.heights[0], 4)
+        self.assertEqual(self.sim.pieces_placed, 1)
+        self.assertEqual((self.sim.x, self.sim.y, self.sim.orientation), (5, 0, 0))
+    
+    def test_place_outside_grid(self):
+        """Test that a placement that does not fit changes nothing."""
+        self.sim.piece_type = 6
+        result = self.sim.place(1, GRID_WIDTH - 1)  # Horizontal I through the right wall
+        self.assertFalse(result.moved)
+        self.assertEqual(self.sim.pieces_placed, 0)
+    
+    def test_place_blocked_path(self):
+        """Test that a placement behind a wall of blocks is refused although it fits."""
+        self.sim.piece_type = 6  # Vertical I at the spawn, cells (5, -3) to (5, 0)
+        self.sim.board.set(3, 0, 1)
+        self.assertTrue(self.sim.fits(0, 2, self.sim.y))
+        result = self.sim.place(0, 2)
+        self.assertFalse(result.moved)
+        self.assertEqual(self.sim.pieces_placed, 0)
+        self.assertTrue(self.sim.place(0, 7).moved)
+    
+    def test_rotate_unknown_direction(self):
+        """Test that an unknown rotation is refused like Piece.rotate does."""
+        self.assertFalse(self.sim.rotate("UP"))
+        self.assertEqual(self.sim.orientation, 0)
+        self.assertTrue(self.sim.rotate("CW"))
+    
+    def test_line_clear_scoring(self):
+        """Test that clearing two lines scores like GameCore."""
+        bottom = GRID_HEIGHT - 1
+        self._fill_rows([bottom, bottom - 1, bottom - 2], gap=0)
+        self.sim.piece_type = 6
+        result = self.sim.place(0, 0)
+        self.assertEqual(result.lines, 3)
+        self.assertEqual(result.score, 100 + 200 + 300)
+        self.assertEqual(self.sim.board.heights[0], 1)
+        self.assertEqual(self.sim.get_surface_profile().aggregate_height, 1)
+    
+    def test_step_gravity_locks_piece(self):
+        """Test that gravity ticks bring the piece down and lock it."""
+        result = None
+        for _ in range(GRID_HEIGHT + 1):
+            result = self.sim.step()
+            if result.locked:
+                break
+        self.assertTrue(result.locked)
+        self.assertFalse(result.moved)
+        self.assertEqual(self.sim.pieces_placed, 1)
+    
+    def test_seeded_games_repeat(self):
+        """Test that a seed fixes the piece sequence, also after a reset."""
+        first = Simulator(seed=11)
+        second = Simulator(seed=11)
+        for _ in range(50):
+            self.assertEqual(first.step(ACTIONS["HARD_DROP"]), second.step(ACTIONS["HARD_DROP"]))
+            self.assertEqual(first.board.rows, second.board.rows)
+        first.reset(11)
+        types = [first.piece_type, first.next_piece_type]
+        self.assertEqual(types, [Simulator(seed=11).piece_type, Simulator(seed=11).next_piece_type])
+    
+    def test_top_out(self):
+        """Test that locking a cell in the top row ends the game."""
+        self._fill_rows(range(1, GRID_HEIGHT), gap=0)
+        result = self.sim.step(ACTIONS["HARD_DROP"])
+        self.assertTrue(result.game_over)
+        self.assertEqual(self.sim.state, GAME_STATES["GAME_OVER"])
+        self.assertFalse(self.sim.step(ACTIONS["LEFT"]).moved)
+    
+    def test_sonic_drop_under_overhang(self):
+        """Test that the landing row is probed under an overhang."""
+        self.sim.board.fill_row_mask(5, 1 << 3)
+        self.sim.piece_type = 0  # Square covering columns 5 and 6
+        self.sim.x, self.sim.y = 2, 7
+        self.assertEqual(self.sim.drop_distance(), GRID_HEIGHT - 1 - 7)
+    
+    def test_snapshot_restore(self):
+        """Test that restoring a snapshot replays the same future."""
+        for orientation, x in ((1, 2), (0, 8), (2, 5)):
+            self.sim.place(orientation, x)
+        snapshot = self.sim.snapshot()
+        future = [self.sim.place(0, x) for x in range(1, 9)]
+        rows = list(self.sim.board.rows)
+        
+        self.sim.restore(snapshot)
+        self.assertEqual(self.sim.snapshot(), snapshot)
+        self.assertEqual([self.sim.place(0, x) for x in range(1, 9)], future)
+        self.assertEqual(self.sim.board.rows, rows)
+    
+    def test_matches_game_core(self):
+        """Test that random action sequences give the same game as GameCore."""
+        rng = random.Random(7)
+        core = GameCore(seed=7)
+        sim = Simulator(seed=7)
+        actions = list(ACTIONS.values())
+        for _ in range(3000):
+            if core.state != GAME_STATES["PLAYING"]:
+                break
+            action = rng.choice(actions)
+            expected = core.step(action)
+            self.assertEqual(sim.step(action), expected)
+            self.assertEqual(sim.board.rows, core.matrix.rows)
+            if core.current_piece:
+                self.assertEqual(sorted(sim.piece_cells()),
+                                 sorted(core.current_piece.get_block_positions()))
+        self.assertEqual((sim.score, sim.lines_cleared, sim.state),
+                         (core.score, core.lines_cleared, core.state))
+
+
+if __name__ == '__main__':
+    unittest.main()
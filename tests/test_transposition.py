@@ -0,0 +1,59 @@
+"""
+Unit tests for the transposition table.
+"""
+
+import unittest
+
+from tetris.transposition import TranspositionTable
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """Test cases for the TranspositionTable class."""
+    
+    def test_get_and_put(self):
+        """Test storing and looking up entries."""
+        table = TranspositionTable(4)
+        self.assertIsNone(table.get(1))
+        table.put(1, "one")
+        self.assertEqual(table.get(1), "one")
+        self.assertEqual(table.get(2, "missing"), "missing")
+        stats = table.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 2, 1))
+        self.assertAlmostEqual(stats.hit_rate, 1 / 3)
+    
+    def test_least_recently_used_is_evicted(self):
+        """Test that a full table drops the entry used longest ago."""
+        table = TranspositionTable(3)
+        for key in (1, 2, 3):
+            table.put(key, key * 10)
+        table.get(1)
+        table.put(4, 40)
+        self.assertNotIn(2, table)
+        self.assertEqual([key for key in (1, 3, 4) if key in table], [1, 3, 4])
+        self.assertEqual(table.stats().evictions, 1)
+        self.assertEqual(len(table), 3)
+    
+    def test_get_or_compute(self):
+        """Test that values are only computed on a miss."""
+        table = TranspositionTable(8)
+        calls = []
+        compute = lambda: calls.append(1) or len(calls)
+        self.assertEqual(table.get_or_compute(7, compute), 1)
+        self.assertEqual(table.get_or_compute(7, compute), 1)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(table.stats().hit_rate, 0.5)
+    
+    def test_clear_and_invalid_capacity(self):
+        """Test clearing the table and rejecting empty capacities."""
+        table = TranspositionTable(2)
+        table.put(1, 1)
+        table.get(1)
+        table.clear()
+        self.assertEqual(table.stats(), (0, 0, 0, 0, 2))
+        self.assertEqual(table.stats().hit_rate, 0.0)
+        with self.assertRaises(ValueError):
+            TranspositionTable(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
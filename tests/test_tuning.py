@@ -0,0 +1,120 @@
+"""
+Unit tests for the genetic weight tuner.
+"""
+
+import json
+import math
+import os
+import random
+import tempfile
+import unittest
+
+from tetris.autoplayer import DEFAULT_WEIGHTS, HeuristicWeights
+from tetris.tuning import (
+    Checkpoint, TuningConfig, TuningError, crossover, evaluate_population, initial_population,
+    load_checkpoint, mutate, next_generation, normalize, random_population, save_checkpoint, tune
+)
+
+SMALL = TuningConfig(population_size=4, seeds=(0,), max_pieces=12, random_seed=3)
+
+
+class TestOperators(unittest.TestCase):
+    """Test cases for the genetic operators."""
+    
+    def assertUnit(self, weights):
+        self.assertAlmostEqual(math.sqrt(sum(value * value for value in weights)), 1.0)
+    
+    def test_vectors_stay_unit_length(self):
+        """Test that every operator returns unit weight vectors."""
+        rng = random.Random(0)
+        population = random_population(5, rng)
+        for weights in population:
+            self.assertIsInstance(weights, HeuristicWeights)
+            self.assertUnit(weights)
+        self.assertUnit(crossover(population[0], 3.0, population[1], 1.0))
+        self.assertUnit(mutate(population[0], 0.2, rng))
+        start = initial_population(5, rng)
+        self.assertEqual(start[0], normalize(DEFAULT_WEIGHTS))
+        self.assertEqual(len(start), 5)
+    
+    def test_crossover_weights_by_fitness(self):
+        """Test that the fitter parent dominates the child."""
+        first = HeuristicWeights(1.0, 0.0, 0.0, 0.0)
+        second = HeuristicWeights(0.0, 1.0, 0.0, 0.0)
+        child = crossover(first, 3.0, second, 1.0)
+        self.assertAlmostEqual(child.aggregate_height / child.holes, 3.0)
+        self.assertEqual(crossover(first, 0.0, second, 0.0), normalize([1.0, 1.0, 0.0, 0.0]))
+    
+    def test_next_generation_keeps_best(self):
+        """Test that the offspring replace the worst individuals."""
+        population = random_population(10, random.Random(1))
+        fitness = [float(index) for index in range(10)]
+        children = next_generation(population, fitness, TuningConfig(), random.Random(2))
+        self.assertEqual(len(children), 10)
+        # 30% offspring: the seven best survive, best first
+        self.assertEqual(children[:7], population[:2:-1])
+    
+    def test_evaluate_population(self):
+        """Test that the default weights outscore weights that reward holes."""
+        bad = normalize([0.0, 1.0, 0.0, 0.0])
+        fitness = evaluate_population([DEFAULT_WEIGHTS, bad], (0, 1), 40)
+        self.assertGreater(fitness[0], fitness[1])
+
+
+class TestCheckpoints(unittest.TestCase):
+    """Test cases for checkpointing and resuming."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "tuning.json")
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def test_round_trip(self):
+        """Test that a checkpoint reads back as written."""
+        rng = random.Random(4)
+        checkpoint = Checkpoint(SMALL, 3, random_population(4, rng), [1.0, 2.0, 0.5, 0.0],
+                                rng.getstate())
+        save_checkpoint(self.path, checkpoint)
+        self.assertEqual(load_checkpoint(self.path), checkpoint)
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+    
+    def test_malformed_checkpoint(self):
+        """Test that broken files raise TuningError."""
+        with open(self.path, "w") as file:
+            file.write("{not json")
+        with self.assertRaises(TuningError):
+            load_checkpoint(self.path)
+        with open(self.path, "w") as file:
+            json.dump({"version": 99}, file)
+        with self.assertRaisesRegex(TuningError, "version"):
+            load_checkpoint(self.path)
+    
+    def test_resume_matches_uninterrupted_run(self):
+        """Test that stopping and resuming yields the same generations."""
+        straight = [report.best_fitness for report in tune(self.path, 3, SMALL, workers=0)]
+        final = load_checkpoint(self.path)
+        
+        os.remove(self.path)
+        reports = tune(self.path, 3, SMALL, workers=0)
+        first = next(reports)
+        reports.close()  # Interrupted after the first generation
+        resumed = [report.best_fitness for report in tune(self.path, 3, SMALL, workers=0)]
+        
+        self.assertEqual([first.best_fitness] + resumed[1:], straight)
+        # The evaluated first generation is reported again, not replayed
+        self.assertEqual(resumed[0], first.best_fitness)
+        self.assertEqual(load_checkpoint(self.path), final)
+        self.assertEqual(final.generation, 3)
+    
+    def test_workers_report_rate(self):
+        """Test a pooled run and its generation rate."""
+        reports = list(tune(self.path, 2, SMALL, workers=2))
+        self.assertEqual([report.generation for report in reports], [0, 1])
+        self.assertGreater(reports[-1].generations_per_hour, 0)
+        self.assertEqual(len(load_checkpoint(self.path).population), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Unit tests for Zobrist hashing.
+"""
+
+import random
+import unittest
+
+from tetris.board import create_board
+from tetris.core import GameCore
+from tetris.constants import ACTIONS, GAME_STATES, GRID_WIDTH
+from tetris.simulator import Simulator
+from tetris.zobrist import CELL_KEYS, hash_cells, state_hash
+
+
+class TestZobrist(unittest.TestCase):
+    """Test cases for Zobrist hashing of boards and game states."""
+    
+    def test_cell_keys_are_distinct(self):
+        """Test that no two cells share a key."""
+        keys = [key for row in CELL_KEYS for key in row]
+        self.assertEqual(len(set(keys)), len(keys))
+    
+    def test_board_hash_follows_changes(self):
+        """Test that the incremental hash matches a full rehash on both backends."""
+        for backend in ("bitboard", "numpy"):
+            board = create_board(backend)
+            board.set(3, 14, 1)
+            board.fill_row_mask(13, 0b111)
+            board.fill_row_mask(14, (1 << GRID_WIDTH) - 1 - (1 << 3))
+            self.assertEqual(board.zobrist, hash_cells(board.occupied_cells()))
+            board.set(0, 13, 0)
+            board.remove_rows([14])
+            self.assertEqual(set(board.occupied_cells()), {(1, 14), (2, 14)})
+            self.assertEqual(board.zobrist, hash_cells([(1, 14), (2, 14)]))
+            board.clear()
+            self.assertEqual(board.zobrist, 0)
+    
+    def test_same_position_same_hash(self):
+        """Test that the hash depends on the cells, not on the order they were filled."""
+        first, second = create_board(), create_board()
+        first.fill_row_mask(14, 0b1011)
+        second.set(3, 14, 1)
+        second.set(0, 14, 1)
+        second.set(1, 14, 1)
+        self.assertEqual(first.zobrist, second.zobrist)
+        second.set(2, 14, 1)
+        self.assertNotEqual(first.zobrist, second.zobrist)
+    
+    def test_game_hash_matches_simulator(self):
+        """Test that GameCore and Simulator hash the same states alike."""
+        rng = random.Random(11)
+        core = GameCore(seed=11)
+        sim = Simulator(seed=11)
+        actions = list(ACTIONS.values())
+        hashes = set()
+        for _ in range(1500):
+            if core.state != GAME_STATES["PLAYING"]:
+                break
+            action = rng.choice(actions)
+            core.step(action)
+            sim.step(action)
+            self.assertEqual(core.state_hash(), sim.state_hash())
+            self.assertEqual(core.matrix.zobrist, hash_cells(core.matrix.occupied_cells()))
+            hashes.add(core.state_hash())
+        self.assertGreater(len(hashes), 5)
+    
+    def test_restore_keeps_hash(self):
+        """Test that restoring a snapshot restores the hash."""
+        sim = Simulator(seed=2)
+        sim.place(0, 3)
+        snapshot, expected = sim.snapshot(), sim.state_hash()
+        sim.place(1, 7)
+        self.assertNotEqual(sim.state_hash(), expected)
+        sim.restore(snapshot)
+        self.assertEqual(sim.state_hash(), expected)
+        self.assertEqual(state_hash(sim.board.zobrist, sim.piece_type, sim.next_piece_type), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
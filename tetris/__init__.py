@@ -4,14 +4,64 @@ myLTetris - A Python Tetris Game
 This package contains the core components of the Tetris game:
 - Block: Individual game blocks
 - Piece: Tetris pieces composed of blocks
-- Game: Main game logic and state management
+- Core: Headless game rules and state management
+- Simulator: Block-free game for bots and batch simulations
+- BatchEnv: Many games stepped together on NumPy arrays (needs numpy)
+- Game: Pygame rendering and keyboard input
 - Constants: Game configuration and constants
+
+Public names are resolved lazily on first access, so ``import tetris``
+loads neither pygame nor any game module until one is actually used.
+This module deliberately avoids importing typing for the same reason.
 """
 
-from .game import TetrisGame
-from .constants import *
+import importlib
 
 __version__ = "2.0.0"
 __author__ = "myLTetris Team"
 
-__all__ = ["TetrisGame"]
\ No newline at end of file
+__all__ = [
+    "BatchEnv", "GameCore", "GameSnapshot", "PlacementGenerator", "Simulator",
+    "StepResult", "TetrisGame", "TranspositionTable",
+]
+
+# Public name -> submodule that defines it
+_LAZY_ATTRIBUTES = {
+    "BatchEnv": ".batch_env",
+    "GameCore": ".core",
+    "GameSnapshot": ".core",
+    "PlacementGenerator": ".placements",
+    "Simulator": ".simulator",
+    "StepResult": ".core",
+    "TetrisGame": ".game",
+    "TranspositionTable": ".transposition",
+}
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import a public name on first access.
+    
+    Game classes come from their own submodule, any other public name
+    is looked up in the constants module.
+    """
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+    elif not name.startswith("_"):
+        module = importlib.import_module(".constants", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    # Cache the value so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """List the module attributes including the lazily imported names."""
+    constants = importlib.import_module(".constants", __name__)
+    public = [name for name in vars(constants) if name.isupper()]
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(public))
@@ -0,0 +1,239 @@
+"""
+Replay archive for the Tetris game.
+
+An archive stores many encoded replays in one file, laid out as:
+
+- a fixed header: magic tag, format version, number of games and the
+  offset of the index
+- the encoded replays, back to back
+- the index, one fixed-size entry per game: game id, offset and length
+  of its replay, final line count, seed (signed 64-bit) and final score
+
+The archive is read through ``mmap``: a game id is the position of its
+index entry, so any replay is found with one lookup, and scores can be
+scanned from the index alone without touching the replays.
+
+Appending writes the new replays and a new index after the end of the
+file, then rewrites the header to point at it, so an interrupted append
+leaves the previous contents readable. The old index is left behind as
+dead space, so replays should be appended in batches.
+
+Usage:
+    python -m tetris.archive build ARCHIVE REPLAY [REPLAY ...]
+    python -m tetris.archive list ARCHIVE [--top N]
+    python -m tetris.archive extract ARCHIVE GAME_ID OUTPUT
+"""
+
+import argparse
+import mmap
+import os
+import struct
+from typing import Iterable, Iterator, List, NamedTuple
+
+from .replay import Replay, decode_replay, encode_replay, load_replay
+
+ARCHIVE_MAGIC = b"LTRA"
+ARCHIVE_VERSION = 2
+
+# magic, version, reserved, game count, index offset
+_HEADER = struct.Struct("<4sHHQQ")
+# game id, offset, length, lines, seed, score
+_ENTRY = struct.Struct("<QQIIqQ")
+# Index entry layout per readable version; version 1 stored the seed unsigned
+_ENTRY_FORMATS = {1: struct.Struct("<QQIIQQ"), ARCHIVE_VERSION: _ENTRY}
+
+
+class ArchiveError(ValueError):
+    """Raised when an archive file is malformed."""
+
+
+class ArchiveEntry(NamedTuple):
+    """Index entry of one archived game."""
+    game_id: int
+    offset: int
+    length: int
+    lines: int
+    seed: int
+    score: int
+
+
+def _create(path: str) -> None:
+    """Write an empty archive."""
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, 0, 0, _HEADER.size))
+
+
+def append_replays(path: str, replays: Iterable[Replay]) -> List[int]:
+    """
+    Append replays to an archive, creating it if needed.
+    
+    Args:
+        path: Archive file
+        replays: Replays to append
+    
+    Returns:
+        The game ids given to the appended replays
+    
+    Raises:
+        ArchiveError: If the file exists but is not an archive, or a
+            replay does not fit an index entry; nothing is written then
+        ReplayError: If a replay cannot be encoded; nothing is written then
+    """
+    if not os.path.exists(path):
+        _create(path)
+    with ReplayArchive(path) as archive:
+        entries = list(archive.entries())
+    first_id = len(entries)
+    
+    # Encode and index everything before writing, so a bad replay leaves
+    # the file untouched. A version 1 index is rewritten in the new layout.
+    offset = os.path.getsize(path)
+    encoded = []
+    for game_id, replay in enumerate(replays, first_id):
+        data = encode_replay(replay)
+        encoded.append(data)
+        entries.append(ArchiveEntry(game_id, offset, len(data), replay.lines,
+                                    replay.seed, replay.score))
+        offset += len(data)
+    index_offset = offset
+    try:
+        index = b"".join(_ENTRY.pack(*entry) for entry in entries)
+    except struct.error as error:
+        raise ArchiveError(f"A replay does not fit the index of {path}: {error}") from error
+    
+    with open(path, "r+b") as file:
+        file.seek(0, os.SEEK_END)
+        file.writelines(encoded)
+        file.write(index)
+        file.flush()
+        os.fsync(file.fileno())
+        # Only now point the header at the new index
+        file.seek(0)
+        file.write(_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, 0, len(entries), index_offset))
+    return list(range(first_id, len(entries)))
+
+
+class ReplayArchive:
+    """
+    Read-only, memory-mapped view of a replay archive.
+    
+    Use it as a context manager, or call ``close`` when done.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Open an archive.
+        
+        Args:
+            path: Archive file
+        
+        Raises:
+            ArchiveError: If the file is not a valid archive
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            # Checked before mapping: an empty file cannot be mapped at all
+            if os.fstat(file.fileno()).st_size < _HEADER.size:
+                raise ArchiveError(f"{path} is too short to be a replay archive")
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count, index_offset = _HEADER.unpack_from(self._map, 0)
+        if magic != ARCHIVE_MAGIC or version not in _ENTRY_FORMATS:
+            self.close()
+            raise ArchiveError(f"{path} is not a replay archive of a supported version")
+        self._entry = _ENTRY_FORMATS[version]
+        if index_offset + count * self._entry.size > len(self._map):
+            self.close()
+            raise ArchiveError(f"The index of {path} runs past the end of the file")
+        self._count = count
+        self._index_offset = index_offset
+    
+    def entry(self, game_id: int) -> ArchiveEntry:
+        """
+        Get the index entry of a game.
+        
+        Raises:
+            IndexError: If there is no such game
+        """
+        if not 0 <= game_id < self._count:
+            raise IndexError(f"No game {game_id} in an archive of {self._count} games")
+        entry = self._entry
+        return ArchiveEntry(*entry.unpack_from(self._map, self._index_offset + game_id * entry.size))
+    
+    def entries(self) -> Iterator[ArchiveEntry]:
+        """Iterate over the index entries in game id order."""
+        index = self._map[self._index_offset:self._index_offset + self._count * self._entry.size]
+        for fields in self._entry.iter_unpack(index):
+            yield ArchiveEntry(*fields)
+    
+    def scores(self) -> Iterator[int]:
+        """Iterate over the final scores in game id order, from the index only."""
+        for entry in self.entries():
+            yield entry.score
+    
+    def read(self, game_id: int) -> bytes:
+        """Get the encoded replay of a game."""
+        entry = self.entry(game_id)
+        return self._map[entry.offset:entry.offset + entry.length]
+    
+    def replay(self, game_id: int) -> Replay:
+        """Get the decoded replay of a game."""
+        return decode_replay(self.read(game_id))
+    
+    def close(self) -> None:
+        """Release the memory map."""
+        self._map.close()
+    
+    def __enter__(self) -> 'ReplayArchive':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        """Number of games in the archive."""
+        return self._count
+    
+    def __repr__(self) -> str:
+        """String representation of the archive."""
+        return f"ReplayArchive(path={self.path!r}, games={self._count})"
+
+
+def main() -> None:
+    """Command line entry point of the archive tool."""
+    parser = argparse.ArgumentParser(description="Build and read myLTetris replay archives.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    build = commands.add_parser("build", help="append replay files to an archive")
+    build.add_argument("archive")
+    build.add_argument("replays", nargs="+")
+    
+    listing = commands.add_parser("list", help="list the games of an archive")
+    listing.add_argument("archive")
+    listing.add_argument("--top", type=int, default=None, help="only the N best scores")
+    
+    extract = commands.add_parser("extract", help="write one game to a replay file")
+    extract.add_argument("archive")
+    extract.add_argument("game_id", type=int)
+    extract.add_argument("output")
+    
+    args = parser.parse_args()
+    if args.command == "build":
+        ids = append_replays(args.archive, (load_replay(path) for path in args.replays))
+        print(f"Added games {ids[0]}-{ids[-1]} to {args.archive}")
+    elif args.command == "list":
+        with ReplayArchive(args.archive) as archive:
+            entries = list(archive.entries())
+        if args.top is not None:
+            entries = sorted(entries, key=lambda entry: entry.score, reverse=True)[:args.top]
+        print(f"{'game':>8} {'score':>10} {'lines':>6} {'bytes':>7}  seed")
+        for entry in entries:
+            print(f"{entry.game_id:>8} {entry.score:>10} {entry.lines:>6} {entry.length:>7}  {entry.seed}")
+    else:
+        with ReplayArchive(args.archive) as archive:
+            data = archive.read(args.game_id)
+        with open(args.output, "wb") as file:
+            file.write(data)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""
+Heuristic autoplayer for the Tetris game.
+
+This module contains a baseline bot that scores every reachable
+placement of the current piece with a weighted sum of board features
+(aggregate height, holes, bumpiness and cleared lines) and plays the
+best one.
+
+The AutoPlayer drives a live game without stalling the frame loop: when
+a piece spawns it copies the board into a small request, plans in a
+worker thread or process, and gets the input path back through a queue.
+Each frame it only drains that queue and applies queued inputs, and
+stops as soon as its time budget for the frame is spent.
+"""
+
+import queue
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Deque, NamedTuple, Optional, Sequence, Tuple
+
+from .board import SurfaceProfile
+from .core import GameCore
+from .constants import GAME_STATES, SPAWN_X, SPAWN_Y
+from .placements import Placement, PlacementGenerator, enumerate_placements
+from .simulation import GameResult
+from .simulator import Simulator
+
+# Time the autoplayer may spend in the frame loop per frame, in seconds
+DEFAULT_FRAME_BUDGET = 0.002
+
+# Inputs applied per frame, so the moves stay visible
+DEFAULT_ACTIONS_PER_FRAME = 1
+
+_PLAYING = GAME_STATES["PLAYING"]
+
+
+class HeuristicWeights(NamedTuple):
+    """Weights of the board features in the placement score."""
+    aggregate_height: float = -0.510066
+    holes: float = -0.35663
+    bumpiness: float = -0.184483
+    lines: float = 0.760666
+
+
+DEFAULT_WEIGHTS = HeuristicWeights()
+
+
+def evaluate(profile: SurfaceProfile, lines: int,
+             weights: HeuristicWeights = DEFAULT_WEIGHTS) -> float:
+    """
+    Score a board after a placement, higher is better.
+    
+    Args:
+        profile: Surface profile of the board after the placement
+        lines: Number of lines the placement cleared
+        weights: Weights of the features
+    
+    Returns:
+        The weighted sum of the features
+    """
+    return (weights.aggregate_height * profile.aggregate_height
+            + weights.holes * profile.total_holes
+            + weights.bumpiness * profile.bumpiness
+            + weights.lines * lines)
+
+
+def best_placement(sim: Simulator, weights: HeuristicWeights = DEFAULT_WEIGHTS,
+                   generator: Optional[PlacementGenerator] = None) -> Optional[Placement]:
+    """
+    Find the best reachable placement of the current piece of a simulator.
+    
+    Every placement is tried on the simulator itself, which is restored
+    afterwards.
+    
+    Args:
+        sim: Game whose current piece is placed
+        weights: Weights of the features
+        generator: Memoising placement generator, used when the piece is
+            at the spawn
+    
+    Returns:
+        The placement with the highest score, None if there is none
+    """
+    if sim.state != _PLAYING:
+        return None
+    if generator is not None and (sim.orientation, sim.x, sim.y) == (0, SPAWN_X, SPAWN_Y):
+        placements: Sequence[Placement] = generator.placements(sim.board, sim.piece_type)
+    else:
+        placements = enumerate_placements(sim.board.rows, sim.piece_type,
+                                          sim.orientation, sim.x, sim.y)
+    
+    snapshot = sim.snapshot()
+    best = None
+    best_score = float("-inf")
+    for placement in placements:
+        sim.orientation, sim.x, sim.y = placement.orientation, placement.x, placement.y
+        lines = sim.lock()
+        score = evaluate(sim.board.profile, lines, weights)
+        if score > best_score:
+            best, best_score = placement, score
+        sim.restore(snapshot)
+    return best
+
+
+def play_heuristic_game(sim: Simulator, seed: int, weights: HeuristicWeights = DEFAULT_WEIGHTS,
+                        max_pieces: Optional[int] = None,
+                        generator: Optional[PlacementGenerator] = None) -> GameResult:
+    """
+    Play one headless game with the heuristic, as fast as possible.
+    
+    Args:
+        sim: Simulator to reset and play on
+        seed: Seed of the piece sequence
+        weights: Weights of the heuristic
+        max_pieces: Stop after this many pieces, None to play until top-out
+        generator: Memoising placement generator to reuse across games
+    
+    Returns:
+        The outcome of the game
+    """
+    sim.reset(seed)
+    while sim.state == _PLAYING:
+        if max_pieces is not None and sim.pieces_placed >= max_pieces:
+            break
+        placement = best_placement(sim, weights, generator)
+        if placement is None:
+            break
+        sim.orientation, sim.x, sim.y = placement.orientation, placement.x, placement.y
+        sim.lock()
+    return GameResult(seed, sim.score, sim.lines_cleared, sim.pieces_placed)
+
+
+class PlanRequest(NamedTuple):
+    """State a worker needs to plan the placement of a spawned piece."""
+    request_id: int
+    rows: Tuple[int, ...]
+    heights: Tuple[int, ...]
+    column_counts: Tuple[int, ...]
+    zobrist: int
+    piece_type: int
+    orientation: int
+    x: int
+    y: int
+    weights: HeuristicWeights
+
+
+# Per-worker scratch game and placement cache, reused across requests
+_planner_sim: Optional[Simulator] = None
+_planner_generator: Optional[PlacementGenerator] = None
+
+
+def _init_planner() -> None:
+    """Create the scratch game and placement cache of a worker."""
+    global _planner_sim, _planner_generator
+    _planner_sim = Simulator(seed=0)
+    _planner_generator = PlacementGenerator()
+
+
+def plan(request: PlanRequest) -> Tuple[int, Tuple[str, ...]]:
+    """
+    Plan the inputs for a request in a worker thread or process.
+    
+    Returns:
+        The request id and the input path, empty if nothing fits
+    """
+    if _planner_sim is None:
+        _init_planner()
+    sim = _planner_sim
+    sim.board.load(request.rows, request.heights, request.column_counts, request.zobrist)
+    sim.state = _PLAYING
+    sim.piece_type = request.piece_type
+    sim.orientation, sim.x, sim.y = request.orientation, request.x, request.y
+    placement = best_placement(sim, request.weights, _planner_generator)
+    return request.request_id, placement.path if placement is not None else ()
+
+
+class AutoPlayer:
+    """
+    Plays a live game off the frame loop.
+    
+    Call ``update`` once per frame. It never waits for the planner: when
+    the plan of the current piece has not arrived yet, the frame simply
+    goes on without inputs.
+    """
+    
+    def __init__(self, weights: HeuristicWeights = DEFAULT_WEIGHTS,
+                 frame_budget: float = DEFAULT_FRAME_BUDGET,
+                 actions_per_frame: int = DEFAULT_ACTIONS_PER_FRAME,
+                 use_process: bool = False):
+        """
+        Initialize the autoplayer and start its worker, waiting until it runs.
+        
+        Args:
+            weights: Weights of the placement heuristic
+            frame_budget: Seconds ``update`` may spend per frame
+            actions_per_frame: Maximum number of inputs applied per frame
+            use_process: Plan in a worker process instead of a thread, so
+                planning does not compete with the frame loop for the GIL
+        """
+        self.weights = weights
+        self.frame_budget = frame_budget
+        self.actions_per_frame = actions_per_frame
+        executor_class = ProcessPoolExecutor if use_process else ThreadPoolExecutor
+        self._executor: Executor = executor_class(max_workers=1, initializer=_init_planner)
+        # Start the worker now rather than in the first frame
+        self._executor.submit(int).result()
+        self._results: 'queue.SimpleQueue[Future]' = queue.SimpleQueue()
+        self._actions: Deque[str] = deque()
+        self._piece: object = None
+        self._request_id = 0
+        
+        # Longest time spent in update and number of plans applied
+        self.max_update_time = 0.0
+        self.plans_received = 0
+    
+    def _request(self, game: GameCore) -> None:
+        """Send the state of a newly spawned piece to the worker."""
+        self._request_id += 1
+        self._actions.clear()
+        board = game.matrix
+        piece = game.current_piece
+        request = PlanRequest(
+            request_id=self._request_id,
+            rows=tuple(board.rows),
+            heights=tuple(board.heights),
+            column_counts=tuple(board.column_counts),
+            zobrist=board.zobrist,
+            piece_type=piece.piece_type,
+            orientation=piece.orientation,
+            x=piece.center_x,
+            y=piece.center_y,
+            weights=self.weights,
+        )
+        future = self._executor.submit(plan, request)
+        future.add_done_callback(self._results.put)
+    
+    def update(self, game: GameCore) -> int:
+        """
+        Plan for a newly spawned piece and apply the inputs due this frame.
+        
+        Args:
+            game: Game to play
+        
+        Returns:
+            Number of inputs applied
+        
+        Raises:
+            Exception: Whatever the planner raised for a request
+        """
+        start = time.perf_counter()
+        piece = game.current_piece
+        if piece is None or game.state != _PLAYING:
+            self._piece = None
+            self._actions.clear()
+            return 0
+        if piece is not self._piece:
+            self._piece = piece
+            self._request(game)
+        
+        while True:
+            try:
+                future = self._results.get_nowait()
+            except queue.Empty:
+                break
+            request_id, path = future.result()
+            # Plans for pieces that are already gone are dropped
+            if request_id == self._request_id:
+                self.plans_received += 1
+                self._actions.extend(path)
+        
+        applied = 0
+        while (self._actions and applied < self.actions_per_frame
+               and time.perf_counter() - start < self.frame_budget):
+            game.apply_action(self._actions.popleft())
+            applied += 1
+            if game.current_piece is not piece:
+                break
+        
+        self.max_update_time = max(self.max_update_time, time.perf_counter() - start)
+        return applied
+    
+    def close(self) -> None:
+        """Stop the worker without waiting for a pending plan."""
+        self._executor.shutdown(wait=False)
+    
+    def __repr__(self) -> str:
+        """String representation of the autoplayer."""
+        return f"AutoPlayer(weights={self.weights}, frame_budget={self.frame_budget})"
@@ -0,0 +1,391 @@
+"""
+Batched game environment for the Tetris game.
+
+This module contains the BatchEnv class, an optional NumPy-backed
+environment that steps many games in lockstep. The boards of all games
+live in one array of row masks and the falling pieces in a few integer
+arrays, so moving, colliding, locking and clearing lines are computed
+for every game at once with array masks.
+"""
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from .board import FULL_ROW_MASK
+from .constants import (
+    GRID_WIDTH, GRID_HEIGHT, PIECE_CONFIGURATIONS, ACTIONS, SPAWN_X, SPAWN_Y
+)
+from .rng import PIECE_BUFFER_SIZE, GameRandom
+from .rotation import KICK_TABLES, NUM_ORIENTATIONS
+from .simulator import SHAPES
+
+# Action codes of the batched environment; code 0 only lets the piece fall
+BATCH_ACTIONS = (
+    None,
+    ACTIONS["LEFT"],
+    ACTIONS["RIGHT"],
+    ACTIONS["DOWN"],
+    ACTIONS["ROTATE_CW"],
+    ACTIONS["ROTATE_CCW"],
+    ACTIONS["HARD_DROP"],
+    ACTIONS["SONIC_DROP"],
+)
+ACTION_CODES = {action: code for code, action in enumerate(BATCH_ACTIONS)}
+
+# Per action code: the shift of a translation and the turn of a rotation
+# (0 clockwise, 1 counter-clockwise, -1 none)
+_ACTION_DX = np.array([{ACTIONS["LEFT"]: -1, ACTIONS["RIGHT"]: 1}.get(action, 0)
+                       for action in BATCH_ACTIONS], dtype=np.int64)
+_ACTION_DY = np.array([int(action == ACTIONS["DOWN"]) for action in BATCH_ACTIONS],
+                      dtype=np.int64)
+_ACTION_TURN = np.array([{ACTIONS["ROTATE_CW"]: 0, ACTIONS["ROTATE_CCW"]: 1}.get(action, -1)
+                         for action in BATCH_ACTIONS], dtype=np.int64)
+_HARD_DROP_CODE = ACTION_CODES[ACTIONS["HARD_DROP"]]
+_SONIC_DROP_CODE = ACTION_CODES[ACTIONS["SONIC_DROP"]]
+
+_NUM_PIECES = len(PIECE_CONFIGURATIONS)
+_SHAPE_ROWS = 4
+
+# Piece types queued per game, taken from the game streams a chunk at a time
+_QUEUE_SIZE = PIECE_BUFFER_SIZE
+
+# Columns tabulated on each side of the grid; further out is clamped to
+# the outermost ones, where no piece fits
+_X_MARGIN = 4
+_COLUMNS = GRID_WIDTH + 2 * _X_MARGIN
+
+
+def _build_shape_arrays():
+    """Pack the row-mask shapes of every piece into fixed-size arrays."""
+    row_dy = np.zeros((_NUM_PIECES, NUM_ORIENTATIONS, _SHAPE_ROWS), dtype=np.int64)
+    row_mask = np.zeros((_NUM_PIECES, NUM_ORIENTATIONS, _SHAPE_ROWS), dtype=np.int64)
+    min_dx = np.zeros((_NUM_PIECES, NUM_ORIENTATIONS), dtype=np.int64)
+    max_dx = np.zeros((_NUM_PIECES, NUM_ORIENTATIONS), dtype=np.int64)
+    for piece_type, shapes in SHAPES.items():
+        for orientation, shape in enumerate(shapes):
+            min_dx[piece_type, orientation] = shape.min_dx
+            max_dx[piece_type, orientation] = shape.max_dx
+            # Unused slots repeat the first row with an empty mask
+            row_dy[piece_type, orientation] = shape.row_masks[0][0]
+            for k, (dy, mask) in enumerate(shape.row_masks):
+                row_dy[piece_type, orientation, k] = dy
+                row_mask[piece_type, orientation, k] = mask
+    return row_dy, row_mask, min_dx, max_dx
+
+
+def _build_placed_arrays(row_mask, min_dx, max_dx):
+    """
+    Tabulate the row masks of every shape shifted to every column.
+    
+    Both tables are flat, indexed by ``shape * _COLUMNS + column`` with
+    ``shape = piece_type * NUM_ORIENTATIONS + orientation``: the masks,
+    empty where the piece crosses a wall, and whether the piece is
+    inside the walls.
+    """
+    x = np.arange(_COLUMNS) - _X_MARGIN
+    left = x + min_dx[:, :, None]
+    inside = (left >= 0) & (x + max_dx[:, :, None] < GRID_WIDTH)
+    placed = row_mask[:, :, None, :] << np.maximum(left, 0)[..., None]
+    placed = np.where(inside[..., None], placed, 0)
+    return placed.reshape(-1, _SHAPE_ROWS), inside.ravel()
+
+
+def _build_kick_array():
+    """Pack the kick tables into one array padded with repeated kicks."""
+    longest = max(len(kicks) for table in KICK_TABLES.values() for kicks in table.values())
+    kicks = np.zeros((_NUM_PIECES, NUM_ORIENTATIONS, 2, longest, 2), dtype=np.int64)
+    for piece_type, table in KICK_TABLES.items():
+        for orientation in range(NUM_ORIENTATIONS):
+            for turn, step in enumerate((1, -1)):
+                target = (orientation + step) % NUM_ORIENTATIONS
+                offsets = list(table[(orientation, target)])
+                # A repeated kick fails again, so padding never changes the result
+                offsets += [offsets[-1]] * (longest - len(offsets))
+                kicks[piece_type, orientation, turn] = offsets
+    return kicks
+
+
+_ROW_DY, _ROW_MASK, _MIN_DX, _MAX_DX = _build_shape_arrays()
+_PLACED, _INSIDE = _build_placed_arrays(_ROW_MASK, _MIN_DX, _MAX_DX)
+_SHAPE_DY = _ROW_DY.reshape(-1, _SHAPE_ROWS)
+
+# Every board is stored between _PAD free rows standing for the space
+# above the grid and _PAD full rows standing for the floor. A piece
+# centered at or above _MIN_Y has every cell above the grid, and one at
+# or below _MAX_Y every cell below it, so centers are clamped to that
+# range and their rows always land on the board or its padding.
+_PAD = 1 + int(_ROW_DY.max() - _ROW_DY.min())
+_MIN_Y = -1 - int(_ROW_DY.max())
+_MAX_Y = GRID_HEIGHT - int(_ROW_DY.min())
+_KICKS = _build_kick_array()
+
+
+class BatchStepResult(NamedTuple):
+    """
+    Events of one batched step, one array entry per game.
+    
+    ``score`` is what the step added before any automatic reset and
+    ``done`` marks the games that topped out and were restarted.
+    """
+    moved: np.ndarray
+    locked: np.ndarray
+    lines: np.ndarray
+    score: np.ndarray
+    done: np.ndarray
+
+
+class BatchEnv:
+    """
+    Lockstep environment of N independent games.
+    
+    The rules are the ones of Simulator and GameCore: moves and
+    rotations are checked against the walls, the floor and the settled
+    cells (cells above the visible area are free), a piece that cannot
+    fall locks, full lines are removed and score 100 times the running
+    line count, and a cell left in the top row ends the game. Finished
+    games are reset automatically.
+    
+    ``rows[g, y]`` is the row mask of row ``y`` of game ``g``; ``piece_type``,
+    ``orientation``, ``x`` and ``y`` describe the falling pieces.
+    
+    Every game draws its pieces from its own stream, seeded like the one
+    of a Simulator, so a game's sequence does not depend on when the
+    other games reset. The streams fill a per-game queue of piece types
+    a chunk at a time, and spawns read the queue with array indexing.
+    """
+    
+    def __init__(self, num_games: int, seed: Optional[int] = None):
+        """
+        Initialize the environment.
+        
+        Args:
+            num_games: Number of games stepped together
+            seed: Base seed; game ``g`` gets the piece sequence of
+                ``Simulator(seed + g)``, restarts included. None for a
+                random seed per game
+        """
+        self.num_games = num_games
+        self.seeds = [None if seed is None else seed + g for g in range(num_games)]
+        self._pieces = [GameRandom(game_seed).pieces for game_seed in self.seeds]
+        self._queue = np.empty((num_games, _QUEUE_SIZE), dtype=np.int64)
+        self._cursor = np.zeros(num_games, dtype=np.int64)
+        self._refill(np.arange(num_games))
+        self._board = np.zeros((num_games, GRID_HEIGHT + 2 * _PAD), dtype=np.int64)
+        self._board[:, GRID_HEIGHT + _PAD:] = FULL_ROW_MASK
+        self._flat = self._board.ravel()
+        self._stride = self._board.shape[1]
+        self.rows = self._board[:, _PAD:GRID_HEIGHT + _PAD]
+        self.score = np.zeros(num_games, dtype=np.int64)
+        self.lines_cleared = np.zeros(num_games, dtype=np.int64)
+        self.games_finished = 0
+        self.piece_type = np.zeros(num_games, dtype=np.int64)
+        self.next_piece_type = self._draw(np.arange(num_games))
+        self.orientation = np.zeros(num_games, dtype=np.int64)
+        self.x = np.zeros(num_games, dtype=np.int64)
+        self.y = np.zeros(num_games, dtype=np.int64)
+        self._spawn(np.arange(num_games))
+    
+    def reset(self, games: Optional[np.ndarray] = None) -> None:
+        """
+        Restart games on an empty board.
+        
+        Args:
+            games: Indices of the games to restart, None for all of them
+        """
+        if games is None:
+            games = np.arange(self.num_games)
+        self.rows[games] = 0
+        self.score[games] = 0
+        self.lines_cleared[games] = 0
+        self.next_piece_type[games] = self._draw(games)
+        self._spawn(games)
+    
+    def _refill(self, games: np.ndarray) -> None:
+        """Queue the next chunk of piece types of some games."""
+        pieces = self._pieces
+        self._queue[games] = [pieces[g].take(_QUEUE_SIZE) for g in games.tolist()]
+        self._cursor[games] = 0
+    
+    def _draw(self, games: np.ndarray) -> np.ndarray:
+        """Take the next queued piece type of every given game."""
+        cursor = self._cursor[games]
+        piece_types = self._queue[games, cursor]
+        cursor += 1
+        self._cursor[games] = cursor
+        empty = games[cursor == _QUEUE_SIZE]
+        if len(empty):
+            self._refill(empty)
+        return piece_types
+    
+    def _spawn(self, games: np.ndarray) -> None:
+        """Make the next pieces of some games current at the spawn position."""
+        self.piece_type[games] = self.next_piece_type[games]
+        self.next_piece_type[games] = self._draw(games)
+        self.orientation[games] = 0
+        self.x[games] = SPAWN_X
+        self.y[games] = SPAWN_Y
+    
+    def fits(self, games: np.ndarray, orientation: np.ndarray,
+             x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Check if the current pieces of some games fit at given positions.
+        
+        Args:
+            games: Indices of the games
+            orientation: Orientation of each piece
+            x: X coordinate of each piece center
+            y: Y coordinate of each piece center
+        
+        Returns:
+            Boolean array, True where every cell of the piece is free
+        """
+        shape = self.piece_type[games] * NUM_ORIENTATIONS + orientation
+        placement = shape * _COLUMNS + np.minimum(np.maximum(x + _X_MARGIN, 0), _COLUMNS - 1)
+        cells = self._flat.take(self._row_index(games, shape, y)) & _PLACED.take(placement, axis=0)
+        # OR-ing the row columns is much faster than any(axis=1) on so few columns
+        blocked = cells[:, 0] | cells[:, 1] | cells[:, 2] | cells[:, 3]
+        return _INSIDE.take(placement) & (blocked == 0)
+    
+    def _row_index(self, games: np.ndarray, shape: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Get the flat board index of every shape row of the pieces of some games."""
+        top = games * self._stride + np.minimum(np.maximum(y, _MIN_Y), _MAX_Y) + _PAD
+        return top[:, None] + _SHAPE_DY.take(shape, axis=0)
+    
+    def _translate(self, games: np.ndarray, dx, dy) -> np.ndarray:
+        """Move the pieces of some games by a shift, or one shift per game, where free."""
+        x = self.x[games] + dx
+        y = self.y[games] + dy
+        ok = self.fits(games, self.orientation[games], x, y)
+        moved = games[ok]
+        self.x[moved] = x[ok]
+        self.y[moved] = y[ok]
+        return ok
+    
+    def _rotate(self, games: np.ndarray, turn: np.ndarray) -> np.ndarray:
+        """Rotate the pieces of some games by their turns, keeping the first kick that fits."""
+        step = 1 - 2 * turn
+        orientation = self.orientation[games]
+        target = (orientation + step) % NUM_ORIENTATIONS
+        kicks = _KICKS[self.piece_type[games], orientation, turn]
+        # Probe every kick of every game in one call
+        count = kicks.shape[1]
+        x = (self.x[games][:, None] + kicks[:, :, 0]).ravel()
+        y = (self.y[games][:, None] + kicks[:, :, 1]).ravel()
+        ok = self.fits(np.repeat(games, count), np.repeat(target, count), x, y).reshape(-1, count)
+        rotated = ok.any(axis=1)
+        first = ok.argmax(axis=1)[rotated]
+        done = games[rotated]
+        self.x[done] += kicks[rotated, first, 0]
+        self.y[done] += kicks[rotated, first, 1]
+        self.orientation[done] = target[rotated]
+        return rotated
+    
+    def _drop(self, games: np.ndarray) -> np.ndarray:
+        """Drop the pieces of some games to their landing rows."""
+        # Probe every row below each piece in one call; the piece falls
+        # until the first row where it does not fit. Every shape has a
+        # block at its center, so the last offset is always below the floor.
+        count = GRID_HEIGHT - int(self.y[games].min())
+        offsets = np.arange(1, count + 1)
+        x = np.repeat(self.x[games], count)
+        y = (self.y[games][:, None] + offsets).ravel()
+        orientation = np.repeat(self.orientation[games], count)
+        ok = self.fits(np.repeat(games, count), orientation, x, y).reshape(-1, count)
+        distance = (~ok).argmax(axis=1)
+        self.y[games] += distance
+        return distance
+    
+    def _lock(self, games: np.ndarray, lines: np.ndarray, score: np.ndarray,
+              done: np.ndarray) -> None:
+        """Settle the pieces of some games, clear lines and spawn or finish."""
+        if not len(games):
+            return
+        shape = self.piece_type[games] * NUM_ORIENTATIONS + self.orientation[games]
+        y = self.y[games]
+        mask = _PLACED.take(shape * _COLUMNS + self.x[games] + _X_MARGIN, axis=0)
+        # Cells above the visible area are discarded
+        mask = np.where(y[:, None] + _SHAPE_DY.take(shape, axis=0) >= 0, mask, 0)
+        np.bitwise_or.at(self._flat, self._row_index(games, shape, y), mask)
+        
+        board = self.rows[games]
+        full = (board & FULL_ROW_MASK) == FULL_ROW_MASK
+        cleared = full.sum(axis=1)
+        clearing = cleared > 0
+        if clearing.any():
+            # Stable sort puts the full rows on top and keeps the order of
+            # the others, then the full rows are emptied
+            order = np.argsort(~full[clearing], axis=1, kind="stable")
+            compacted = np.take_along_axis(board[clearing], order, axis=1)
+            compacted[np.arange(GRID_HEIGHT) < cleared[clearing][:, None]] = 0
+            self.rows[games[clearing]] = compacted
+            previous = self.lines_cleared[games]
+            gained = 100 * (cleared * previous + cleared * (cleared + 1) // 2)
+            self.lines_cleared[games] += cleared
+            self.score[games] += gained
+            lines[games] += cleared
+            score[games] += gained
+        
+        over = (self.rows[games, 0] & FULL_ROW_MASK) != 0
+        done[games[over]] = True
+        self._spawn(games[~over])
+        finished = games[over]
+        if len(finished):
+            self.games_finished += len(finished)
+            self.reset(finished)
+    
+    def step(self, actions) -> BatchStepResult:
+        """
+        Advance every game by one tick.
+        
+        Each game applies its action, then, if its piece is still
+        falling, gravity moves it down one row or locks it, like
+        Simulator.step.
+        
+        Args:
+            actions: One action code per game (see ``BATCH_ACTIONS``)
+        
+        Returns:
+            The per-game events of the step
+        """
+        actions = np.asarray(actions)
+        n = self.num_games
+        moved = np.zeros(n, dtype=bool)
+        locked = np.zeros(n, dtype=bool)
+        lines = np.zeros(n, dtype=np.int64)
+        score = np.zeros(n, dtype=np.int64)
+        done = np.zeros(n, dtype=bool)
+        
+        # Every game applies exactly one action, so the games of all the
+        # shifts, of both turns and of both drops are handled together
+        dx = _ACTION_DX[actions]
+        dy = _ACTION_DY[actions]
+        games = np.flatnonzero(dx | dy)
+        if len(games):
+            ok = self._translate(games, dx[games], dy[games])
+            moved[games] = ok
+            # A piece that cannot move down lands
+            locked[games[~ok & (dy[games] > 0)]] = True
+        
+        turn = _ACTION_TURN[actions]
+        games = np.flatnonzero(turn >= 0)
+        if len(games):
+            moved[games] = self._rotate(games, turn[games])
+        
+        games = np.flatnonzero((actions == _HARD_DROP_CODE) | (actions == _SONIC_DROP_CODE))
+        if len(games):
+            hard = actions[games] == _HARD_DROP_CODE
+            moved[games] = (self._drop(games) > 0) | hard
+            locked[games[hard]] = True
+        
+        # Gravity tick for every piece that was not locked by its action
+        games = np.flatnonzero(~locked)
+        ok = self._translate(games, 0, 1)
+        locked[games[~ok]] = True
+        self._lock(np.flatnonzero(locked), lines, score, done)
+        
+        return BatchStepResult(moved=moved, locked=locked, lines=lines, score=score, done=done)
+    
+    def __repr__(self) -> str:
+        """String representation of the environment."""
+        return f"BatchEnv(games={self.num_games}, finished={self.games_finished})"
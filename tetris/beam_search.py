@@ -0,0 +1,300 @@
+"""
+Beam-search planner for the Tetris game.
+
+This module looks ahead over a sequence of pieces. In a game, that is
+the current piece and the next one, the only pieces a player can see.
+Every level places the next piece of the sequence on each board of the
+beam, scores the results with the autoplayer heuristic (cleared lines
+counted over the whole sequence), drops duplicate boards by Zobrist
+hash and keeps the best ``beam_width`` of them. The first placement of
+the best final board is played.
+
+Boards of a level can be expanded in a process pool. Workers get and
+return plain board tuples, keep their own placement caches, and prune
+their share of the children before sending them back.
+"""
+
+import heapq
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .autoplayer import DEFAULT_WEIGHTS, HeuristicWeights, evaluate
+from .board import Board
+from .core import GameCore
+from .constants import GAME_STATES
+from .placements import Placement, PlacementGenerator
+from .simulation import GameResult
+from .simulator import Simulator
+
+DEFAULT_BEAM_WIDTH = 8
+DEFAULT_DEPTH = 2
+
+_PLAYING = GAME_STATES["PLAYING"]
+
+
+class BeamNode(NamedTuple):
+    """
+    Board reached by a sequence of placements.
+    
+    ``root`` is the first placement of the sequence, the one to play if
+    this board wins; ``lines`` counts the lines cleared on the way.
+    """
+    score: float
+    lines: int
+    root: Optional[Placement]
+    rows: Tuple[int, ...]
+    heights: Tuple[int, ...]
+    column_counts: Tuple[int, ...]
+    zobrist: int
+
+
+class SearchResult(NamedTuple):
+    """Outcome of one search."""
+    placement: Optional[Placement]
+    score: float
+    depth: int
+    nodes: int
+    seconds: float
+    
+    @property
+    def nodes_per_second(self) -> float:
+        """Placements evaluated per second."""
+        return self.nodes / self.seconds if self.seconds > 0 else 0.0
+
+
+# Per-process scratch game and placement cache of the expansions
+_scratch_sim: Optional[Simulator] = None
+_scratch_generator: Optional[PlacementGenerator] = None
+
+
+def _init_scratch() -> None:
+    """Create the scratch game and placement cache of a process."""
+    global _scratch_sim, _scratch_generator
+    _scratch_sim = Simulator(seed=0)
+    _scratch_generator = PlacementGenerator()
+
+
+def _prune(nodes: List[BeamNode], width: int) -> List[BeamNode]:
+    """Keep the best node of every distinct board, then the best width nodes."""
+    best: Dict[int, BeamNode] = {}
+    for node in nodes:
+        kept = best.get(node.zobrist)
+        if kept is None or node.score > kept.score:
+            best[node.zobrist] = node
+    return heapq.nlargest(width, best.values(), key=lambda node: node.score)
+
+
+def expand_nodes(nodes: Sequence[BeamNode], piece_type: int, weights: HeuristicWeights,
+                 width: int) -> Tuple[List[BeamNode], int]:
+    """
+    Place a piece in every reachable way on every board of a beam.
+    
+    Placements that top out are discarded.
+    
+    Args:
+        nodes: Boards to expand
+        piece_type: Piece placed on them
+        weights: Weights of the heuristic
+        width: Number of children to keep
+    
+    Returns:
+        The best children and the number of placements evaluated
+    """
+    if _scratch_sim is None:
+        _init_scratch()
+    sim = _scratch_sim
+    board = sim.board
+    children = []
+    evaluated = 0
+    for node in nodes:
+        board.load(node.rows, node.heights, node.column_counts, node.zobrist)
+        for placement in _scratch_generator.placements(board, piece_type):
+            sim.state = _PLAYING
+            sim.piece_type = piece_type
+            sim.orientation, sim.x, sim.y = placement.orientation, placement.x, placement.y
+            lines = node.lines + sim.lock()
+            evaluated += 1
+            if sim.state == _PLAYING:
+                children.append(BeamNode(
+                    score=evaluate(board.profile, lines, weights),
+                    lines=lines,
+                    root=node.root or placement,
+                    rows=tuple(board.rows),
+                    heights=tuple(board.heights),
+                    column_counts=tuple(board.column_counts),
+                    zobrist=board.zobrist,
+                ))
+            board.load(node.rows, node.heights, node.column_counts, node.zobrist)
+    return _prune(children, width), evaluated
+
+
+def preview_pieces(game: Union[GameCore, Simulator], preview: int = 1) -> List[int]:
+    """
+    Get the current piece type followed by the previewed ones.
+    
+    The games show the next piece only; the pieces after it are still
+    hidden in the random stream and are never looked at.
+    
+    Args:
+        game: Game being played
+        preview: Number of upcoming pieces known, 1 (the next piece)
+    
+    Returns:
+        The piece types, current first; empty once the game is over
+    
+    Raises:
+        ValueError: If more pieces are asked for than the game shows
+    """
+    if preview > 1:
+        raise ValueError(f"Only the next piece is visible, cannot preview {preview}")
+    if game.state != GAME_STATES["PLAYING"]:
+        return []
+    current = game.piece_type if isinstance(game, Simulator) else game.current_piece.piece_type
+    return [current, game.next_piece_type]
+
+
+class BeamSearch:
+    """
+    Multi-piece lookahead planner.
+    
+    Use it as a context manager, or call ``close`` when done, so the
+    worker processes are stopped.
+    """
+    
+    def __init__(self, weights: HeuristicWeights = DEFAULT_WEIGHTS,
+                 beam_width: int = DEFAULT_BEAM_WIDTH, workers: Optional[int] = 0):
+        """
+        Initialize the planner.
+        
+        Args:
+            weights: Weights of the heuristic
+            beam_width: Number of boards kept at every level
+            workers: Number of worker processes; 0 to expand in the
+                calling process, None for one per CPU
+        """
+        self.weights = weights
+        self.beam_width = beam_width
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self._pool: Optional[Executor] = None
+    
+    def _expand(self, beam: List[BeamNode], piece_type: int) -> Tuple[List[BeamNode], int]:
+        """Expand a level, across the workers when there is more than one board."""
+        if self.workers < 1 or len(beam) < 2:
+            return expand_nodes(beam, piece_type, self.weights, self.beam_width)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_scratch)
+        shares = min(self.workers, len(beam))
+        chunks = [beam[index::shares] for index in range(shares)]
+        children: List[BeamNode] = []
+        evaluated = 0
+        for chunk_children, chunk_evaluated in self._pool.map(
+                expand_nodes, chunks, repeat(piece_type), repeat(self.weights),
+                repeat(self.beam_width)):
+            children.extend(chunk_children)
+            evaluated += chunk_evaluated
+        return _prune(children, self.beam_width), evaluated
+    
+    def search(self, board: Board, pieces: Sequence[int]) -> SearchResult:
+        """
+        Plan the placement of the first piece of a sequence.
+        
+        Args:
+            board: Settled cells, e.g. ``Simulator.board`` or ``GameCore.matrix``
+            pieces: Types of the pieces to place in turn, current first;
+                the search looks one level deep per piece
+        
+        Returns:
+            The best first placement, with None if every placement of the
+            first piece tops out
+        """
+        start = time.perf_counter()
+        beam = [BeamNode(0.0, 0, None, tuple(board.rows), tuple(board.heights),
+                         tuple(board.column_counts), board.zobrist)]
+        nodes = 0
+        depth = 0
+        for piece_type in pieces:
+            children, evaluated = self._expand(beam, piece_type)
+            nodes += evaluated
+            if not children:
+                break
+            beam = children
+            depth += 1
+        best = beam[0] if depth else None
+        return SearchResult(
+            placement=best.root if best else None,
+            score=best.score if best else float("-inf"),
+            depth=depth,
+            nodes=nodes,
+            seconds=time.perf_counter() - start,
+        )
+    
+    def search_game(self, game: Union[GameCore, Simulator], depth: int = DEFAULT_DEPTH) -> SearchResult:
+        """
+        Plan the current piece of a game, looking ahead with the preview.
+        
+        Args:
+            game: Game being played, with its piece at the spawn
+            depth: Number of pieces placed per line of search, the
+                current piece included; at most 2
+        
+        Returns:
+            The outcome of the search, without a placement once the game
+            is over
+        
+        Raises:
+            ValueError: If depth goes past the visible next piece
+        """
+        board = game.board if isinstance(game, Simulator) else game.matrix
+        return self.search(board, preview_pieces(game, max(1, depth - 1))[:depth])
+    
+    def close(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
+    def __enter__(self) -> 'BeamSearch':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def __repr__(self) -> str:
+        """String representation of the planner."""
+        return f"BeamSearch(beam_width={self.beam_width}, workers={self.workers})"
+
+
+def play_beam_game(planner: BeamSearch, sim: Simulator, seed: int, depth: int = DEFAULT_DEPTH,
+                   max_pieces: Optional[int] = None) -> Tuple[GameResult, int, float]:
+    """
+    Play one headless game with a beam-search planner.
+    
+    Args:
+        planner: Planner choosing the placements
+        sim: Simulator to reset and play on
+        seed: Seed of the piece sequence
+        depth: Number of pieces looked at per move, the current one included
+        max_pieces: Stop after this many pieces, None to play until top-out
+    
+    Returns:
+        The outcome of the game, the number of placements evaluated and
+        the seconds spent searching
+    """
+    sim.reset(seed)
+    nodes = 0
+    seconds = 0.0
+    while sim.state == _PLAYING:
+        if max_pieces is not None and sim.pieces_placed >= max_pieces:
+            break
+        result = planner.search_game(sim, depth)
+        nodes += result.nodes
+        seconds += result.seconds
+        if result.placement is None:
+            break
+        placement = result.placement
+        sim.orientation, sim.x, sim.y = placement.orientation, placement.x, placement.y
+        sim.lock()
+    return GameResult(seed, sim.score, sim.lines_cleared, sim.pieces_placed), nodes, seconds
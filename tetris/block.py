@@ -6,58 +6,74 @@ blocks that make up Tetris pieces.
 """
 
 import random
-from typing import Tuple, TYPE_CHECKING
+from typing import Optional, Tuple, TYPE_CHECKING
 
 from .constants import (
     BLOCK_SIZE, BLOCK_RENDER_SIZE, BLOCK_OFFSET_X, BLOCK_OFFSET_Y,
-    MIN_COLOR_VALUE, MAX_COLOR_VALUE, GRID_WIDTH, GRID_HEIGHT
+    MIN_COLOR_VALUE, MAX_COLOR_VALUE, COLOR_STEP, GRID_WIDTH, GRID_HEIGHT
 )
 
 if TYPE_CHECKING:
     from .game import TetrisGame
 
+# Shared block colors, so blocks reference a palette entry instead of
+# each owning a freshly built tuple
+COLOR_PALETTE: Tuple[Tuple[int, int, int], ...] = tuple(
+    (red, green, blue)
+    for red in range(MIN_COLOR_VALUE, MAX_COLOR_VALUE + 1, COLOR_STEP)
+    for green in range(MIN_COLOR_VALUE, MAX_COLOR_VALUE + 1, COLOR_STEP)
+    for blue in range(MIN_COLOR_VALUE, MAX_COLOR_VALUE + 1, COLOR_STEP)
+)
+
 
 class Block:
     """
     Represents a single block in the Tetris game.
     
     Each block has a position, color, and can move within the game grid.
-    Blocks are the building components of Tetris pieces.
+    Blocks are the building components of Tetris pieces. They are kept
+    small because a board holds many of them: no instance dictionary,
+    no reference back to the game and a shared palette color.
     """
     
-    def __init__(self, game: 'TetrisGame', x: int, y: int):
+    __slots__ = ("x", "y", "color")
+    
+    def __init__(self, game: 'TetrisGame', x: int, y: int,
+                 rng: Optional[random.Random] = None,
+                 color: Optional[Tuple[int, int, int]] = None):
         """
-        Initialize a new block.
+        Initialize a new block and register it with the game.
         
         Args:
-            game: Reference to the main game instance
+            game: Game instance the block is added to
             x: X coordinate in the game grid
             y: Y coordinate in the game grid
+            rng: Color generator, None for the global random module
+            color: Color of the block, None to pick a random one
         """
-        self.game = game
         self.x = x
         self.y = y
-        self.color = self._generate_random_color()
-        self.game.add_block(self)
+        self.color = color if color is not None else self._generate_random_color(rng)
+        game.add_block(self)
     
-    def _generate_random_color(self) -> Tuple[int, int, int]:
+    def _generate_random_color(self, rng: Optional[random.Random] = None) -> Tuple[int, int, int]:
         """
-        Generate a random RGB color for the block.
+        Pick a random RGB color for the block from the shared palette.
+        
+        Args:
+            rng: Color generator, None for the global random module
         
         Returns:
             Tuple of RGB values
         """
-        return (
-            random.randint(MIN_COLOR_VALUE, MAX_COLOR_VALUE),
-            random.randint(MIN_COLOR_VALUE, MAX_COLOR_VALUE),
-            random.randint(MIN_COLOR_VALUE, MAX_COLOR_VALUE)
-        )
+        return (rng or random).choice(COLOR_PALETTE)
     
-    def can_move_to(self, x: int, y: int) -> bool:
+    def can_move_to(self, game: 'TetrisGame', x: int, y: int) -> bool:
         """
         Check if the block can move to the specified position.
         
         Args:
+            game: Game instance holding the block
             x: Target X coordinate
             y: Target Y coordinate
             
@@ -69,23 +85,24 @@ class Block:
             return False
         
         # Check collision with existing blocks
-        if self.game.is_position_occupied(x, y):
+        if game.is_position_occupied(x, y):
             return False
         
         return True
     
-    def move_to(self, x: int, y: int) -> bool:
+    def move_to(self, game: 'TetrisGame', x: int, y: int) -> bool:
         """
         Move the block to the specified position if possible.
         
         Args:
+            game: Game instance holding the block
             x: Target X coordinate
             y: Target Y coordinate
             
         Returns:
             True if the move was successful, False otherwise
         """
-        if self.can_move_to(x, y):
+        if self.can_move_to(game, x, y):
             self.x = x
             self.y = y
             return True
@@ -103,9 +120,9 @@ class Block:
         """Get the size for rendering the block."""
         return (BLOCK_RENDER_SIZE, BLOCK_RENDER_SIZE)
     
-    def destroy(self) -> None:
+    def destroy(self, game: 'TetrisGame') -> None:
         """Remove this block from the game."""
-        self.game.remove_block(self)
+        game.remove_block(self)
     
     def get_color(self) -> Tuple[int, int, int]:
         """Get the block's color."""
@@ -0,0 +1,401 @@
+"""
+Board module for the Tetris game.
+
+This module contains the Board class which stores the settled cells of
+the game grid as one integer bitmask per row, so that line and collision
+checks are single mask operations instead of loops over the grid.
+"""
+
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .constants import GRID_WIDTH, GRID_HEIGHT, MATRIX_WIDTH, MATRIX_HEIGHT
+from .zobrist import CELL_KEYS, hash_cells
+
+# Mask with one bit set for every column of the visible grid
+FULL_ROW_MASK = (1 << GRID_WIDTH) - 1
+
+# Column indices of the set bits of every row mask of the visible grid
+_MASK_COLUMNS = tuple(
+    tuple(x for x in range(GRID_WIDTH) if mask >> x & 1) for mask in range(FULL_ROW_MASK + 1)
+)
+
+# Board implementations selectable at game construction
+BOARD_BACKENDS = ("bitboard", "numpy")
+
+
+class SurfaceProfile(NamedTuple):
+    """
+    Read-only summary of the board surface.
+    
+    Column heights count from the floor to the topmost occupied cell,
+    holes are the empty cells below it, and a well is how far a column
+    sits below the lower of its neighbours (the walls count as full
+    height).
+    """
+    heights: Tuple[int, ...]
+    holes: Tuple[int, ...]
+    wells: Tuple[int, ...]
+    aggregate_height: int
+    max_height: int
+    total_holes: int
+    bumpiness: int
+
+
+class Board:
+    """
+    Row-bitmask representation of the game matrix.
+    
+    Row ``y`` is stored as an int whose bit ``x`` is set when the cell
+    (x, y) is occupied. Indexing the board as ``board[x][y]`` gives the
+    column-major view of the original list-of-lists matrix, so existing
+    callers can keep reading and writing single cells.
+    
+    The board also maintains the height and the number of occupied
+    cells of every column of the visible grid, so the landing row of a
+    piece and the surface profile are known without scanning the grid,
+    and the Zobrist hash of the visible grid in ``zobrist``.
+    """
+    
+    def __init__(self):
+        """Initialize an empty board."""
+        self._rows: List[int] = [0] * MATRIX_HEIGHT
+        self.heights: List[int] = [0] * GRID_WIDTH
+        self.column_counts: List[int] = [0] * GRID_WIDTH
+        self.zobrist = 0
+        self._profile: Optional[SurfaceProfile] = None
+    
+    @property
+    def rows(self) -> List[int]:
+        """Row masks of the board, bit x of row y set when (x, y) is occupied."""
+        return self._rows
+    
+    @rows.setter
+    def rows(self, rows: List[int]) -> None:
+        self._rows = list(rows)
+        self._update_profile()
+    
+    def load(self, rows: Iterable[int], heights: Iterable[int],
+             column_counts: Iterable[int], zobrist: Optional[int] = None) -> None:
+        """
+        Replace the contents of the board with a saved copy.
+        
+        Unlike assigning ``rows``, the column aggregates are taken as
+        given instead of being recomputed.
+        
+        Args:
+            rows: Row masks, as in ``rows``
+            heights: Column heights matching the rows
+            column_counts: Occupied cells per column matching the rows
+            zobrist: Hash of the rows, None to compute it
+        """
+        self._rows = list(rows)
+        self.heights = list(heights)
+        self.column_counts = list(column_counts)
+        self.zobrist = hash_cells(self.occupied_cells()) if zobrist is None else zobrist
+        self._profile = None
+    
+    def get(self, x: int, y: int) -> int:
+        """
+        Get the value of a cell inside the matrix bounds.
+        
+        Args:
+            x: X coordinate
+            y: Y coordinate
+        
+        Returns:
+            1 if the cell is occupied, 0 otherwise
+        """
+        return (self._rows[y] >> x) & 1
+    
+    def set(self, x: int, y: int, value: int) -> None:
+        """
+        Set the value of a cell inside the matrix bounds.
+        
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            value: 1 to occupy the cell, 0 to free it
+        """
+        old = (self._rows[y] >> x) & 1
+        if value:
+            self._rows[y] |= 1 << x
+        else:
+            self._rows[y] &= ~(1 << x)
+        self._cell_changed(x, y, old, 1 if value else 0)
+    
+    def clear(self) -> None:
+        """Free every cell of the board."""
+        self._rows = [0] * MATRIX_HEIGHT
+        self.heights = [0] * GRID_WIDTH
+        self.column_counts = [0] * GRID_WIDTH
+        self.zobrist = 0
+        self._profile = None
+    
+    def fill_row_mask(self, y: int, mask: int) -> None:
+        """
+        Occupy several cells of a row at once.
+        
+        Equivalent to setting every cell of the mask, with one row update
+        and the column aggregates adjusted for the newly occupied cells.
+        
+        Args:
+            y: Row index inside the matrix bounds
+            mask: Cells to occupy, bit x set for column x
+        """
+        new = mask & ~self._rows[y]
+        self._rows[y] |= mask
+        if y >= GRID_HEIGHT:
+            return
+        new &= FULL_ROW_MASK
+        if new:
+            self._profile = None
+            heights = self.heights
+            counts = self.column_counts
+            keys = CELL_KEYS[y]
+            zobrist = self.zobrist
+            height = GRID_HEIGHT - y
+            for x in _MASK_COLUMNS[new]:
+                counts[x] += 1
+                zobrist ^= keys[x]
+                if height > heights[x]:
+                    heights[x] = height
+            self.zobrist = zobrist
+    
+    def remove_rows(self, ys: Iterable[int]) -> None:
+        """
+        Remove rows and shift the rows above them down.
+        
+        Args:
+            ys: Indices of the rows to remove
+        """
+        removed = set(ys)
+        kept = [row for y, row in enumerate(self._rows[:GRID_HEIGHT]) if y not in removed]
+        counts = self.column_counts
+        for y in removed:
+            for x in _MASK_COLUMNS[self._rows[y] & FULL_ROW_MASK]:
+                counts[x] -= 1
+        self._rows[:GRID_HEIGHT] = [0] * (GRID_HEIGHT - len(kept)) + kept
+        # Every cell above the removed rows moved, so rehash the grid
+        self.zobrist = hash_cells(self.occupied_cells())
+        self._update_heights()
+    
+    def _cell_changed(self, x: int, y: int, old: int, value: int) -> None:
+        """Keep the column aggregates in step with a single cell change."""
+        if old == value or x >= GRID_WIDTH or y >= GRID_HEIGHT:
+            return
+        self._profile = None
+        self.column_counts[x] += 1 if value else -1
+        self.zobrist ^= CELL_KEYS[y][x]
+        height = GRID_HEIGHT - y
+        if value:
+            if height > self.heights[x]:
+                self.heights[x] = height
+        elif height == self.heights[x]:
+            # The top cell was freed; look for the next one down
+            rows = self.rows
+            bit = 1 << x
+            self.heights[x] = next(
+                (GRID_HEIGHT - row_y for row_y in range(y + 1, GRID_HEIGHT) if rows[row_y] & bit), 0)
+    
+    def _update_heights(self) -> None:
+        """Recompute the height of every column from the rows."""
+        heights = [0] * GRID_WIDTH
+        rows = self.rows
+        seen = 0
+        for y in range(GRID_HEIGHT):
+            new = rows[y] & FULL_ROW_MASK & ~seen
+            if new:
+                seen |= new
+                while new:
+                    bit = new & -new
+                    heights[bit.bit_length() - 1] = GRID_HEIGHT - y
+                    new ^= bit
+                if seen == FULL_ROW_MASK:
+                    break
+        self.heights = heights
+        self._profile = None
+    
+    def _update_profile(self) -> None:
+        """Recompute every column aggregate from the rows."""
+        counts = [0] * GRID_WIDTH
+        for y in range(GRID_HEIGHT):
+            for x in _MASK_COLUMNS[self._rows[y] & FULL_ROW_MASK]:
+                counts[x] += 1
+        self.column_counts = counts
+        self.zobrist = hash_cells(self.occupied_cells())
+        self._update_heights()
+    
+    @property
+    def profile(self) -> SurfaceProfile:
+        """
+        Surface profile of the board.
+        
+        Built from the maintained column heights and counts on first
+        access after a change and cached until the next one.
+        """
+        if self._profile is None:
+            heights = self.heights
+            holes = tuple(height - count for height, count in zip(heights, self.column_counts))
+            walled = [GRID_HEIGHT] + heights + [GRID_HEIGHT]
+            wells = tuple(
+                max(0, min(walled[x], walled[x + 2]) - walled[x + 1]) for x in range(GRID_WIDTH)
+            )
+            self._profile = SurfaceProfile(
+                heights=tuple(heights),
+                holes=holes,
+                wells=wells,
+                aggregate_height=sum(heights),
+                max_height=max(heights),
+                total_holes=sum(holes),
+                bumpiness=sum(abs(a - b) for a, b in zip(heights, heights[1:])),
+            )
+        return self._profile
+    
+    def full_rows(self) -> List[int]:
+        """Get the indices of the full rows of the visible grid, top to bottom."""
+        rows = self._rows
+        return [y for y in range(GRID_HEIGHT) if rows[y] & FULL_ROW_MASK == FULL_ROW_MASK]
+    
+    def is_row_full(self, y: int) -> bool:
+        """Check if every column of the visible grid is occupied in a row."""
+        return self._rows[y] & FULL_ROW_MASK == FULL_ROW_MASK
+    
+    def occupied_cells(self) -> Iterator[Tuple[int, int]]:
+        """Iterate over the occupied (x, y) cells of the visible grid, row by row."""
+        rows = self.rows
+        for y in range(GRID_HEIGHT):
+            for x in _MASK_COLUMNS[rows[y] & FULL_ROW_MASK]:
+                yield x, y
+    
+    def is_row_empty(self, y: int) -> bool:
+        """Check if no column of the visible grid is occupied in a row."""
+        return self._rows[y] & FULL_ROW_MASK == 0
+    
+    def collides(self, cells: Iterable[Tuple[int, int]]) -> bool:
+        """
+        Check if any of the given cells is blocked.
+        
+        Cells above the visible area (negative y) are always free, cells
+        outside the grid walls or below the floor are always blocked.
+        
+        Args:
+            cells: Iterable of (x, y) grid positions
+        
+        Returns:
+            True if at least one cell is blocked, False otherwise
+        """
+        rows = self._rows
+        for x, y in cells:
+            if x < 0 or x >= GRID_WIDTH or y >= GRID_HEIGHT:
+                return True
+            if y >= 0 and rows[y] >> x & 1:
+                return True
+        return False
+    
+    def drop_distance(self, cells: List[Tuple[int, int]]) -> int:
+        """
+        Get how many rows a group of cells can fall before landing.
+        
+        When every cell is above the surface of its column, the answer
+        comes straight from the column heights. Cells tucked under an
+        overhang fall back to probing the rows below.
+        
+        Args:
+            cells: (x, y) grid positions of a piece that fits where it is
+        
+        Returns:
+            Number of free rows below the cells
+        """
+        heights = self.heights
+        distance = GRID_HEIGHT
+        for x, y in cells:
+            free = GRID_HEIGHT - heights[x] - 1 - y
+            if free < 0:
+                break
+            if free < distance:
+                distance = free
+        else:
+            return distance
+        
+        distance = 0
+        while not self.collides([(x, y + distance + 1) for x, y in cells]):
+            distance += 1
+        return distance
+    
+    def __len__(self) -> int:
+        """Number of columns in the column-major matrix view."""
+        return MATRIX_WIDTH
+    
+    def __getitem__(self, x: int) -> '_BoardColumn':
+        """Get a column of the column-major matrix view."""
+        if x < 0:
+            x += MATRIX_WIDTH
+        if not 0 <= x < MATRIX_WIDTH:
+            raise IndexError("board column index out of range")
+        return _BoardColumn(self, x)
+    
+    def __iter__(self) -> Iterator['_BoardColumn']:
+        """Iterate over the columns of the column-major matrix view."""
+        for x in range(MATRIX_WIDTH):
+            yield _BoardColumn(self, x)
+    
+    def __repr__(self) -> str:
+        """String representation of the board."""
+        filled = sum(bin(row & FULL_ROW_MASK).count("1") for row in self._rows)
+        return f"Board(cells={filled})"
+
+
+def create_board(backend: str = "bitboard") -> Board:
+    """
+    Create an empty board for the given backend.
+    
+    Args:
+        backend: "bitboard" for int row masks, "numpy" for a NumPy array
+    
+    Returns:
+        Empty board
+    
+    Raises:
+        ValueError: If the backend is unknown
+        ImportError: If the backend needs a package that is not installed
+    """
+    if backend == "bitboard":
+        return Board()
+    if backend == "numpy":
+        try:
+            from .numpy_board import NumpyBoard
+        except ImportError as error:
+            raise ImportError("The numpy board backend requires numpy to be installed") from error
+        return NumpyBoard()
+    raise ValueError(f"Unknown board backend: {backend!r} (expected one of {BOARD_BACKENDS})")
+
+
+class _BoardColumn:
+    """Single column of a Board, indexable like a list of cell values."""
+    
+    __slots__ = ("_board", "_x")
+    
+    def __init__(self, board: Board, x: int):
+        self._board = board
+        self._x = x
+    
+    def _normalize(self, y: int) -> int:
+        if y < 0:
+            y += MATRIX_HEIGHT
+        if not 0 <= y < MATRIX_HEIGHT:
+            raise IndexError("board row index out of range")
+        return y
+    
+    def __len__(self) -> int:
+        return MATRIX_HEIGHT
+    
+    def __getitem__(self, y: int) -> int:
+        return self._board.get(self._x, self._normalize(y))
+    
+    def __setitem__(self, y: int, value: int) -> None:
+        self._board.set(self._x, self._normalize(y), value)
+    
+    def __iter__(self) -> Iterator[int]:
+        x = self._x
+        for row in self._board.rows:
+            yield (row >> x) & 1
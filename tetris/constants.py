@@ -38,6 +38,7 @@ BACKGROUND_COLOR = (0, 0, 0)
 BORDER_COLOR = (255, 255, 255)
 MIN_COLOR_VALUE = 100
 MAX_COLOR_VALUE = 255
+COLOR_STEP = 31
 
 # Piece types
 PIECE_TYPES = {
@@ -61,6 +62,10 @@ PIECE_CONFIGURATIONS = {
     6: [(0, -3), (0, -2), (0, -1), (0, 0)]   # I
 }
 
+# Center of a newly spawned piece
+SPAWN_X = 5
+SPAWN_Y = 0
+
 # Movement directions
 DIRECTIONS = {
     "LEFT": (-1, 0),
@@ -69,6 +74,23 @@ DIRECTIONS = {
     "UP": (0, -1)
 }
 
+# Rotation directions (quarter turns)
+ROTATIONS = {
+    "CW": 1,
+    "CCW": -1
+}
+
+# Player actions understood by the game core
+ACTIONS = {
+    "LEFT": "left",
+    "RIGHT": "right",
+    "DOWN": "down",
+    "ROTATE_CW": "rotate_cw",
+    "ROTATE_CCW": "rotate_ccw",
+    "HARD_DROP": "hard_drop",
+    "SONIC_DROP": "sonic_drop"
+}
+
 # Game states
 GAME_STATES = {
     "PLAYING": "playing",
@@ -0,0 +1,682 @@
+"""
+Headless game core for the Tetris game.
+
+This module contains the GameCore class which holds the board, pieces,
+scoring and game state machine. It does not depend on pygame, so games
+can be simulated without initialising a display.
+"""
+
+import itertools
+from typing import Dict, Iterator, KeysView, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+from .block import COLOR_PALETTE, Block
+from .board import Board, SurfaceProfile, create_board
+from .piece import Piece
+from .registry import BlockRegistry
+from .rng import GameRandom
+from .constants import (
+    GRID_WIDTH, GRID_HEIGHT, MATRIX_WIDTH, MATRIX_HEIGHT,
+    ACTIONS, GAME_STATES
+)
+from .rotation import ROTATION_TABLES
+from .zobrist import state_hash
+
+# Palette index of every block color, for packing colors into snapshots
+_COLOR_INDEX = {color: index for index, color in enumerate(COLOR_PALETTE)}
+
+# Source of board versions, shared by all games so that a version names
+# one set of settled blocks whichever game it was taken from
+_board_versions = itertools.count(1)
+
+if TYPE_CHECKING:
+    from .replay import Replay, ReplayRecorder
+
+
+class StepResult(NamedTuple):
+    """
+    Events of one game step.
+    
+    ``moved`` tells whether the action changed the piece, ``locked``
+    whether a piece was settled during the step, and ``lines`` and
+    ``score`` are what the step added to the totals.
+    """
+    moved: bool
+    locked: bool
+    lines: int
+    score: int
+    game_over: bool
+
+
+class GameSnapshot(NamedTuple):
+    """
+    Immutable copy of the full state of a game.
+    
+    ``rows`` are the matrix row masks, with the column heights, counts
+    and Zobrist hash of the board so they need not be recomputed.
+    ``colors`` holds one palette index per block, for the settled cells
+    in row order and then for the current piece; it is empty for games
+    without blocks. ``piece_type`` is -1 when there is no current piece.
+    ``rng_state`` is the state of the game's random streams, in the form
+    its own game class uses, so a snapshot is restored into the same
+    kind of game it was taken from. ``board_version`` names the settled
+    blocks of a GameCore, so restoring over unchanged blocks skips
+    rebuilding them, and ``recorded_events`` is the length of its replay
+    recording; both are 0 for games without blocks.
+    """
+    rows: Tuple[int, ...]
+    heights: Tuple[int, ...]
+    column_counts: Tuple[int, ...]
+    zobrist: int
+    colors: bytes
+    piece_type: int
+    orientation: int
+    x: int
+    y: int
+    next_piece_type: int
+    score: int
+    lines_cleared: int
+    state: str
+    tick: int
+    pieces_placed: int
+    rng_state: tuple
+    board_version: int = 0
+    recorded_events: int = 0
+
+
+class GameCore:
+    """
+    Rules and state of a Tetris game, independent of rendering and input.
+    
+    This class handles the game matrix, piece management, line clearing,
+    collision detection, and game state management. Players drive it
+    through abstract actions (see ``ACTIONS``).
+    """
+    
+    def __init__(self, debug: bool = False, board_backend: str = "bitboard",
+                 seed: Optional[int] = None):
+        """
+        Initialize the game core.
+        
+        Args:
+            debug: Verify the matrix against the blocks on every update
+            board_backend: Matrix implementation, "bitboard" or "numpy"
+            seed: Seed of the piece and color streams, None for a random one
+        """
+        self.debug = debug
+        self.board_backend = board_backend
+        self.rng = GameRandom(seed)
+        
+        # Game state
+        self.state = GAME_STATES["PLAYING"]
+        self._registry = BlockRegistry()
+        self.current_piece: Optional['Piece'] = None
+        self.next_piece_type = self.rng.pieces.next()
+        self.score = 0
+        self.lines_cleared = 0
+        self.pieces_placed = 0
+        
+        # Frame counter and optional recorder of the inputs, for replays
+        self.tick = 0
+        self.recorder: Optional['ReplayRecorder'] = None
+        
+        # Game matrix for collision detection, one bitmask per row.
+        # It is maintained incrementally on piece lock and line clear;
+        # the dirty flag requests a full rebuild from the blocks.
+        self.matrix = self._initialize_matrix()
+        self._matrix_dirty = False
+        
+        # Version of the settled blocks, changed whenever they change, and
+        # their packed colors for the version they were packed at
+        self._board_version = next(_board_versions)
+        self._settled_colors = (0, b"")
+        # Board versions before and after the last lock and its piece,
+        # while that lock can be taken back by unsettling the piece
+        self._last_lock: Optional[Tuple[int, int, 'Piece']] = None
+        
+        # Create first piece
+        self._spawn_new_piece()
+    
+    def _initialize_matrix(self) -> Board:
+        """
+        Initialize the game matrix for collision detection.
+        
+        Returns:
+            Empty board, indexable as matrix[x][y] like the original 2D list
+        """
+        return create_board(self.board_backend)
+    
+    def _spawn_new_piece(self) -> None:
+        """Spawn a new piece at the top of the game area."""
+        piece_type = self.next_piece_type
+        self.next_piece_type = self.rng.pieces.next()
+        self.current_piece = Piece(self, piece_type, self.rng.colors)
+    
+    @property
+    def blocks(self) -> KeysView['Block']:
+        """Read-only view of all blocks in the game."""
+        return self._registry.view()
+    
+    def add_block(self, block: 'Block') -> None:
+        """Add a block to the game."""
+        self._registry.add(block)
+        self._board_changed()
+    
+    def remove_block(self, block: 'Block') -> None:
+        """Remove a block from the game."""
+        if self._registry.remove(block):
+            self._matrix_dirty = True
+            self._board_changed()
+    
+    def _board_changed(self) -> None:
+        """Give the board a new version after its blocks or matrix changed."""
+        self._board_version = next(_board_versions)
+    
+    def get_row_blocks(self, y: int) -> List['Block']:
+        """Get the settled blocks of a row."""
+        return self._registry.row(y)
+    
+    def _settled_blocks(self) -> Iterator['Block']:
+        """Iterate over the blocks that are not part of the current piece."""
+        piece_blocks = self.current_piece.blocks if self.current_piece else []
+        for block in self.blocks:
+            if block not in piece_blocks:
+                yield block
+    
+    def _index_blocks(self, blocks: List['Block']) -> None:
+        """Add settled blocks to the cell and row indexes."""
+        for block in blocks:
+            self._registry.settle(block)
+        self._board_changed()
+    
+    def _rebuild_occupancy(self) -> None:
+        """Rebuild the cell and row indexes from the settled blocks."""
+        self._registry.reindex(list(self._settled_blocks()))
+    
+    def is_position_occupied(self, x: int, y: int) -> bool:
+        """
+        Check if a position is occupied in the game matrix.
+        
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            
+        Returns:
+            True if position is occupied, False otherwise
+        """
+        if y < 0:
+            return False
+        if x < 0 or x >= MATRIX_WIDTH or y >= MATRIX_HEIGHT:
+            return True
+        return self.matrix.get(x, y) == 1
+    
+    def is_position_occupied_excluding_piece(self, x: int, y: int, piece: 'Piece') -> bool:
+        """
+        Check if a position is occupied, excluding blocks from a specific piece.
+        
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            piece: Piece to exclude from collision check
+            
+        Returns:
+            True if position is occupied, False otherwise
+        """
+        if y < 0:
+            return False
+        if x < 0 or x >= MATRIX_WIDTH or y >= MATRIX_HEIGHT:
+            return True
+        
+        # Check if a settled block that is not part of the piece is there
+        occupant = self._registry.occupant(x, y)
+        return occupant is not None and occupant not in piece.blocks
+    
+    def set_matrix_position(self, x: int, y: int, value: int) -> None:
+        """Set a position in the game matrix."""
+        if 0 <= x < MATRIX_WIDTH and 0 <= y < MATRIX_HEIGHT:
+            self.matrix.set(x, y, value)
+            self._board_changed()
+    
+    def get_matrix_value(self, x: int, y: int) -> int:
+        """Get the value at a position in the game matrix."""
+        if y < 0:
+            return 0
+        if x < 0 or x >= MATRIX_WIDTH or y >= MATRIX_HEIGHT:
+            return 1
+        return self.matrix.get(x, y)
+    
+    def clear_matrix(self) -> None:
+        """Clear the entire game matrix."""
+        self.matrix.clear()
+        self._board_changed()
+    
+    def _build_matrix_rows(self) -> List[int]:
+        """Build the matrix row masks from the settled block positions."""
+        rows = [0] * MATRIX_HEIGHT
+        for block in self._settled_blocks():
+            if 0 <= block.x < MATRIX_WIDTH and 0 <= block.y < MATRIX_HEIGHT:
+                rows[block.y] |= 1 << block.x
+        return rows
+    
+    def update_matrix(self) -> None:
+        """Rebuild the matrix from the current block positions."""
+        self.matrix.rows = self._build_matrix_rows()
+        self._rebuild_occupancy()
+        self._matrix_dirty = False
+        self._board_changed()
+    
+    def mark_matrix_dirty(self) -> None:
+        """Request a full matrix rebuild on the next update."""
+        self._matrix_dirty = True
+    
+    def check_matrix_consistency(self) -> bool:
+        """Check that the incrementally maintained matrix matches the blocks."""
+        if self.matrix.rows != self._build_matrix_rows():
+            return False
+        expected = {(block.x, block.y): block for block in self._settled_blocks()}
+        return self._registry.cell_map() == expected and self._registry.is_consistent()
+    
+    def is_line_full(self, y: int) -> bool:
+        """Check if a horizontal line is completely filled."""
+        if y < 0 or y >= GRID_HEIGHT:
+            return False
+        return self.matrix.is_row_full(y)
+    
+    def clear_line(self, y: int) -> None:
+        """Clear a specific line and move blocks above it down."""
+        # Remove settled blocks on this line and move the rows above down
+        self._registry.clear_row(y)
+        
+        # Apply the same shift to the matrix rows
+        self.matrix.remove_rows([y])
+        self._board_changed()
+        
+        self._score_line()
+    
+    def _score_line(self) -> None:
+        """Count one cleared line and add its score."""
+        self.lines_cleared += 1
+        self.score += 100 * self.lines_cleared  # Bonus for multiple lines
+    
+    def clear_full_lines(self) -> int:
+        """Clear all full lines and return the number of lines cleared."""
+        full_rows = self.matrix.full_rows()
+        if not full_rows:
+            return 0
+        
+        # Remove the blocks of every full row and drop the rows above in
+        # one pass, then do the same for the matrix
+        self._registry.clear_rows(full_rows)
+        self.matrix.remove_rows(full_rows)
+        self._board_changed()
+        
+        for _ in full_rows:
+            self._score_line()
+        
+        return len(full_rows)
+    
+    def is_game_over(self) -> bool:
+        """Check if the game is over (blocks reached the top)."""
+        return self.matrix.profile.max_height >= GRID_HEIGHT
+    
+    def move_current_piece_down(self) -> bool:
+        """
+        Move the current piece down one step.
+        
+        Returns:
+            True if the piece moved successfully, False if it collided
+        """
+        if not self.current_piece:
+            return False
+        
+        success = self.current_piece.move("DOWN")
+        
+        if self.current_piece.has_collided:
+            self._lock_current_piece()
+            if self.state == GAME_STATES["GAME_OVER"]:
+                return False
+        
+        return success
+    
+    def gravity_drop(self) -> bool:
+        """
+        Let gravity move the current piece down one row.
+        
+        Unlike the down action this is not a player input, but it has
+        the same effect and is recorded as a separate replay event.
+        
+        Returns:
+            True if the piece moved, False if it landed and was locked
+        """
+        if self.current_piece and self.state == GAME_STATES["PLAYING"] and self.recorder is not None:
+            self.recorder.record_gravity(self.tick)
+        return self.move_current_piece_down()
+    
+    def sonic_drop(self) -> int:
+        """
+        Drop the current piece to its landing row without locking it.
+        
+        The distance comes from the board's column heights, so the drop
+        costs the same from any height.
+        
+        Returns:
+            Number of rows the piece fell
+        """
+        if not self.current_piece:
+            return 0
+        
+        distance = self.matrix.drop_distance(self.current_piece.get_block_positions())
+        self.current_piece.drop(distance)
+        return distance
+    
+    def hard_drop(self) -> int:
+        """
+        Drop the current piece to its landing row and lock it immediately.
+        
+        Returns:
+            Number of rows the piece fell
+        """
+        if not self.current_piece:
+            return 0
+        
+        distance = self.sonic_drop()
+        self.current_piece.has_collided = True
+        self._lock_current_piece()
+        return distance
+    
+    def _lock_current_piece(self) -> None:
+        """Settle the landed piece, clear lines and spawn the next piece."""
+        # Register the piece's blocks. They are settled from here on, so
+        # detach the piece before line clearing treats them like any
+        # other block. Blocks above the matrix are dropped, as in the
+        # Simulator: the matrix has no row for them, and a line clear
+        # would otherwise move them into view behind its back.
+        piece = self.current_piece
+        version = self._board_version
+        piece.register_blocks()
+        for block in piece.blocks:
+            if block.y < 0:
+                self._registry.remove(block)
+        kept = [block for block in piece.blocks if block.y >= 0]
+        self._index_blocks(kept)
+        self.current_piece = None
+        self.pieces_placed += 1
+        cleared = self.clear_full_lines()
+        
+        if self.is_game_over():
+            self.state = GAME_STATES["GAME_OVER"]
+        else:
+            self._spawn_new_piece()
+        
+        # A lock that kept every block and cleared nothing is undone by
+        # unsettling the piece, which ``restore`` does instead of a rebuild
+        if not cleared and len(kept) == len(piece.blocks):
+            self._last_lock = (version, self._board_version, piece)
+    
+    def apply_action(self, action: str) -> bool:
+        """
+        Apply a player action to the current piece.
+        
+        Args:
+            action: One of the ``ACTIONS`` values
+            
+        Returns:
+            True if the piece moved, rotated or dropped, False otherwise
+        """
+        if not self.current_piece or self.state != GAME_STATES["PLAYING"]:
+            return False
+        if self.recorder is not None:
+            self.recorder.record(self.tick, action)
+        
+        if action == ACTIONS["DOWN"]:
+            return self.move_current_piece_down()
+        if action == ACTIONS["LEFT"]:
+            return self.current_piece.move("LEFT")
+        if action == ACTIONS["RIGHT"]:
+            return self.current_piece.move("RIGHT")
+        if action == ACTIONS["ROTATE_CW"]:
+            return self.current_piece.rotate("CW")
+        if action == ACTIONS["ROTATE_CCW"]:
+            return self.current_piece.rotate("CCW")
+        if action == ACTIONS["HARD_DROP"]:
+            self.hard_drop()
+            return True
+        if action == ACTIONS["SONIC_DROP"]:
+            return self.sonic_drop() > 0
+        return False
+    
+    def step(self, action: Optional[str] = None, gravity: bool = True) -> StepResult:
+        """
+        Advance the game by one tick without any clock.
+        
+        The action, if any, is applied first; then, if the piece is still
+        falling, gravity moves it down one row, locking it if it landed.
+        
+        Args:
+            action: One of the ``ACTIONS`` values, or None to only fall
+            gravity: Whether the tick includes a gravity drop
+            
+        Returns:
+            The events of the step
+        """
+        piece = self.current_piece
+        score, lines = self.score, self.lines_cleared
+        moved = self.apply_action(action) if action is not None else False
+        if gravity and self.current_piece is piece and self.state == GAME_STATES["PLAYING"]:
+            self.gravity_drop()
+        self.tick += 1
+        return StepResult(
+            moved=moved,
+            locked=self.current_piece is not piece,
+            lines=self.lines_cleared - lines,
+            score=self.score - score,
+            game_over=self.state == GAME_STATES["GAME_OVER"],
+        )
+    
+    def start_recording(self) -> 'ReplayRecorder':
+        """
+        Record the inputs of this game from now on.
+        
+        Call it on a fresh game: the replay starts from the seed, so
+        inputs applied before recording starts would be missing.
+        
+        Returns:
+            The recorder attached to the game
+        """
+        from .replay import ReplayRecorder  # Import here to avoid circular imports
+        
+        self.recorder = ReplayRecorder(self.rng.seed)
+        return self.recorder
+    
+    def get_replay(self) -> Optional['Replay']:
+        """Get the replay of the recorded inputs so far, if recording."""
+        if self.recorder is None:
+            return None
+        return self.recorder.finish(self.score, self.lines_cleared)
+    
+    def state_hash(self) -> int:
+        """
+        Get the Zobrist hash of the settled cells and the piece types.
+        
+        The board part is maintained incrementally as pieces lock and
+        lines clear. The position of the falling piece is not included,
+        so states compare equal at the spawn of a piece.
+        """
+        if self._matrix_dirty:
+            self.update_matrix()
+        piece_type = self.current_piece.piece_type if self.current_piece else -1
+        return state_hash(self.matrix.zobrist, piece_type, self.next_piece_type)
+    
+    def snapshot(self) -> GameSnapshot:
+        """
+        Capture the state of the game, to try moves and undo them.
+        
+        The colors of the settled blocks are packed once per board
+        version, so snapshots of an unchanged board share them.
+        
+        Returns:
+            Immutable value holding everything ``restore`` needs
+        """
+        if self._matrix_dirty:
+            self.update_matrix()
+        version = self._board_version
+        if self._settled_colors[0] != version:
+            occupant = self._registry.occupant
+            self._settled_colors = (version, bytes(
+                _COLOR_INDEX[occupant(x, y).color] for x, y in self.matrix.occupied_cells()))
+        colors = self._settled_colors[1]
+        piece = self.current_piece
+        if piece is None:
+            piece_type, orientation, x, y = -1, 0, 0, 0
+        else:
+            colors += bytes(_COLOR_INDEX[block.color] for block in piece.blocks)
+            piece_type, orientation = piece.piece_type, piece.orientation
+            x, y = piece.center_x, piece.center_y
+        return GameSnapshot(
+            rows=tuple(self.matrix.rows),
+            heights=tuple(self.matrix.heights),
+            column_counts=tuple(self.matrix.column_counts),
+            zobrist=self.matrix.zobrist,
+            colors=colors,
+            piece_type=piece_type,
+            orientation=orientation,
+            x=x,
+            y=y,
+            next_piece_type=self.next_piece_type,
+            score=self.score,
+            lines_cleared=self.lines_cleared,
+            state=self.state,
+            tick=self.tick,
+            pieces_placed=self.pieces_placed,
+            rng_state=self.rng.getstate(),
+            board_version=version,
+            recorded_events=len(self.recorder.events) if self.recorder is not None else 0,
+        )
+    
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """
+        Put the game back in the state captured by ``snapshot``.
+        
+        Settled blocks that have not changed since the snapshot are kept
+        as they are, and a lock made since the snapshot that cleared no
+        lines is taken back by unsettling its piece. Otherwise the
+        existing blocks are moved to the packed cells and recolored, and
+        blocks are only created or dropped to match the number of cells. Inputs recorded after the snapshot are
+        dropped from the replay recording, so moves undone during a
+        search do not end up in the replay.
+        
+        Args:
+            snapshot: State taken from a GameCore
+        """
+        last_lock = self._last_lock
+        self._last_lock = None
+        if self._matrix_dirty:
+            self._restore_settled_blocks(snapshot)
+        elif (last_lock is not None and last_lock[0] == snapshot.board_version
+                and last_lock[1] == self._board_version):
+            self._unlock(last_lock[2], snapshot)
+        elif (snapshot.board_version != self._board_version
+                or snapshot.rows != tuple(self.matrix.rows)):
+            self._restore_settled_blocks(snapshot)
+        self._restore_piece(snapshot)
+        self._board_version = snapshot.board_version
+        
+        self.next_piece_type = snapshot.next_piece_type
+        self.score = snapshot.score
+        self.lines_cleared = snapshot.lines_cleared
+        self.pieces_placed = snapshot.pieces_placed
+        self.state = snapshot.state
+        self.tick = snapshot.tick
+        # Restored last, since building a piece draws block colors
+        self.rng.setstate(snapshot.rng_state)
+        if self.recorder is not None:
+            del self.recorder.events[snapshot.recorded_events:]
+    
+    def _restore_settled_blocks(self, snapshot: GameSnapshot) -> None:
+        """Load the snapshot matrix and move the settled blocks to its cells."""
+        self.matrix.load(snapshot.rows, snapshot.heights, snapshot.column_counts,
+                         snapshot.zobrist)
+        self._matrix_dirty = False
+        spare = list(self._settled_blocks())
+        palette = COLOR_PALETTE
+        cells: Dict[int, Dict[int, Block]] = {}
+        row_y, row = -1, None
+        for (x, y), color in zip(self.matrix.occupied_cells(), snapshot.colors):
+            if spare:
+                block = spare.pop()
+                block.x = x
+                block.y = y
+                block.color = palette[color]
+            else:
+                block = Block(self, x, y, color=palette[color])
+            if y != row_y:
+                row_y, row = y, cells.setdefault(y, {})
+            row[x] = block
+        for block in spare:
+            self._registry.remove(block)
+        self._registry.load(cells)
+    
+    def _unlock(self, piece: 'Piece', snapshot: GameSnapshot) -> None:
+        """Take back the last lock, making its piece the current one again."""
+        if self.current_piece is not None:
+            for block in self.current_piece.blocks:
+                self._registry.remove(block)
+        for block in piece.blocks:
+            self._registry.unsettle(block)
+        self.current_piece = piece
+        self.matrix.load(snapshot.rows, snapshot.heights, snapshot.column_counts,
+                         snapshot.zobrist)
+    
+    def _restore_piece(self, snapshot: GameSnapshot) -> None:
+        """Move the current piece, creating or dropping it, to match the snapshot."""
+        piece = self.current_piece
+        if snapshot.piece_type < 0:
+            if piece is not None:
+                for block in piece.blocks:
+                    self._registry.remove(block)
+                self.current_piece = None
+            return
+        
+        if piece is None:
+            piece = self.current_piece = Piece(self, snapshot.piece_type, self.rng.colors)
+        piece.piece_type = snapshot.piece_type
+        piece.orientation = snapshot.orientation
+        piece.center_x, piece.center_y = snapshot.x, snapshot.y
+        piece.has_collided = False
+        offsets = ROTATION_TABLES[snapshot.piece_type][snapshot.orientation]
+        colors = snapshot.colors[-len(piece.blocks):]
+        for block, (dx, dy), color in zip(piece.blocks, offsets, colors):
+            block.x, block.y = snapshot.x + dx, snapshot.y + dy
+            block.color = COLOR_PALETTE[color]
+    
+    def _debug_print_matrix(self) -> None:
+        """Print the current game matrix for debugging."""
+        print("Game Matrix:")
+        for y in range(min(10, MATRIX_HEIGHT)):  # Print first 10 rows
+            row = self.matrix.rows[y]
+            cells = "".join(str((row >> x) & 1) for x in range(GRID_WIDTH))
+            print(f"Row {y}: {cells}")
+    
+    def update(self) -> None:
+        """Update game state."""
+        self.tick += 1
+        if self.state == GAME_STATES["PLAYING"]:
+            if self._matrix_dirty:
+                self.update_matrix()
+            if self.debug and not self.check_matrix_consistency():
+                raise RuntimeError("Game matrix is out of sync with the blocks")
+    
+    def get_state(self) -> str:
+        """Get the current game state."""
+        return self.state
+    
+    def get_score(self) -> int:
+        """Get the current score."""
+        return self.score
+    
+    def get_lines_cleared(self) -> int:
+        """Get the number of lines cleared."""
+        return self.lines_cleared
+    
+    def get_surface_profile(self) -> SurfaceProfile:
+        """Get the column heights, holes and wells of the settled blocks."""
+        return self.matrix.profile
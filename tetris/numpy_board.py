@@ -0,0 +1,159 @@
+"""
+NumPy board module for the Tetris game.
+
+This module contains the NumpyBoard class, an optional board backend
+that keeps the game matrix in a NumPy array so that full rows are found
+with one reduction and cleared rows are removed in one compaction.
+"""
+
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .board import Board
+from .constants import GRID_WIDTH, GRID_HEIGHT, MATRIX_WIDTH, MATRIX_HEIGHT
+from .zobrist import CELL_KEYS, hash_cells
+
+# Bit weight of every column, used to convert rows to and from int masks
+_COLUMN_BITS = np.left_shift(np.int64(1), np.arange(MATRIX_WIDTH, dtype=np.int64))
+
+
+class NumpyBoard(Board):
+    """
+    Game matrix stored as a (MATRIX_HEIGHT, MATRIX_WIDTH) uint8 array.
+    
+    The interface is the one of Board, including the ``rows`` list of
+    int masks, which is converted from and to the array on access.
+    """
+    
+    def __init__(self):
+        """Initialize an empty board."""
+        self.cells = np.zeros((MATRIX_HEIGHT, MATRIX_WIDTH), dtype=np.uint8)
+        self.heights: List[int] = [0] * GRID_WIDTH
+        self.column_counts: List[int] = [0] * GRID_WIDTH
+        self.zobrist = 0
+        self._profile = None
+    
+    @property
+    def rows(self) -> List[int]:
+        """Row masks of the board, bit x of row y set when (x, y) is occupied."""
+        return [int(mask) for mask in self.cells.astype(np.int64) @ _COLUMN_BITS]
+    
+    @rows.setter
+    def rows(self, rows: List[int]) -> None:
+        masks = np.asarray(rows, dtype=np.int64)[:, None]
+        self.cells = ((masks & _COLUMN_BITS) != 0).astype(np.uint8)
+        self._update_profile()
+    
+    def load(self, rows: Iterable[int], heights: Iterable[int],
+             column_counts: Iterable[int], zobrist: Optional[int] = None) -> None:
+        """Replace the contents of the board with a saved copy, as Board.load does."""
+        masks = np.asarray(list(rows), dtype=np.int64)[:, None]
+        self.cells = ((masks & _COLUMN_BITS) != 0).astype(np.uint8)
+        self.heights = list(heights)
+        self.column_counts = list(column_counts)
+        self.zobrist = hash_cells(self.occupied_cells()) if zobrist is None else zobrist
+        self._profile = None
+    
+    def get(self, x: int, y: int) -> int:
+        """Get the value of a cell inside the matrix bounds."""
+        return int(self.cells[y, x])
+    
+    def set(self, x: int, y: int, value: int) -> None:
+        """Set the value of a cell inside the matrix bounds."""
+        old = int(self.cells[y, x])
+        self.cells[y, x] = 1 if value else 0
+        self._cell_changed(x, y, old, 1 if value else 0)
+    
+    def clear(self) -> None:
+        """Free every cell of the board."""
+        self.cells.fill(0)
+        self._update_profile()
+    
+    def fill_row_mask(self, y: int, mask: int) -> None:
+        """Occupy several cells of a row at once."""
+        row = self.cells[y]
+        columns = np.flatnonzero(mask & _COLUMN_BITS)
+        new = columns[row[columns] == 0]
+        row[columns] = 1
+        if y >= GRID_HEIGHT:
+            return
+        new = new[new < GRID_WIDTH].tolist()
+        if new:
+            self._profile = None
+            keys = CELL_KEYS[y]
+            height = GRID_HEIGHT - y
+            for x in new:
+                self.column_counts[x] += 1
+                self.zobrist ^= keys[x]
+                if height > self.heights[x]:
+                    self.heights[x] = height
+    
+    def _cell_changed(self, x: int, y: int, old: int, value: int) -> None:
+        """Keep the column aggregates in step with a single cell change."""
+        if old == value or x >= GRID_WIDTH or y >= GRID_HEIGHT:
+            return
+        self._profile = None
+        self.column_counts[x] += 1 if value else -1
+        self.zobrist ^= CELL_KEYS[y][x]
+        height = GRID_HEIGHT - y
+        if value:
+            if height > self.heights[x]:
+                self.heights[x] = height
+        elif height == self.heights[x]:
+            # The top cell was freed; look for the next one down
+            below = self.cells[y + 1:GRID_HEIGHT, x]
+            self.heights[x] = GRID_HEIGHT - (y + 1 + int(below.argmax())) if below.any() else 0
+    
+    def occupied_cells(self) -> Iterator[Tuple[int, int]]:
+        """Iterate over the occupied (x, y) cells of the visible grid, row by row."""
+        ys, xs = np.nonzero(self.cells[:GRID_HEIGHT, :GRID_WIDTH])
+        return zip(xs.tolist(), ys.tolist())
+    
+    def full_rows(self) -> List[int]:
+        """Get the indices of the full rows of the visible grid, top to bottom."""
+        full = self.cells[:GRID_HEIGHT, :GRID_WIDTH].all(axis=1)
+        return np.flatnonzero(full).tolist()
+    
+    def remove_rows(self, ys: Iterable[int]) -> None:
+        """Remove rows and shift the rows above them down in one compaction."""
+        keep = np.ones(GRID_HEIGHT, dtype=bool)
+        keep[np.asarray(list(ys), dtype=np.intp)] = False
+        kept = self.cells[:GRID_HEIGHT][keep]
+        self.cells[:GRID_HEIGHT - len(kept)] = 0
+        self.cells[GRID_HEIGHT - len(kept):GRID_HEIGHT] = kept
+        self._update_profile()
+    
+    def _update_heights(self) -> None:
+        """Recompute the height of every column with one reduction."""
+        grid = self.cells[:GRID_HEIGHT, :GRID_WIDTH]
+        tops = grid.argmax(axis=0)
+        self.heights = np.where(grid.any(axis=0), GRID_HEIGHT - tops, 0).tolist()
+        self._profile = None
+    
+    def _update_profile(self) -> None:
+        """Recompute every column aggregate with array reductions."""
+        self.column_counts = self.cells[:GRID_HEIGHT, :GRID_WIDTH].sum(axis=0).tolist()
+        self.zobrist = hash_cells(self.occupied_cells())
+        self._update_heights()
+    
+    def is_row_full(self, y: int) -> bool:
+        """Check if every column of the visible grid is occupied in a row."""
+        return bool(self.cells[y, :GRID_WIDTH].all())
+    
+    def is_row_empty(self, y: int) -> bool:
+        """Check if no column of the visible grid is occupied in a row."""
+        return not self.cells[y, :GRID_WIDTH].any()
+    
+    def collides(self, cells: Iterable[Tuple[int, int]]) -> bool:
+        """Check if any of the given cells is blocked."""
+        for x, y in cells:
+            if x < 0 or x >= GRID_WIDTH or y >= GRID_HEIGHT:
+                return True
+            if y >= 0 and self.cells[y, x]:
+                return True
+        return False
+    
+    def __repr__(self) -> str:
+        """String representation of the board."""
+        return f"NumpyBoard(cells={int(self.cells[:, :GRID_WIDTH].sum())})"
@@ -0,0 +1,407 @@
+"""
+Perfect-clear solver for the Tetris game.
+
+Given a board and a known piece sequence, the solver looks for
+placements of a prefix of the sequence that leave the board empty. It
+searches depth-first over the reachable placements of each piece and
+keeps a branch only while the board can still be emptied:
+
+- Cell count: every piece adds 4 cells and every cleared line removes
+  GRID_WIDTH, so only some numbers of further pieces can empty the
+  board. Each of those gives a number of lines to clear, and that must
+  cover every non-empty row.
+- Column parity: give each cell +1 in an even column and -1 in an odd
+  one. A line clear lowers this balance by 1, because rows have an odd
+  width. A piece changes it by an even amount, limited by its shape. The
+  balance still needed must be even and within reach of the pieces left.
+- Walls: once the stack fits under the lines to clear, a column full up
+  to there cannot be crossed, so the empty cells between such columns
+  must be a multiple of 4.
+
+Boards that were searched without success are remembered by Zobrist
+hash and depth. In parallel mode the first levels are expanded in the
+calling process, and their subtrees are searched in worker processes
+until one of them finds a solution.
+"""
+
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from multiprocessing import Event
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .board import Board
+from .constants import GAME_STATES, GRID_WIDTH, GRID_HEIGHT, PIECE_CONFIGURATIONS
+from .placements import Placement, PlacementGenerator
+from .simulator import SHAPES, Simulator
+from .transposition import DEFAULT_CAPACITY, TranspositionTable
+
+# No perfect clear needs more pieces than the grid holds
+MAX_PIECES = GRID_WIDTH * GRID_HEIGHT // 4
+
+# Largest change of the column balance each piece type can make
+COLUMN_PARITY: Dict[int, int] = {
+    piece_type: max(abs(sum(1 if dx % 2 == 0 else -1 for dx, _ in shape.cells))
+                    for shape in shapes)
+    for piece_type, shapes in SHAPES.items()
+}
+
+_PLAYING = GAME_STATES["PLAYING"]
+_CELLS_PER_PIECE = len(PIECE_CONFIGURATIONS[0])
+
+# Nodes searched between two checks of the stop flag
+_STOP_CHECK_INTERVAL = 256
+
+_keys = random.Random(0xC1EA2)
+# Keys of the search depth, combined with the board hash in the memo
+_DEPTH_KEYS: Tuple[int, ...] = tuple(_keys.getrandbits(64) for _ in range(MAX_PIECES + 1))
+del _keys
+
+BoardState = Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...], int]
+
+
+class SolveResult(NamedTuple):
+    """Outcome of one solve."""
+    solution: Optional[Tuple[Placement, ...]]
+    nodes: int
+    seconds: float
+    
+    @property
+    def solved(self) -> bool:
+        """Whether a perfect clear was found."""
+        return self.solution is not None
+
+
+def _board_state(board: Board) -> BoardState:
+    """Copy what Board.load needs to rebuild a board."""
+    return tuple(board.rows), tuple(board.heights), tuple(board.column_counts), board.zobrist
+
+
+def column_balance(column_counts: Sequence[int]) -> int:
+    """Get the cells in even columns minus the cells in odd columns."""
+    return sum(column_counts[0::2]) - sum(column_counts[1::2])
+
+
+def wall_segments_fit(column_counts: Sequence[int], lines: int) -> bool:
+    """
+    Check that the empty cells between full columns come in whole pieces.
+    
+    With every cell in the bottom rows that are to be cleared, a column
+    that is full up to there can no longer be crossed, so the empty cells
+    on each side of it must be filled by whole pieces of their own.
+    
+    Args:
+        column_counts: Cells of every column, all at most lines high
+        lines: Number of lines still to clear
+    """
+    empty = 0
+    for count in column_counts:
+        if count == lines:
+            if empty % _CELLS_PER_PIECE:
+                return False
+        else:
+            empty += lines - count
+    return empty % _CELLS_PER_PIECE == 0
+
+
+class _Search:
+    """Depth-first search state of one process."""
+    
+    def __init__(self, capacity: int, stop=None):
+        self.sim = Simulator(seed=0)
+        self.generator = PlacementGenerator(capacity)
+        self.failed: TranspositionTable[Tuple[int, ...]] = TranspositionTable(capacity)
+        self.stop = stop
+        self.nodes = 0
+        self.stopped = False
+        self.pieces: Tuple[int, ...] = ()
+        self.parity_sums: List[int] = [0]
+    
+    def prepare(self, pieces: Sequence[int]) -> None:
+        """Set the piece sequence, dropping the memo of another sequence."""
+        pieces = tuple(pieces[:MAX_PIECES])
+        if pieces != self.pieces:
+            self.pieces = pieces
+            self.failed.clear()
+            self.parity_sums = [0]
+            for piece_type in pieces:
+                self.parity_sums.append(self.parity_sums[-1] + COLUMN_PARITY[piece_type])
+        self.nodes = 0
+        self.stopped = False
+    
+    def feasible(self, depth: int) -> bool:
+        """Check whether the board can still be emptied by the pieces from depth on."""
+        board = self.sim.board
+        cells = sum(board.column_counts)
+        if cells == 0:
+            return True
+        balance = column_balance(board.column_counts)
+        used_rows = sum(1 for row in board.rows if row)
+        top = max(board.heights)
+        for count in range(len(self.pieces) - depth + 1):
+            total = cells + _CELLS_PER_PIECE * count
+            if total % GRID_WIDTH:
+                continue
+            lines = total // GRID_WIDTH
+            if lines > GRID_HEIGHT:
+                break
+            needed = lines - balance
+            reach = self.parity_sums[depth + count] - self.parity_sums[depth]
+            if (lines >= used_rows and needed % 2 == 0 and abs(needed) <= reach
+                    and (top > lines or wall_segments_fit(board.column_counts, lines))):
+                return True
+        return False
+    
+    def placements(self, piece_type: int) -> List[Placement]:
+        """Get the placements of a piece on the board, lowest first."""
+        # Low placements fill the rows to clear and tend to reach a
+        # solution sooner
+        return sorted(self.generator.placements(self.sim.board, piece_type),
+                      key=lambda placement: placement.y, reverse=True)
+    
+    def play(self, piece_type: int, placement: Placement, depth: int) -> bool:
+        """Lock the piece of a depth and check whether the board can still be emptied."""
+        sim = self.sim
+        sim.state = _PLAYING
+        sim.piece_type = piece_type
+        sim.orientation, sim.x, sim.y = placement.orientation, placement.x, placement.y
+        sim.lock()
+        return sim.state == _PLAYING and self.feasible(depth + 1)
+    
+    def search(self, depth: int) -> Optional[List[Placement]]:
+        """Find placements from depth on that empty the board, None if there are none."""
+        board = self.sim.board
+        if depth > 0 and not any(board.column_counts):
+            return []
+        if depth == len(self.pieces) or self.stopped:
+            return None
+        key = board.zobrist ^ _DEPTH_KEYS[depth]
+        state = _board_state(board)
+        # Compare the rows too, so a hash collision cannot prune a solution
+        if self.failed.get(key) == state[0]:
+            return None
+        
+        piece_type = self.pieces[depth]
+        for placement in self.placements(piece_type):
+            self.nodes += 1
+            if (self.stop is not None and self.nodes % _STOP_CHECK_INTERVAL == 0
+                    and self.stop.is_set()):
+                self.stopped = True
+                return None
+            if self.play(piece_type, placement, depth):
+                rest = self.search(depth + 1)
+                if rest is not None:
+                    return [placement] + rest
+            board.load(*state)
+        
+        if not self.stopped:
+            self.failed.put(key, state[0])
+        return None
+    
+    def run(self, state: BoardState, pieces: Sequence[int],
+            depth: int) -> Optional[List[Placement]]:
+        """Search from a board at a depth of the sequence."""
+        self.prepare(pieces)
+        self.sim.board.load(*state)
+        if not self.feasible(depth):
+            return None
+        return self.search(depth)
+
+
+# Per-process search of the pool workers
+_worker_search: Optional[_Search] = None
+
+
+def _init_worker(capacity: int, stop) -> None:
+    """Create the search state reused by every subtree of a worker."""
+    global _worker_search
+    _worker_search = _Search(capacity, stop)
+
+
+def _solve_subtree(state: BoardState, pieces: Tuple[int, ...],
+                   depth: int) -> Tuple[Optional[List[Placement]], int]:
+    """Search one subtree in a worker process."""
+    solution = _worker_search.run(state, pieces, depth)
+    return solution, _worker_search.nodes
+
+
+class PerfectClearSolver:
+    """
+    Finds placement sequences that empty a board.
+    
+    Use it as a context manager, or call ``close`` when done, so the
+    worker processes are stopped.
+    """
+    
+    def __init__(self, workers: int = 0, split_depth: int = 1,
+                 capacity: int = DEFAULT_CAPACITY):
+        """
+        Initialize the solver.
+        
+        Args:
+            workers: Number of worker processes, 0 to search in the
+                calling process
+            split_depth: Number of levels expanded before the subtrees
+                are handed to the workers
+            capacity: Maximum number of boards in the memo and in the
+                placement cache of each process
+        """
+        self.workers = workers
+        self.split_depth = split_depth
+        self.capacity = capacity
+        self._search = _Search(capacity)
+        self._pool: Optional[Executor] = None
+        self._stop = None
+    
+    def _split(self) -> Tuple[Optional[List[Placement]], List[Tuple[List[Placement], BoardState]]]:
+        """
+        Expand the top of the tree.
+        
+        Returns:
+            A solution found on the way, if any, and the feasible
+            (placements, board) frontier
+        """
+        search = self._search
+        sim = search.sim
+        frontier = [([], _board_state(sim.board))]
+        for depth in range(min(self.split_depth, len(search.pieces))):
+            next_frontier = []
+            for prefix, state in frontier:
+                sim.board.load(*state)
+                piece_type = search.pieces[depth]
+                for placement in search.placements(piece_type):
+                    search.nodes += 1
+                    if search.play(piece_type, placement, depth):
+                        if not any(sim.board.column_counts):
+                            return prefix + [placement], []
+                        next_frontier.append((prefix + [placement], _board_state(sim.board)))
+                    sim.board.load(*state)
+            frontier = next_frontier
+        return None, frontier
+    
+    def _solve_parallel(self, state: BoardState) -> Tuple[Optional[List[Placement]], int]:
+        """Search the subtrees below the split depth across the workers."""
+        search = self._search
+        search.sim.board.load(*state)
+        if not search.feasible(0):
+            return None, 0
+        solution, frontier = self._split()
+        nodes = search.nodes
+        if solution is not None or not frontier:
+            return solution, nodes
+        
+        if self._pool is None:
+            self._stop = Event()
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                             initargs=(self.capacity, self._stop))
+        self._stop.clear()
+        depth = len(frontier[0][0])
+        pending = {self._pool.submit(_solve_subtree, subtree_state, search.pieces, depth): prefix
+                   for prefix, subtree_state in frontier}
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    prefix = pending.pop(future)
+                    if future.cancelled():
+                        continue
+                    rest, subtree_nodes = future.result()
+                    nodes += subtree_nodes
+                    if rest is not None and solution is None:
+                        solution = prefix + rest
+                        self._stop.set()
+                        for other in pending:
+                            other.cancel()
+        finally:
+            self._stop.set()
+        return solution, nodes
+    
+    def solve(self, board: Board, pieces: Sequence[int]) -> SolveResult:
+        """
+        Find placements of a prefix of a piece sequence that empty a board.
+        
+        Args:
+            board: Settled cells, e.g. ``Simulator.board`` or ``GameCore.matrix``;
+                it is not modified
+            pieces: Types of the pieces to place in turn
+        
+        Returns:
+            The placements, one per piece used, or None if no prefix of
+            the sequence clears the board
+        """
+        start = time.perf_counter()
+        state = _board_state(board)
+        self._search.prepare(pieces)
+        if self.workers < 1:
+            solution = self._search.run(state, pieces, 0)
+            nodes = self._search.nodes
+        else:
+            solution, nodes = self._solve_parallel(state)
+        return SolveResult(
+            solution=tuple(solution) if solution is not None else None,
+            nodes=nodes,
+            seconds=time.perf_counter() - start,
+        )
+    
+    def close(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
+    def __enter__(self) -> 'PerfectClearSolver':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def __repr__(self) -> str:
+        """String representation of the solver."""
+        return f"PerfectClearSolver(workers={self.workers}, split_depth={self.split_depth})"
+
+
+def puzzle_board(lines: int, count: int, seed: int) -> Tuple[Board, List[int]]:
+    """
+    Build a board with a known perfect clear.
+    
+    The bottom rows start full, and pieces are carved out of them one at
+    a time. A piece is only carved where no cell of its columns above it
+    is left, so it can drop straight back into its slot. Refilling the
+    slots in reverse order clears the board, unless a line is completed
+    early and shifts a slot apart; the solver may find another way then.
+    
+    Args:
+        lines: Number of full rows to start from
+        count: Number of pieces to carve out
+        seed: Seed of the piece types and positions
+    
+    Returns:
+        The board and the piece sequence of the intended solution
+    """
+    rng = random.Random(seed)
+    full = (1 << GRID_WIDTH) - 1
+    rows = [0] * (GRID_HEIGHT - lines) + [full] * lines
+    carved = []
+    attempts = 0
+    while len(carved) < count and attempts < 1000 * count:
+        attempts += 1
+        piece_type = rng.choice(list(PIECE_CONFIGURATIONS))
+        shape = rng.choice(SHAPES[piece_type])
+        x = rng.randrange(-shape.min_dx, GRID_WIDTH - shape.max_dx)
+        y = rng.randrange(GRID_HEIGHT - lines, GRID_HEIGHT)
+        cells = [(x + dx, y + dy) for dx, dy in shape.cells]
+        if not all(0 <= cy < GRID_HEIGHT and rows[cy] >> cx & 1 for cx, cy in cells):
+            continue
+        for cx, cy in cells:
+            rows[cy] &= ~(1 << cx)
+        if all(not rows[row] >> cx & 1 for cx, cy in cells for row in range(cy)):
+            carved.append(piece_type)
+        else:
+            for cx, cy in cells:
+                rows[cy] |= 1 << cx
+    
+    board = Board()
+    for y, mask in enumerate(rows):
+        if mask:
+            board.fill_row_mask(y, mask)
+    return board, carved[::-1]
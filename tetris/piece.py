@@ -6,10 +6,11 @@ composed of multiple blocks.
 """
 
 import random
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 from .block import Block
-from .constants import PIECE_CONFIGURATIONS, DIRECTIONS
+from .constants import PIECE_CONFIGURATIONS, DIRECTIONS, ROTATIONS, SPAWN_X, SPAWN_Y
+from .rotation import KICK_TABLES, NUM_ORIENTATIONS, ROTATION_TABLES
 
 if TYPE_CHECKING:
     from .game import TetrisGame
@@ -22,15 +23,19 @@ class Piece:
     Each piece has a specific shape and can move and rotate within the game grid.
     """
     
-    def __init__(self, game: 'TetrisGame', piece_type: int = -1):
+    def __init__(self, game: 'TetrisGame', piece_type: int = -1,
+                 color_rng: Optional[random.Random] = None):
         """
         Initialize a new Tetris piece.
         
         Args:
             game: Reference to the main game instance
             piece_type: Type of piece to create (-1 for random)
+            color_rng: Generator of the block colors, None for the global
+                random module
         """
         self.game = game
+        self.color_rng = color_rng
         self.blocks: List[Block] = []
         self.has_collided = False
         
@@ -39,15 +44,16 @@ class Piece:
             piece_type = random.randint(0, len(PIECE_CONFIGURATIONS) - 1)
         
         self.piece_type = piece_type
+        self.orientation = 0
+        self.center_x, self.center_y = SPAWN_X, SPAWN_Y  # Starting position
         self._create_blocks()
     
     def _create_blocks(self) -> None:
         """Create blocks for this piece based on its type."""
-        center_x, center_y = 5, 0  # Starting position
         configuration = PIECE_CONFIGURATIONS[self.piece_type]
         
         for dx, dy in configuration:
-            block = Block(self.game, center_x + dx, center_y + dy)
+            block = Block(self.game, self.center_x + dx, self.center_y + dy, rng=self.color_rng)
             self.blocks.append(block)
     
     def can_move(self, direction: str) -> bool:
@@ -123,9 +129,55 @@ class Piece:
         for block in self.blocks:
             block.x += dx
             block.y += dy
+        self.center_x += dx
+        self.center_y += dy
         
         return True
     
+    def drop(self, distance: int) -> None:
+        """
+        Move the piece straight down by a distance known to be free.
+        
+        Args:
+            distance: Number of rows to move down
+        """
+        for block in self.blocks:
+            block.y += distance
+        self.center_y += distance
+    
+    def rotate(self, rotation: str) -> bool:
+        """
+        Rotate the piece a quarter turn, kicking it sideways or up if needed.
+        
+        The target orientation and the kicks to try come from the tables
+        precomputed in the rotation module; the first kick whose cells
+        are all free is applied.
+        
+        Args:
+            rotation: Rotation direction ("CW", "CCW")
+            
+        Returns:
+            True if the rotation was successful, False otherwise
+        """
+        if rotation not in ROTATIONS:
+            return False
+        
+        target = (self.orientation + ROTATIONS[rotation]) % NUM_ORIENTATIONS
+        offsets = ROTATION_TABLES[self.piece_type][target]
+        
+        for kick_x, kick_y in KICK_TABLES[self.piece_type][(self.orientation, target)]:
+            center_x = self.center_x + kick_x
+            center_y = self.center_y + kick_y
+            if all(self._can_block_move_to(center_x + dx, center_y + dy) for dx, dy in offsets):
+                for block, (dx, dy) in zip(self.blocks, offsets):
+                    block.x = center_x + dx
+                    block.y = center_y + dy
+                self.center_x, self.center_y = center_x, center_y
+                self.orientation = target
+                return True
+        
+        return False
+    
     def register_blocks(self) -> None:
         """Register all blocks of this piece in the game matrix."""
         for block in self.blocks:
@@ -141,4 +193,5 @@ class Piece:
     
     def __repr__(self) -> str:
         """String representation of the piece."""
-        return f"Piece(type={self.piece_type}, blocks={len(self.blocks)}, collided={self.has_collided})"
\ No newline at end of file
+        return (f"Piece(type={self.piece_type}, orientation={self.orientation}, "
+                f"blocks={len(self.blocks)}, collided={self.has_collided})")
\ No newline at end of file
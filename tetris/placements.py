@@ -0,0 +1,197 @@
+"""
+Reachable placements for the Tetris game.
+
+This module finds every final resting position of a piece that a player
+can reach from the spawn, together with the shortest input sequence
+leading to it. Positions (orientation, x, y) are explored breadth-first
+on the row masks of the board, with the same moves, kicks and collision
+rules as the games, so tucks under overhangs and kicks into gaps are
+found, not only straight drops.
+
+Results depend only on the settled cells and the piece type, so the
+PlacementGenerator memoises them in a transposition table keyed by the
+board's Zobrist hash.
+"""
+
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .board import Board
+from .constants import GRID_WIDTH, GRID_HEIGHT, ACTIONS, SPAWN_X, SPAWN_Y
+from .rotation import KICK_TABLES, NUM_ORIENTATIONS
+from .simulator import SHAPES
+from .transposition import DEFAULT_CAPACITY, TableStats, TranspositionTable
+from .zobrist import PIECE_KEYS
+
+# Highest center row explored; kicks may lift a piece, but not forever
+MIN_Y = -GRID_HEIGHT
+
+_LEFT = ACTIONS["LEFT"]
+_RIGHT = ACTIONS["RIGHT"]
+_DOWN = ACTIONS["DOWN"]
+_ROTATE_CW = ACTIONS["ROTATE_CW"]
+_ROTATE_CCW = ACTIONS["ROTATE_CCW"]
+_SONIC_DROP = ACTIONS["SONIC_DROP"]
+_HARD_DROP = ACTIONS["HARD_DROP"]
+
+State = Tuple[int, int, int]
+
+
+class Placement(NamedTuple):
+    """
+    Resting position of a piece and how to get there.
+    
+    ``path`` holds the ``ACTIONS`` that take the piece from the spawn to
+    this position, ending with a hard drop that locks it in place. It
+    assumes the inputs come faster than gravity.
+    """
+    orientation: int
+    x: int
+    y: int
+    path: Tuple[str, ...]
+
+
+def enumerate_placements(rows: Sequence[int], piece_type: int, orientation: int = 0,
+                         x: int = SPAWN_X, y: int = SPAWN_Y) -> List[Placement]:
+    """
+    Find every resting position reachable from a starting position.
+    
+    Positions that put the same cells on the board, such as the
+    orientations of a square, are reported once, with the shortest path.
+    
+    Args:
+        rows: Row masks of the settled cells of the visible grid
+        piece_type: Type of the piece
+        orientation: Starting orientation
+        x: Starting X coordinate of the piece center
+        y: Starting Y coordinate of the piece center
+    
+    Returns:
+        The placements in order of increasing path length, empty if the
+        piece does not fit at the start
+    """
+    shapes = SHAPES[piece_type]
+    kicks = KICK_TABLES[piece_type]
+    height = min(len(rows), GRID_HEIGHT)
+    
+    def fits(orientation: int, x: int, y: int) -> bool:
+        shape = shapes[orientation]
+        left = x + shape.min_dx
+        if left < 0 or x + shape.max_dx >= GRID_WIDTH:
+            return False
+        for dy, mask in shape.row_masks:
+            row = y + dy
+            if row >= height:
+                return False
+            if row >= 0 and rows[row] & mask << left:
+                return False
+        return True
+    
+    def rotate(orientation: int, x: int, y: int, turn: int) -> Optional[State]:
+        target = (orientation + turn) % NUM_ORIENTATIONS
+        for kick_x, kick_y in kicks[(orientation, target)]:
+            if fits(target, x + kick_x, y + kick_y):
+                return target, x + kick_x, y + kick_y
+        return None
+    
+    # Landing row of every position probed so far, shared by all the
+    # positions above it in the same column
+    landings: Dict[State, int] = {}
+    
+    def landing(orientation: int, x: int, y: int) -> int:
+        probed = []
+        while (orientation, x, y) not in landings and fits(orientation, x, y + 1):
+            probed.append(y)
+            y += 1
+        bottom = landings.setdefault((orientation, x, y), y)
+        for row in probed:
+            landings[(orientation, x, row)] = bottom
+        return bottom
+    
+    start = (orientation, x, y)
+    if not fits(*start):
+        return []
+    parents: Dict[State, Optional[Tuple[State, str]]] = {start: None}
+    queue: Deque[State] = deque([start])
+    resting: Dict[Tuple[Tuple[int, int], ...], State] = {}
+    
+    while queue:
+        state = queue.popleft()
+        orientation, x, y = state
+        moves: List[Tuple[str, Optional[State]]] = [
+            (_LEFT, (orientation, x - 1, y) if fits(orientation, x - 1, y) else None),
+            (_RIGHT, (orientation, x + 1, y) if fits(orientation, x + 1, y) else None),
+            (_ROTATE_CW, rotate(orientation, x, y, 1)),
+            (_ROTATE_CCW, rotate(orientation, x, y, -1)),
+        ]
+        bottom = landing(orientation, x, y)
+        if bottom > y:
+            moves.append((_DOWN, (orientation, x, y + 1)))
+            if bottom > y + 1:
+                moves.append((_SONIC_DROP, (orientation, x, bottom)))
+        else:
+            cells = tuple(sorted((x + dx, y + dy) for dx, dy in shapes[orientation].cells))
+            if cells not in resting:
+                resting[cells] = state
+        
+        for action, target in moves:
+            if target is not None and target not in parents and target[2] >= MIN_Y:
+                parents[target] = (state, action)
+                queue.append(target)
+    
+    placements = []
+    for state in resting.values():
+        path = [_HARD_DROP]
+        step = parents[state]
+        while step is not None:
+            state_before, action = step
+            path.append(action)
+            step = parents[state_before]
+        path.reverse()
+        placements.append(Placement(*state, path=tuple(path)))
+    return placements
+
+
+class PlacementGenerator:
+    """
+    Memoised placement enumeration for pieces at the spawn.
+    
+    Results are cached per (board, piece type) in a bounded transposition
+    table and shared between callers, so they must not be modified.
+    """
+    
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Initialize the generator.
+        
+        Args:
+            capacity: Maximum number of cached (board, piece type) results
+        """
+        self.table: TranspositionTable[Tuple[Tuple[int, ...], Tuple[Placement, ...]]] = (
+            TranspositionTable(capacity))
+    
+    def placements(self, board: Board, piece_type: int) -> Tuple[Placement, ...]:
+        """
+        Get the placements of a piece spawning on a board.
+        
+        Args:
+            board: Board of the settled cells, e.g. ``Simulator.board`` or
+                ``GameCore.matrix``
+            piece_type: Type of the spawning piece
+        
+        Returns:
+            The placements, as from ``enumerate_placements``
+        """
+        rows = tuple(board.rows[:GRID_HEIGHT])
+        key = board.zobrist ^ PIECE_KEYS[piece_type]
+        entry = self.table.get(key)
+        # Compare the rows too, so a hash collision cannot return wrong moves
+        if entry is not None and entry[0] == rows:
+            return entry[1]
+        placements = tuple(enumerate_placements(rows, piece_type))
+        self.table.put(key, (rows, placements))
+        return placements
+    
+    def stats(self) -> TableStats:
+        """Get the cache statistics."""
+        return self.table.stats()
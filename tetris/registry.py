@@ -0,0 +1,183 @@
+"""
+Block registry module for the Tetris game.
+
+This module contains the BlockRegistry class which stores the blocks of
+a game indexed by identity, by cell and by row, so that adding, removing and
+looking up blocks does not require scanning every block on the board.
+"""
+
+from bisect import bisect_right
+from typing import Dict, Iterable, Iterator, KeysView, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .block import Block
+
+
+class BlockRegistry:
+    """
+    Indexed store of the blocks in a game.
+    
+    Every block is registered by identity. Blocks do not define
+    equality, so they hash by id and are used directly as dict keys.
+    Settled blocks, the ones that no longer belong to a falling piece,
+    are also indexed by cell and kept in per-row buckets. Adding,
+    removing and cell lookups are O(1) and collecting the blocks of a row
+    is O(row).
+    """
+    
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._blocks: Dict['Block', None] = {}
+        # Settled blocks per row, as a bucket and as an x -> block map.
+        # Keeping both keyed by row lets a line clear move whole rows.
+        self._rows: Dict[int, Dict['Block', None]] = {}
+        self._cells: Dict[int, Dict[int, 'Block']] = {}
+    
+    def add(self, block: 'Block') -> None:
+        """Register a block."""
+        self._blocks[block] = None
+    
+    def remove(self, block: 'Block') -> bool:
+        """
+        Unregister a block.
+        
+        Args:
+            block: Block to remove
+        
+        Returns:
+            True if the block was registered, False otherwise
+        """
+        if block not in self._blocks:
+            return False
+        del self._blocks[block]
+        self.unsettle(block)
+        return True
+    
+    def settle(self, block: 'Block') -> None:
+        """Index a block by its current cell and row."""
+        self._rows.setdefault(block.y, {})[block] = None
+        self._cells.setdefault(block.y, {})[block.x] = block
+    
+    def unsettle(self, block: 'Block') -> None:
+        """Remove a block from the cell and row indexes."""
+        bucket = self._rows.get(block.y)
+        if bucket is None or block not in bucket:
+            return
+        del bucket[block]
+        if not bucket:
+            del self._rows[block.y]
+        cells = self._cells[block.y]
+        if cells.get(block.x) is block:
+            del cells[block.x]
+            if not cells:
+                del self._cells[block.y]
+    
+    def reindex(self, blocks: Iterable['Block']) -> None:
+        """Replace the cell and row indexes with the given settled blocks."""
+        self._rows = {}
+        self._cells = {}
+        for block in blocks:
+            self.settle(block)
+    
+    def load(self, cells: Dict[int, Dict[int, 'Block']]) -> None:
+        """
+        Replace the cell and row indexes with settled blocks given by cell.
+        
+        Args:
+            cells: Map of y to a map of x to the settled block at (x, y),
+                taken over by the registry
+        """
+        self._cells = cells
+        self._rows = {y: dict.fromkeys(row.values()) for y, row in cells.items()}
+    
+    def occupant(self, x: int, y: int) -> Optional['Block']:
+        """Get the settled block at a cell, if any."""
+        cells = self._cells.get(y)
+        return cells.get(x) if cells is not None else None
+    
+    def row(self, y: int) -> List['Block']:
+        """Get the settled blocks of a row."""
+        return list(self._rows.get(y, ()))
+    
+    def clear_row(self, y: int) -> List['Block']:
+        """
+        Remove the settled blocks of a row and move the rows above it down.
+        
+        Args:
+            y: Index of the row to clear
+        
+        Returns:
+            The blocks that were removed
+        """
+        return self.clear_rows([y])
+    
+    def clear_rows(self, ys: Iterable[int]) -> List['Block']:
+        """
+        Remove the settled blocks of several rows and compact the rows above.
+        
+        Each surviving row drops by the number of cleared rows below it.
+        That distance is computed once per row and every moved block is
+        relocated once, whatever the number of cleared rows.
+        
+        Args:
+            ys: Indices of the rows to clear
+        
+        Returns:
+            The blocks that were removed
+        """
+        cleared = sorted(set(ys))
+        removed: List['Block'] = []
+        for y in cleared:
+            removed.extend(self._rows.pop(y, ()))
+            self._cells.pop(y, None)
+        for block in removed:
+            del self._blocks[block]
+        if not cleared:
+            return removed
+        
+        # Lift out every row above the lowest cleared row, then put each
+        # one back at its final index
+        moved_rows: Dict[int, Dict['Block', None]] = {}
+        moved_cells: Dict[int, Dict[int, 'Block']] = {}
+        for row_y in [r for r in self._rows if r < cleared[-1]]:
+            new_y = row_y + len(cleared) - bisect_right(cleared, row_y)
+            bucket = self._rows.pop(row_y)
+            for block in bucket:
+                block.y = new_y
+            moved_rows[new_y] = bucket
+            moved_cells[new_y] = self._cells.pop(row_y)
+        self._rows.update(moved_rows)
+        self._cells.update(moved_cells)
+        return removed
+    
+    def cell_map(self) -> Dict[Tuple[int, int], 'Block']:
+        """Get a copy of the cell index keyed by (x, y)."""
+        return {(x, y): block for y, cells in self._cells.items() for x, block in cells.items()}
+    
+    def is_consistent(self) -> bool:
+        """Check that the row and cell indexes agree with the block positions."""
+        for row_y, bucket in self._rows.items():
+            for block in bucket:
+                if block.y != row_y or block not in self._blocks:
+                    return False
+        return all(block.x == x and block.y == y for (x, y), block in self.cell_map().items())
+    
+    def view(self) -> KeysView['Block']:
+        """Get a live read-only view of all registered blocks."""
+        return self._blocks.keys()
+    
+    def __iter__(self) -> Iterator['Block']:
+        """Iterate over all registered blocks in insertion order."""
+        return iter(self._blocks)
+    
+    def __len__(self) -> int:
+        """Number of registered blocks."""
+        return len(self._blocks)
+    
+    def __contains__(self, block: object) -> bool:
+        """Check if a block is registered."""
+        return block in self._blocks
+    
+    def __repr__(self) -> str:
+        """String representation of the registry."""
+        return f"BlockRegistry(blocks={len(self._blocks)}, settled={sum(map(len, self._rows.values()))})"
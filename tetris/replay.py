@@ -0,0 +1,229 @@
+"""
+Replay recording and playback for the Tetris game.
+
+A replay is the seed of a game plus the ordered stream of (tick, action)
+events that drove it: player actions from ``handle_input`` and gravity
+drops. Since the seed fixes the piece sequence, re-applying the events
+reproduces the game exactly.
+
+Replays are stored as a magic tag followed by unsigned LEB128 varints:
+the zigzag-encoded seed (seeds may be negative), the final score and
+line count, the number of events and then one varint per event holding
+the tick delta shifted left by three bits with the 3-bit action code in
+the low bits. A typical event takes one or two bytes.
+"""
+
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from .core import GameCore
+from .constants import ACTIONS
+from .simulator import Simulator
+
+# File signature and format version of encoded replays
+REPLAY_MAGIC = b"LTR2"
+
+# Signature of the first format, which stored the seed unsigned
+_REPLAY_MAGIC_V1 = b"LTR1"
+
+GRAVITY = "gravity"
+
+# Replay action codes, three bits each
+REPLAY_ACTIONS = (
+    GRAVITY,
+    ACTIONS["LEFT"],
+    ACTIONS["RIGHT"],
+    ACTIONS["DOWN"],
+    ACTIONS["ROTATE_CW"],
+    ACTIONS["ROTATE_CCW"],
+    ACTIONS["HARD_DROP"],
+    ACTIONS["SONIC_DROP"],
+)
+_ACTION_CODES = {action: code for code, action in enumerate(REPLAY_ACTIONS)}
+_CODE_BITS = 3
+_CODE_MASK = (1 << _CODE_BITS) - 1
+
+
+class ReplayError(ValueError):
+    """Raised when replay data is malformed."""
+
+
+class Replay(NamedTuple):
+    """
+    Recorded game.
+    
+    ``events`` holds (tick, action code) pairs in the order they were
+    applied; ``score`` and ``lines`` are the final totals of the game,
+    used to verify a playback.
+    """
+    seed: int
+    events: Tuple[Tuple[int, int], ...]
+    score: int
+    lines: int
+
+
+class ReplayRecorder:
+    """Collects the events of a game as it is played."""
+    
+    def __init__(self, seed: int):
+        """
+        Initialize an empty recording.
+        
+        Args:
+            seed: Seed of the recorded game
+        """
+        self.seed = seed
+        self.events: List[Tuple[int, int]] = []
+    
+    def record(self, tick: int, action: str) -> None:
+        """
+        Record a player action; actions without a replay code are ignored.
+        
+        Args:
+            tick: Game tick at which the action was applied
+            action: One of the ``ACTIONS`` values
+        """
+        code = _ACTION_CODES.get(action)
+        if code is not None:
+            self.events.append((tick, code))
+    
+    def record_gravity(self, tick: int) -> None:
+        """Record a gravity drop at a game tick."""
+        self.events.append((tick, 0))
+    
+    def finish(self, score: int, lines: int) -> Replay:
+        """Build the replay of the recorded game with its final totals."""
+        return Replay(self.seed, tuple(self.events), score, lines)
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Append an unsigned LEB128 varint."""
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _zigzag(value: int) -> int:
+    """Map a signed integer to an unsigned one: 0, -1, 1, -2... to 0, 1, 2, 3..."""
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    """Invert ``_zigzag``."""
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Read an unsigned LEB128 varint and return it with the next position."""
+    value = 0
+    shift = 0
+    try:
+        while True:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value, pos
+            shift += 7
+    except IndexError:
+        raise ReplayError("Replay data ends inside a varint") from None
+
+
+def encode_replay(replay: Replay) -> bytes:
+    """
+    Encode a replay into its compact binary form.
+    
+    Raises:
+        ReplayError: If the totals are negative or the ticks are not in
+            increasing order from 0
+    """
+    if replay.score < 0 or replay.lines < 0:
+        raise ReplayError(f"Replay totals cannot be negative (score {replay.score}, "
+                          f"lines {replay.lines})")
+    out = bytearray(REPLAY_MAGIC)
+    for value in (_zigzag(replay.seed), replay.score, replay.lines, len(replay.events)):
+        _write_varint(out, value)
+    previous = 0
+    for tick, code in replay.events:
+        if tick < previous:
+            raise ReplayError(f"Replay ticks go backwards ({tick} after {previous})")
+        _write_varint(out, (tick - previous) << _CODE_BITS | code)
+        previous = tick
+    return bytes(out)
+
+
+def decode_replay(data: bytes) -> Replay:
+    """
+    Decode a replay from its binary form.
+    
+    Raises:
+        ReplayError: If the data is not a well-formed replay
+    """
+    magic = data[:len(REPLAY_MAGIC)]
+    if magic not in (REPLAY_MAGIC, _REPLAY_MAGIC_V1):
+        raise ReplayError("Data is not a myLTetris replay")
+    pos = len(REPLAY_MAGIC)
+    seed, pos = _read_varint(data, pos)
+    if magic == REPLAY_MAGIC:
+        seed = _unzigzag(seed)
+    score, pos = _read_varint(data, pos)
+    lines, pos = _read_varint(data, pos)
+    count, pos = _read_varint(data, pos)
+    events = []
+    tick = 0
+    for _ in range(count):
+        value, pos = _read_varint(data, pos)
+        tick += value >> _CODE_BITS
+        events.append((tick, value & _CODE_MASK))
+    if pos != len(data):
+        raise ReplayError("Unexpected data after the replay events")
+    return Replay(seed, tuple(events), score, lines)
+
+
+def save_replay(replay: Replay, path: str) -> None:
+    """Write a replay to a file."""
+    with open(path, "wb") as file:
+        file.write(encode_replay(replay))
+
+
+def load_replay(path: str) -> Replay:
+    """Read a replay from a file."""
+    with open(path, "rb") as file:
+        return decode_replay(file.read())
+
+
+def iter_actions(replay: Replay) -> Iterator[Tuple[int, str]]:
+    """Iterate over the (tick, action) events of a replay, gravity included."""
+    for tick, code in replay.events:
+        yield tick, REPLAY_ACTIONS[code]
+
+
+def play_replay(replay: Replay,
+                game: Optional[Union[GameCore, Simulator]] = None) -> Tuple[int, int, str]:
+    """
+    Re-execute a replay headlessly at CPU speed.
+    
+    The events are applied to a Simulator seeded like the recorded game,
+    unless a game is given, for instance a GameCore to get the blocks.
+    
+    Args:
+        replay: Replay to play
+        game: Fresh game seeded with ``replay.seed``, None for a Simulator
+    
+    Returns:
+        The final (score, lines, state) of the game
+    """
+    if game is None:
+        game = Simulator(seed=replay.seed)
+    apply_action = game.apply_action
+    down = ACTIONS["DOWN"]
+    for _, code in replay.events:
+        # A gravity drop moves the piece down exactly like the down action
+        apply_action(REPLAY_ACTIONS[code] if code else down)
+    return game.score, game.lines_cleared, game.state
+
+
+def verify_replay(replay: Replay) -> bool:
+    """Check that playing a replay gives back its recorded final totals."""
+    score, lines, _ = play_replay(replay)
+    return (score, lines) == (replay.score, replay.lines)
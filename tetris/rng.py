@@ -0,0 +1,197 @@
+"""
+Random number streams for the Tetris game.
+
+This module contains the GameRandom class which gives every game its
+own seeded generators, one for the piece sequence and one for block
+colors, so a game is reproducible from its seed and games never draw
+from each other's streams. Piece types and colors are drawn in
+blocks into a buffer, which amortises the generator cost, lets callers
+preview upcoming pieces and keeps the saved position in a stream small.
+"""
+
+import random
+from typing import List, Optional, Sequence, Tuple, TypeVar
+
+from .block import COLOR_PALETTE
+from .constants import PIECE_CONFIGURATIONS
+
+# Number of piece types or colors drawn from a generator at a time
+PIECE_BUFFER_SIZE = 256
+
+T = TypeVar("T")
+
+
+class ChoiceSequence:
+    """
+    Buffered stream of uniformly random choices among ``size`` values.
+    
+    Values are drawn ``buffer_size`` at a time, so the sequence does not
+    depend on the buffer size, only on the generator. The generator state
+    before every buffered chunk is kept, so the position in the sequence
+    can be saved and restored without copying the generator state on
+    every call.
+    """
+    
+    def __init__(self, rng: random.Random, size: int, buffer_size: int = PIECE_BUFFER_SIZE):
+        """
+        Initialize the sequence.
+        
+        Args:
+            rng: Generator reserved for this sequence
+            size: Number of values, the sequence yields 0 to size - 1
+            buffer_size: Number of values drawn at a time
+        """
+        self._rng = rng
+        self._values = tuple(range(size))
+        self._buffer_size = buffer_size
+        self._buffer: List[int] = []
+        self._chunk_states: List[tuple] = []
+        self._index = 0
+    
+    def _refill(self, count: int) -> None:
+        """Make sure at least count unread values are buffered."""
+        done = self._index // self._buffer_size
+        del self._buffer[:done * self._buffer_size]
+        del self._chunk_states[:done]
+        self._index -= done * self._buffer_size
+        while len(self._buffer) - self._index < count:
+            self._draw_chunk()
+    
+    def _draw_chunk(self) -> None:
+        """Draw one chunk of values into the buffer."""
+        self._chunk_states.append(self._rng.getstate())
+        self._buffer.extend(self._rng.choices(self._values, k=self._buffer_size))
+    
+    def next(self) -> int:
+        """Take the next value of the sequence."""
+        if self._index >= len(self._buffer):
+            self._refill(1)
+        value = self._buffer[self._index]
+        self._index += 1
+        return value
+    
+    def peek(self, count: int) -> List[int]:
+        """Get the next count values without taking them."""
+        if self._index + count > len(self._buffer):
+            self._refill(count)
+        return self._buffer[self._index:self._index + count]
+    
+    def take(self, count: int) -> List[int]:
+        """Take the next count values of the sequence at once."""
+        if self._index + count > len(self._buffer):
+            self._refill(count)
+        values = self._buffer[self._index:self._index + count]
+        self._index += count
+        return values
+    
+    def getstate(self) -> Tuple[tuple, int]:
+        """
+        Get the position in the sequence.
+        
+        Returns:
+            The generator state before the first buffered chunk and the
+            number of values taken since then
+        """
+        if not self._chunk_states:
+            return self._rng.getstate(), 0
+        return self._chunk_states[0], self._index
+    
+    def setstate(self, state: Tuple[tuple, int]) -> None:
+        """
+        Go back to a position returned by ``getstate``.
+        
+        A position inside the buffered chunks only moves the read index;
+        any other position reseeds the generator and redraws the buffer.
+        """
+        chunk_state, index = state
+        if not (self._chunk_states and (self._chunk_states[0] is chunk_state
+                                        or self._chunk_states[0] == chunk_state)):
+            self._rng.setstate(chunk_state)
+            self._buffer = []
+            self._chunk_states = []
+            self._index = 0
+        while len(self._buffer) < index:
+            self._draw_chunk()
+        self._index = index
+
+
+class PieceSequence(ChoiceSequence):
+    """Buffered stream of uniformly random piece types."""
+    
+    def __init__(self, rng: random.Random, buffer_size: int = PIECE_BUFFER_SIZE):
+        """
+        Initialize the sequence.
+        
+        Args:
+            rng: Generator reserved for this sequence
+            buffer_size: Number of piece types drawn at a time
+        """
+        super().__init__(rng, len(PIECE_CONFIGURATIONS), buffer_size)
+
+
+class ColorSequence(ChoiceSequence):
+    """
+    Buffered stream of uniformly random block colors.
+    
+    It stands in for a ``random.Random`` as the color generator of
+    blocks, which only call ``choice`` on the palette.
+    """
+    
+    def __init__(self, rng: random.Random, buffer_size: int = PIECE_BUFFER_SIZE):
+        """
+        Initialize the sequence.
+        
+        Args:
+            rng: Generator reserved for this sequence
+            buffer_size: Number of colors drawn at a time
+        """
+        super().__init__(rng, len(COLOR_PALETTE), buffer_size)
+    
+    def choice(self, palette: Sequence[T]) -> T:
+        """
+        Take the next color of the sequence.
+        
+        Args:
+            palette: Colors to pick from, as long as ``COLOR_PALETTE``
+        
+        Returns:
+            The entry of the palette at the next index of the sequence
+        """
+        return palette[self.next()]
+
+
+class GameRandom:
+    """
+    Independent random streams of one game.
+    
+    Each stream is seeded from the game seed and the stream name, so
+    drawing colors never shifts the piece sequence and vice versa.
+    """
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize the streams.
+        
+        Args:
+            seed: Game seed, None to pick one at random
+        """
+        if seed is None:
+            # 63 bits, so a random seed fits the signed seed field of archives
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed = seed
+        self.pieces = PieceSequence(random.Random(f"{seed}:pieces"))
+        self.colors = ColorSequence(random.Random(f"{seed}:colors"))
+    
+    def getstate(self) -> Tuple[Tuple[tuple, int], Tuple[tuple, int]]:
+        """Get the positions in both streams, to be passed to ``setstate``."""
+        return self.pieces.getstate(), self.colors.getstate()
+    
+    def setstate(self, state: Tuple[Tuple[tuple, int], Tuple[tuple, int]]) -> None:
+        """Restore both streams to positions returned by ``getstate``."""
+        pieces, colors = state
+        self.pieces.setstate(pieces)
+        self.colors.setstate(colors)
+    
+    def __repr__(self) -> str:
+        """String representation of the streams."""
+        return f"GameRandom(seed={self.seed})"
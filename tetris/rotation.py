@@ -0,0 +1,79 @@
+"""
+Rotation tables for the Tetris game.
+
+This module precomputes, once at import, the block offsets of every
+piece type in each of its four orientations and the kick offsets tried
+when a rotation is blocked, so rotating a piece is a matter of table
+lookups and collision probes.
+"""
+
+from typing import Dict, Tuple
+
+from .constants import PIECE_CONFIGURATIONS, PIECE_TYPES
+
+Offsets = Tuple[Tuple[int, int], ...]
+
+NUM_ORIENTATIONS = 4
+
+# Pieces whose shape does not change when rotated
+_SYMMETRIC_PIECES = ("SQUARE",)
+
+
+def _rotate_clockwise(offsets: Offsets) -> Offsets:
+    """Rotate block offsets a quarter turn clockwise around the piece center."""
+    return tuple((-dy, dx) for dx, dy in offsets)
+
+
+def _build_rotation_tables() -> Dict[int, Tuple[Offsets, ...]]:
+    """Build the block offsets of every piece type in every orientation."""
+    tables = {}
+    for piece_type, configuration in PIECE_CONFIGURATIONS.items():
+        orientations = [tuple(configuration)]
+        for _ in range(NUM_ORIENTATIONS - 1):
+            if PIECE_TYPES[piece_type] in _SYMMETRIC_PIECES:
+                orientations.append(orientations[-1])
+            else:
+                orientations.append(_rotate_clockwise(orientations[-1]))
+        tables[piece_type] = tuple(orientations)
+    return tables
+
+
+def _build_kicks(orientations: Tuple[Offsets, ...]) -> Offsets:
+    """
+    Build the center offsets tried, in order, to fit a rotated piece.
+    
+    The plain rotation comes first, then sideways shifts alternating
+    left and right, then upward shifts. The reach is the largest offset
+    of any block from the center, so a piece can always be kicked clear
+    of a wall it rotated into.
+    """
+    reach = max(max(abs(dx), abs(dy)) for offsets in orientations for dx, dy in offsets)
+    kicks = [(0, 0)]
+    for distance in range(1, reach + 1):
+        kicks.extend(((-distance, 0), (distance, 0)))
+    for distance in range(1, reach + 1):
+        kicks.append((0, -distance))
+    return tuple(kicks)
+
+
+def _build_kick_tables(rotation_tables: Dict[int, Tuple[Offsets, ...]]
+                       ) -> Dict[int, Dict[Tuple[int, int], Offsets]]:
+    """Build the kick offsets of every piece type for every rotation."""
+    tables = {}
+    for piece_type, orientations in rotation_tables.items():
+        kicks = _build_kicks(orientations)
+        # Counter-clockwise rotations try the mirrored sideways kicks
+        mirrored = tuple((-dx, dy) for dx, dy in kicks)
+        table = {}
+        for orientation in range(NUM_ORIENTATIONS):
+            table[(orientation, (orientation + 1) % NUM_ORIENTATIONS)] = kicks
+            table[(orientation, (orientation - 1) % NUM_ORIENTATIONS)] = mirrored
+        tables[piece_type] = table
+    return tables
+
+
+# ROTATION_TABLES[piece_type][orientation] -> block offsets from the center
+ROTATION_TABLES = _build_rotation_tables()
+
+# KICK_TABLES[piece_type][(from_orientation, to_orientation)] -> center offsets
+KICK_TABLES = _build_kick_tables(ROTATION_TABLES)
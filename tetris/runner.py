@@ -4,11 +4,14 @@ Game runner module for the Tetris game.
 This module contains the main game loop and display management.
 """
 
+import os
 import pygame
 import random
-from typing import Tuple
+from typing import Optional, Tuple
 
+from .autoplayer import AutoPlayer
 from .game import TetrisGame
+from .replay import GRAVITY, Replay, iter_actions, save_replay
 from .constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, BACKGROUND_COLOR,
     GAME_AREA_X, GAME_AREA_Y, GAME_AREA_WIDTH, GAME_AREA_HEIGHT,
@@ -25,9 +28,24 @@ class GameRunner:
     display updates, and user input processing.
     """
     
-    def __init__(self):
-        """Initialize the game runner."""
+    def __init__(self, seed: Optional[int] = None, replay_path: Optional[str] = None,
+                 autoplayer: Optional[AutoPlayer] = None):
+        """
+        Initialize the game runner.
+        
+        Args:
+            seed: Seed of the first game, None for a random one
+            replay_path: File the replay of the first game is written to,
+                None to not record; later games go to numbered files next
+                to it (``game-2.ltr``, ``game-3.ltr``...)
+            autoplayer: Bot playing the games in demo mode, None for a
+                human player
+        """
         pygame.init()
+        self.replay_path = replay_path
+        self.autoplayer = autoplayer
+        self.games_started = 0
+        self._replay_saved = False
         
         # Display setup
         self.screen = pygame.display.set_mode([SCREEN_WIDTH, SCREEN_HEIGHT])
@@ -38,13 +56,7 @@ class GameRunner:
         self.font = pygame.font.SysFont("freesansbold.ttf", FONT_SIZE)
         
         # Initialize game
-        self.game = TetrisGame(
-            self.screen,
-            GAME_AREA_X,
-            GAME_AREA_Y,
-            GAME_AREA_WIDTH,
-            GAME_AREA_HEIGHT
-        )
+        self.game = self._new_game(seed)
         
         # Input handling
         pygame.key.set_repeat(KEY_REPEAT_DELAY, KEY_REPEAT_INTERVAL)
@@ -53,6 +65,38 @@ class GameRunner:
         self.running = True
         self.fps = DEFAULT_FPS
     
+    def _new_game(self, seed: Optional[int] = None) -> TetrisGame:
+        """Create a game, recording its inputs if a replay file is set."""
+        game = TetrisGame(
+            self.screen,
+            GAME_AREA_X,
+            GAME_AREA_Y,
+            GAME_AREA_WIDTH,
+            GAME_AREA_HEIGHT,
+            seed=seed
+        )
+        if self.replay_path:
+            game.start_recording()
+        self.games_started += 1
+        self._replay_saved = False
+        return game
+    
+    def replay_file(self, number: int) -> str:
+        """Get the replay file of the number-th game, counting from 1."""
+        if number == 1:
+            return self.replay_path
+        root, extension = os.path.splitext(self.replay_path)
+        return f"{root}-{number}{extension}"
+    
+    def _save_replay(self) -> None:
+        """Write the replay of the current game, once, if it is being recorded."""
+        if self._replay_saved or not self.replay_path:
+            return
+        replay = self.game.get_replay()
+        if replay is not None:
+            save_replay(replay, self.replay_file(self.games_started))
+            self._replay_saved = True
+    
     def _update_display_caption(self) -> None:
         """Update the window caption with game information."""
         fps = self.clock.get_fps()
@@ -104,13 +148,8 @@ class GameRunner:
                     self.running = False
                 elif event.key == pygame.K_r and self.game.get_state() == GAME_STATES["GAME_OVER"]:
                     # Restart game
-                    self.game = TetrisGame(
-                        self.screen,
-                        GAME_AREA_X,
-                        GAME_AREA_Y,
-                        GAME_AREA_WIDTH,
-                        GAME_AREA_HEIGHT
-                    )
+                    self._save_replay()
+                    self.game = self._new_game()
                 else:
                     self.game.handle_input(event.key)
     
@@ -128,8 +167,19 @@ class GameRunner:
             drop_interval = max(100, 1000 - (self.game.get_lines_cleared() * 50))  # Speed up as lines increase
             
             if current_time - self._last_drop_time > drop_interval:
-                self.game.move_current_piece_down()
+                self.game.gravity_drop()
                 self._last_drop_time = current_time
+        
+        # Keep the replay of a finished game, however it ended
+        if self.game.get_state() == GAME_STATES["GAME_OVER"]:
+            self._save_replay()
+    
+    def _update_autoplayer(self) -> None:
+        """Apply the bot's inputs and start a new game once it has lost."""
+        if self.game.get_state() == GAME_STATES["GAME_OVER"]:
+            self._save_replay()
+            self.game = self._new_game()
+        self.autoplayer.update(self.game)
     
     def run(self) -> None:
         """Run the main game loop."""
@@ -140,6 +190,10 @@ class GameRunner:
             # Handle events
             self._handle_events()
             
+            # Let the bot play its queued inputs, within its frame budget
+            if self.autoplayer is not None:
+                self._update_autoplayer()
+            
             # Update game state
             self._update_game()
             
@@ -152,10 +206,65 @@ class GameRunner:
             pygame.display.update()
         
         # Cleanup
+        self._save_replay()
+        if self.autoplayer is not None:
+            self.autoplayer.close()
         pygame.quit()
+    
+    def run_replay(self, replay: Replay) -> None:
+        """
+        Render a replay, applying each event at its recorded tick.
+        
+        The game must have been created with the replay's seed. Keyboard
+        input other than ESC is ignored.
+        
+        Args:
+            replay: Replay to render
+        """
+        events = list(iter_actions(replay))
+        index = 0
+        while self.running:
+            self.clock.tick(self.fps)
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and
+                                                 event.key == pygame.K_ESCAPE):
+                    self.running = False
+            
+            while index < len(events) and events[index][0] <= self.game.tick:
+                action = events[index][1]
+                if action == GRAVITY:
+                    self.game.gravity_drop()
+                else:
+                    self.game.apply_action(action)
+                index += 1
+            self.game.update()
+            
+            self._draw_ui()
+            self.game.draw()
+            self._update_display_caption()
+            pygame.display.update()
+        
+        pygame.quit()
+
+
+def run_game(seed: Optional[int] = None, replay_path: Optional[str] = None,
+             autoplay: bool = False) -> None:
+    """
+    Main entry point for running the game.
+    
+    Args:
+        seed: Seed of the first game, None for a random one
+        replay_path: File the replay of the first game is written to, None
+            to not record; later games go to numbered files next to it
+        autoplay: Let the heuristic bot play, as a demo
+    """
+    # Plan in a process, so the bot never holds the GIL the frame loop needs
+    autoplayer = AutoPlayer(use_process=True) if autoplay else None
+    runner = GameRunner(seed, replay_path, autoplayer)
+    runner.run()
 
 
-def run_game() -> None:
-    """Main entry point for running the game."""
-    runner = GameRunner()
-    runner.run()
\ No newline at end of file
+def run_replay(replay: Replay) -> None:
+    """Render a recorded game in a window at its original pace."""
+    runner = GameRunner(replay.seed)
+    runner.run_replay(replay)
\ No newline at end of file
@@ -0,0 +1,211 @@
+"""
+Simulation runner for the Tetris game.
+
+This module plays many headless games for rule and scoring evaluation.
+Seeds are split into chunks that are fanned out across a process pool;
+each worker keeps one Simulator that it resets for every game, and the
+per-game results are streamed back as chunks complete and aggregated
+into score and line distributions.
+
+Usage:
+    python -m tetris.simulation [--games N] [--workers N] [--chunk-size N]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .constants import GAME_STATES, GRID_WIDTH
+from .rotation import NUM_ORIENTATIONS
+from .simulator import Simulator
+
+# A policy picks the (orientation, x) placement of the current piece
+Policy = Callable[[Simulator, random.Random], Tuple[int, int]]
+
+DEFAULT_CHUNK_SIZE = 16
+
+
+class GameResult(NamedTuple):
+    """Outcome of one simulated game."""
+    seed: int
+    score: int
+    lines: int
+    pieces: int
+
+
+class Distribution(NamedTuple):
+    """Summary statistics of one per-game quantity."""
+    count: int
+    mean: float
+    stdev: float
+    minimum: int
+    median: float
+    p90: float
+    maximum: int
+
+
+class SimulationSummary(NamedTuple):
+    """Aggregated outcome of a batch of simulated games."""
+    games: int
+    score: Distribution
+    lines: Distribution
+    pieces: Distribution
+
+
+def random_policy(sim: Simulator, rng: random.Random) -> Tuple[int, int]:
+    """Pick a uniformly random placement among those that fit at the spawn."""
+    options = [
+        (orientation, x)
+        for orientation in range(NUM_ORIENTATIONS)
+        for x in range(GRID_WIDTH)
+        if sim.fits(orientation, x, sim.y)
+    ]
+    return rng.choice(options) if options else (sim.orientation, sim.x)
+
+
+def play_game(sim: Simulator, seed: int, policy: Policy = random_policy,
+              max_pieces: Optional[int] = None) -> GameResult:
+    """
+    Play one game to the end on a reused simulator.
+    
+    Args:
+        sim: Simulator to reset and play on
+        seed: Seed of the piece sequence and of the policy
+        policy: Placement policy
+        max_pieces: Stop after this many pieces, None to play until top-out
+    
+    Returns:
+        The outcome of the game
+    """
+    rng = random.Random(seed)
+    sim.reset(seed)
+    while sim.state == GAME_STATES["PLAYING"]:
+        if max_pieces is not None and sim.pieces_placed >= max_pieces:
+            break
+        orientation, x = policy(sim, rng)
+        if not sim.place(orientation, x).moved:
+            sim.hard_drop()
+    return GameResult(seed, sim.score, sim.lines_cleared, sim.pieces_placed)
+
+
+# Per-process state of the pool workers
+_worker_simulator: Optional[Simulator] = None
+_worker_policy: Policy = random_policy
+_worker_max_pieces: Optional[int] = None
+
+
+def _init_worker(policy: Policy, max_pieces: Optional[int]) -> None:
+    """Create the simulator reused by every game of a worker process."""
+    global _worker_simulator, _worker_policy, _worker_max_pieces
+    _worker_simulator = Simulator()
+    _worker_policy = policy
+    _worker_max_pieces = max_pieces
+
+
+def _play_chunk(seeds: Sequence[int]) -> List[GameResult]:
+    """Play the games of a chunk of seeds in a worker process."""
+    return [play_game(_worker_simulator, seed, _worker_policy, _worker_max_pieces)
+            for seed in seeds]
+
+
+def iter_simulations(seeds: Iterable[int], workers: Optional[int] = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE, policy: Policy = random_policy,
+                     max_pieces: Optional[int] = None) -> Iterator[GameResult]:
+    """
+    Play one game per seed and yield the results as they complete.
+    
+    Args:
+        seeds: Seeds of the games
+        workers: Number of worker processes; None for one per CPU, 0 to
+            play in the calling process
+        chunk_size: Number of games sent to a worker at a time
+        policy: Placement policy, a module-level function so it can be
+            sent to the workers
+        max_pieces: Piece limit per game, None to play until top-out
+    
+    Yields:
+        One GameResult per seed, in completion order
+    """
+    seeds = list(seeds)
+    if workers == 0:
+        sim = Simulator()
+        for seed in seeds:
+            yield play_game(sim, seed, policy, max_pieces)
+        return
+    
+    chunks = [seeds[i:i + chunk_size] for i in range(0, len(seeds), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(policy, max_pieces)) as pool:
+        futures = [pool.submit(_play_chunk, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def _distribution(values: Sequence[int]) -> Distribution:
+    """Summarize a non-empty list of per-game values."""
+    ordered = sorted(values)
+    deciles = statistics.quantiles(ordered, n=10) if len(ordered) > 1 else [ordered[0]] * 9
+    return Distribution(
+        count=len(ordered),
+        mean=statistics.fmean(ordered),
+        stdev=statistics.pstdev(ordered),
+        minimum=ordered[0],
+        median=statistics.median(ordered),
+        p90=deciles[8],
+        maximum=ordered[-1],
+    )
+
+
+def summarize(results: Iterable[GameResult]) -> SimulationSummary:
+    """
+    Aggregate game results into score, line and piece distributions.
+    
+    Raises:
+        ValueError: If there are no results
+    """
+    results = list(results)
+    if not results:
+        raise ValueError("Cannot summarize an empty set of game results")
+    return SimulationSummary(
+        games=len(results),
+        score=_distribution([result.score for result in results]),
+        lines=_distribution([result.lines for result in results]),
+        pieces=_distribution([result.pieces for result in results]),
+    )
+
+
+def run_simulations(seeds: Iterable[int], workers: Optional[int] = None,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE, policy: Policy = random_policy,
+                    max_pieces: Optional[int] = None) -> SimulationSummary:
+    """Play one game per seed across a process pool and summarize the results."""
+    return summarize(iter_simulations(seeds, workers, chunk_size, policy, max_pieces))
+
+
+def main() -> None:
+    """Command line entry point of the simulation runner."""
+    parser = argparse.ArgumentParser(description="Play many headless Tetris games.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--max-pieces", type=int, default=None)
+    args = parser.parse_args()
+    
+    seeds = range(args.first_seed, args.first_seed + args.games)
+    start = time.perf_counter()
+    summary = run_simulations(seeds, args.workers, args.chunk_size, max_pieces=args.max_pieces)
+    elapsed = time.perf_counter() - start
+    
+    print(f"{summary.games} games in {elapsed:.2f}s ({summary.games / elapsed:,.0f} games/s)")
+    for name in ("score", "lines", "pieces"):
+        dist = getattr(summary, name)
+        print(f"{name:<7} mean {dist.mean:9.1f}  stdev {dist.stdev:9.1f}  min {dist.minimum:6}  "
+              f"median {dist.median:8.1f}  p90 {dist.p90:8.1f}  max {dist.maximum:6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+"""
+Headless simulator for the Tetris game.
+
+This module contains the Simulator class, a block-free implementation of
+the game rules for bots and batch jobs. The falling piece is only a type,
+an orientation and a center, settled cells live in a Board, and every
+piece shape is precomputed as row masks, so moving, dropping and locking
+a piece costs a handful of integer operations and no clock is involved.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .board import Board, FULL_ROW_MASK, SurfaceProfile
+from .core import GameSnapshot, StepResult
+from .constants import (
+    GRID_WIDTH, GRID_HEIGHT, ACTIONS, GAME_STATES,
+    ROTATIONS, SPAWN_X, SPAWN_Y
+)
+from .rng import GameRandom
+from .rotation import KICK_TABLES, NUM_ORIENTATIONS, ROTATION_TABLES, Offsets
+from .zobrist import state_hash
+
+
+class Shape(NamedTuple):
+    """
+    Row-mask form of a piece in one orientation.
+    
+    ``row_masks`` holds, for every row the piece covers, the row offset
+    from the center and the cells of that row with bit 0 at ``min_dx``.
+    ``bottoms`` holds the lowest row offset of every column the piece
+    covers, which is all that is needed to find its landing row.
+    """
+    cells: Offsets
+    min_dx: int
+    max_dx: int
+    row_masks: Tuple[Tuple[int, int], ...]
+    bottoms: Tuple[Tuple[int, int], ...]
+
+
+def _build_shape(offsets: Offsets) -> Shape:
+    """Build the row-mask form of a piece from its block offsets."""
+    min_dx = min(dx for dx, _ in offsets)
+    max_dx = max(dx for dx, _ in offsets)
+    masks: Dict[int, int] = {}
+    bottoms: Dict[int, int] = {}
+    for dx, dy in offsets:
+        masks[dy] = masks.get(dy, 0) | 1 << (dx - min_dx)
+        bottoms[dx] = max(bottoms.get(dx, dy), dy)
+    return Shape(
+        cells=offsets,
+        min_dx=min_dx,
+        max_dx=max_dx,
+        row_masks=tuple(sorted(masks.items())),
+        bottoms=tuple(sorted(bottoms.items())),
+    )
+
+
+# SHAPES[piece_type][orientation] -> row-mask form of the piece
+SHAPES: Dict[int, Tuple[Shape, ...]] = {
+    piece_type: tuple(_build_shape(offsets) for offsets in orientations)
+    for piece_type, orientations in ROTATION_TABLES.items()
+}
+
+_PLAYING = GAME_STATES["PLAYING"]
+_GAME_OVER = GAME_STATES["GAME_OVER"]
+
+
+class Simulator:
+    """
+    Fast headless game following the same rules as GameCore.
+    
+    Pieces spawn, move, rotate with kicks, fall, lock, clear lines and
+    score exactly as in GameCore, but without Block objects or a
+    registry. The game is driven with ``step`` (one action and one
+    gravity tick) or ``place`` (put the current piece straight into a
+    final orientation and column).
+    """
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize a new game.
+        
+        Args:
+            seed: Seed of the piece sequence, None for a random one
+        """
+        self.board = Board()
+        self._seed_streams(seed)
+        self.reset()
+    
+    def reset(self, seed: Optional[int] = None) -> None:
+        """
+        Start a new game on an empty board.
+        
+        Args:
+            seed: Seed of the new game's piece sequence, None to keep
+                drawing from the current one
+        """
+        if seed is not None:
+            self._seed_streams(seed)
+        self.board.clear()
+        self.state = _PLAYING
+        self.score = 0
+        self.lines_cleared = 0
+        self.pieces_placed = 0
+        self.next_piece_type = self._next_piece()
+        self._spawn_new_piece()
+    
+    def _seed_streams(self, seed: Optional[int]) -> None:
+        """Give the game fresh random streams."""
+        self.rng = GameRandom(seed)
+        self._next_piece = self.rng.pieces.next
+    
+    def _spawn_new_piece(self) -> None:
+        """Make the next piece the current one at the spawn position."""
+        self.piece_type = self.next_piece_type
+        self.next_piece_type = self._next_piece()
+        self.orientation = 0
+        self.x, self.y = SPAWN_X, SPAWN_Y
+    
+    def fits(self, orientation: int, x: int, y: int) -> bool:
+        """
+        Check if the current piece fits at a position.
+        
+        As in GameCore, cells above the visible area are always free and
+        the walls and floor are always blocked.
+        
+        Args:
+            orientation: Orientation of the piece
+            x: X coordinate of the piece center
+            y: Y coordinate of the piece center
+        
+        Returns:
+            True if every cell of the piece is free, False otherwise
+        """
+        shape = SHAPES[self.piece_type][orientation]
+        left = x + shape.min_dx
+        if left < 0 or x + shape.max_dx >= GRID_WIDTH:
+            return False
+        rows = self.board.rows
+        for dy, mask in shape.row_masks:
+            row = y + dy
+            if row >= GRID_HEIGHT:
+                return False
+            if row >= 0 and rows[row] & mask << left:
+                return False
+        return True
+    
+    def piece_cells(self) -> List[Tuple[int, int]]:
+        """Get the (x, y) positions of the blocks of the current piece."""
+        x, y = self.x, self.y
+        return [(x + dx, y + dy) for dx, dy in SHAPES[self.piece_type][self.orientation].cells]
+    
+    def move(self, dx: int, dy: int) -> bool:
+        """
+        Move the current piece if the target position is free.
+        
+        Returns:
+            True if the piece moved, False otherwise
+        """
+        if not self.fits(self.orientation, self.x + dx, self.y + dy):
+            return False
+        self.x += dx
+        self.y += dy
+        return True
+    
+    def rotate(self, rotation: str) -> bool:
+        """
+        Rotate the current piece a quarter turn using the kick tables.
+        
+        Args:
+            rotation: Rotation direction ("CW", "CCW")
+        
+        Returns:
+            True if the rotation was successful, False otherwise
+        """
+        if rotation not in ROTATIONS:
+            return False
+        
+        target = (self.orientation + ROTATIONS[rotation]) % NUM_ORIENTATIONS
+        for kick_x, kick_y in KICK_TABLES[self.piece_type][(self.orientation, target)]:
+            if self.fits(target, self.x + kick_x, self.y + kick_y):
+                self.orientation = target
+                self.x += kick_x
+                self.y += kick_y
+                return True
+        return False
+    
+    def drop_distance(self) -> int:
+        """Get how many rows the current piece can fall before landing."""
+        shape = SHAPES[self.piece_type][self.orientation]
+        heights = self.board.heights
+        x, y = self.x, self.y
+        distance = GRID_HEIGHT
+        for dx, dy in shape.bottoms:
+            free = GRID_HEIGHT - heights[x + dx] - 1 - y - dy
+            if free < 0:
+                break
+            if free < distance:
+                distance = free
+        else:
+            return distance
+        
+        # The piece is tucked under an overhang, probe the rows below
+        distance = 0
+        while self.fits(self.orientation, x, y + distance + 1):
+            distance += 1
+        return distance
+    
+    def lock(self) -> int:
+        """
+        Settle the current piece where it is, clear lines and spawn the next.
+        
+        Cells above the visible area are discarded, as in GameCore.
+        
+        Returns:
+            Number of lines cleared
+        """
+        shape = SHAPES[self.piece_type][self.orientation]
+        board = self.board
+        self.pieces_placed += 1
+        rows = board.rows
+        left = self.x + shape.min_dx
+        y = self.y
+        full_rows = []
+        for dy, mask in shape.row_masks:
+            row = y + dy
+            if row >= 0:
+                board.fill_row_mask(row, mask << left)
+                if rows[row] & FULL_ROW_MASK == FULL_ROW_MASK:
+                    full_rows.append(row)
+        
+        if full_rows:
+            board.remove_rows(full_rows)
+            for _ in full_rows:
+                self.lines_cleared += 1
+                self.score += 100 * self.lines_cleared
+        
+        if rows[0] & FULL_ROW_MASK:
+            self.state = _GAME_OVER
+        else:
+            self._spawn_new_piece()
+        return len(full_rows)
+    
+    def hard_drop(self) -> int:
+        """
+        Drop the current piece to its landing row and lock it.
+        
+        Returns:
+            Number of lines cleared
+        """
+        self.y += self.drop_distance()
+        return self.lock()
+    
+    def apply_action(self, action: str) -> bool:
+        """
+        Apply a player action to the current piece.
+        
+        Args:
+            action: One of the ``ACTIONS`` values
+        
+        Returns:
+            True if the piece moved, rotated or dropped, False otherwise
+        """
+        if self.state != _PLAYING:
+            return False
+        
+        if action == ACTIONS["DOWN"]:
+            if self.move(0, 1):
+                return True
+            self.lock()
+            return False
+        if action == ACTIONS["LEFT"]:
+            return self.move(-1, 0)
+        if action == ACTIONS["RIGHT"]:
+            return self.move(1, 0)
+        if action == ACTIONS["ROTATE_CW"]:
+            return self.rotate("CW")
+        if action == ACTIONS["ROTATE_CCW"]:
+            return self.rotate("CCW")
+        if action == ACTIONS["HARD_DROP"]:
+            self.hard_drop()
+            return True
+        if action == ACTIONS["SONIC_DROP"]:
+            distance = self.drop_distance()
+            self.y += distance
+            return distance > 0
+        return False
+    
+    def step(self, action: Optional[str] = None, gravity: bool = True) -> StepResult:
+        """
+        Advance the game by one tick, like GameCore.step.
+        
+        Args:
+            action: One of the ``ACTIONS`` values, or None to only fall
+            gravity: Whether the tick includes a gravity drop
+        
+        Returns:
+            The events of the step
+        """
+        score, lines, placed = self.score, self.lines_cleared, self.pieces_placed
+        moved = self.apply_action(action) if action is not None else False
+        if gravity and self.state == _PLAYING and self.pieces_placed == placed:
+            if not self.move(0, 1):
+                self.lock()
+        return StepResult(
+            moved=moved,
+            locked=self.pieces_placed != placed,
+            lines=self.lines_cleared - lines,
+            score=self.score - score,
+            game_over=self.state == _GAME_OVER,
+        )
+    
+    def _path_fits(self, orientation: int, x: int) -> bool:
+        """Check the kick-free rotate-then-shift path of ``place`` from the current position."""
+        y = self.y
+        current, column = self.orientation, self.x
+        turns = (orientation - current) % NUM_ORIENTATIONS
+        # Three quarter turns one way are one turn the other way
+        step, turns = (-1, 1) if turns == NUM_ORIENTATIONS - 1 else (1, turns)
+        for _ in range(turns):
+            current = (current + step) % NUM_ORIENTATIONS
+            if not self.fits(current, column, y):
+                return False
+        while column != x:
+            column += 1 if x > column else -1
+            if not self.fits(orientation, column, y):
+                return False
+        return self.fits(orientation, column, y)
+    
+    def place(self, orientation: int, x: int) -> StepResult:
+        """
+        Put the current piece in an orientation and column and hard drop it.
+        
+        The piece is turned the short way round, then shifted one column
+        at a time, all at its current height and without kicks, so this is
+        the placement a player reaches by rotating and moving sideways
+        right after the spawn. Every position on that path must be free.
+        
+        Args:
+            orientation: Final orientation of the piece
+            x: Final X coordinate of the piece center
+        
+        Returns:
+            The events of the placement; nothing happens and ``moved`` is
+            False if the piece cannot get there
+        """
+        if self.state != _PLAYING or not self._path_fits(orientation, x):
+            return StepResult(False, False, 0, 0, self.state == _GAME_OVER)
+        score = self.score
+        self.orientation = orientation
+        self.x = x
+        lines = self.hard_drop()
+        return StepResult(True, True, lines, self.score - score, self.state == _GAME_OVER)
+    
+    def state_hash(self) -> int:
+        """Get the Zobrist hash of the settled cells and the piece types, like GameCore."""
+        piece_type = self.piece_type if self.state == _PLAYING else -1
+        return state_hash(self.board.zobrist, piece_type, self.next_piece_type)
+    
+    def snapshot(self) -> GameSnapshot:
+        """
+        Capture the state of the game, to try moves and undo them.
+        
+        Returns:
+            Immutable value holding everything ``restore`` needs
+        """
+        return GameSnapshot(
+            rows=tuple(self.board.rows),
+            heights=tuple(self.board.heights),
+            column_counts=tuple(self.board.column_counts),
+            zobrist=self.board.zobrist,
+            colors=b"",
+            piece_type=self.piece_type,
+            orientation=self.orientation,
+            x=self.x,
+            y=self.y,
+            next_piece_type=self.next_piece_type,
+            score=self.score,
+            lines_cleared=self.lines_cleared,
+            state=self.state,
+            tick=0,
+            pieces_placed=self.pieces_placed,
+            rng_state=self.rng.pieces.getstate(),
+        )
+    
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """
+        Put the game back in the state captured by ``snapshot``.
+        
+        Args:
+            snapshot: State taken from a Simulator
+        """
+        self.board.load(snapshot.rows, snapshot.heights, snapshot.column_counts,
+                        snapshot.zobrist)
+        self.piece_type = snapshot.piece_type
+        self.orientation = snapshot.orientation
+        self.x = snapshot.x
+        self.y = snapshot.y
+        self.next_piece_type = snapshot.next_piece_type
+        self.score = snapshot.score
+        self.lines_cleared = snapshot.lines_cleared
+        self.pieces_placed = snapshot.pieces_placed
+        self.state = snapshot.state
+        self.rng.pieces.setstate(snapshot.rng_state)
+    
+    def get_surface_profile(self) -> SurfaceProfile:
+        """Get the heights, holes and wells of the board surface."""
+        return self.board.profile
+    
+    def __repr__(self) -> str:
+        """String representation of the simulator."""
+        return (f"Simulator(piece={self.piece_type}, orientation={self.orientation}, "
+                f"x={self.x}, y={self.y}, score={self.score}, state={self.state})")
@@ -0,0 +1,130 @@
+"""
+Transposition table for the Tetris game.
+
+This module contains the TranspositionTable class, a bounded memo of
+evaluations keyed by state hash (see ``state_hash`` on the games). When
+the table is full the least recently used entry is evicted, and lookups
+are counted so bots can see how often the memo pays off.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Generic, NamedTuple, Optional, TypeVar
+
+V = TypeVar("V")
+
+DEFAULT_CAPACITY = 1 << 16
+
+
+class TableStats(NamedTuple):
+    """Lookup statistics of a transposition table."""
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    capacity: int
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that found an entry, 0.0 before any lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TranspositionTable(Generic[V]):
+    """
+    Bounded LRU map from state hashes to evaluations.
+    
+    ``get`` and ``get_or_compute`` count as lookups in the statistics;
+    ``put`` and membership tests do not.
+    """
+    
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Initialize an empty table.
+        
+        Args:
+            capacity: Maximum number of entries
+        
+        Raises:
+            ValueError: If the capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError(f"Transposition table capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._entries: 'OrderedDict[int, V]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: int, default: Optional[V] = None) -> Optional[V]:
+        """
+        Look up an entry and mark it as recently used.
+        
+        Args:
+            key: State hash
+            default: Value returned when the key is missing
+        
+        Returns:
+            The stored value, or default
+        """
+        entries = self._entries
+        if key in entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+        self.misses += 1
+        return default
+    
+    def put(self, key: int, value: V) -> None:
+        """Store an entry, evicting the least recently used one if the table is full."""
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+        elif len(entries) >= self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+        entries[key] = value
+    
+    def get_or_compute(self, key: int, compute: Callable[[], V]) -> V:
+        """
+        Get an entry, computing and storing it on a miss.
+        
+        Args:
+            key: State hash
+            compute: Called without arguments to evaluate a missing key
+        
+        Returns:
+            The stored or newly computed value
+        """
+        entries = self._entries
+        if key in entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+        self.misses += 1
+        value = compute()
+        self.put(key, value)
+        return value
+    
+    def stats(self) -> TableStats:
+        """Get the lookup statistics and the current size."""
+        return TableStats(self.hits, self.misses, self.evictions, len(self._entries), self.capacity)
+    
+    def clear(self) -> None:
+        """Remove every entry and reset the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+    
+    def __contains__(self, key: object) -> bool:
+        """Check if a key is stored, without counting a lookup."""
+        return key in self._entries
+    
+    def __len__(self) -> int:
+        """Number of stored entries."""
+        return len(self._entries)
+    
+    def __repr__(self) -> str:
+        """String representation of the table."""
+        stats = self.stats()
+        return (f"TranspositionTable(size={stats.size}, capacity={stats.capacity}, "
+                f"hit_rate={stats.hit_rate:.2f})")
@@ -0,0 +1,348 @@
+"""
+Genetic tuning of the autoplayer heuristic.
+
+This module evolves a population of HeuristicWeights. Every individual
+plays the same fixed seeds with the headless Simulator. Games are fanned
+out as (individual, seed) tasks over a process pool. The fitness of an
+individual is the mean number of lines it cleared.
+
+Weight vectors are kept at unit length, since scaling all weights does
+not change which placement wins. Each generation, parents are picked by
+tournament and combined by a fitness-weighted average. Some children
+get one weight nudged. The children replace the worst individuals.
+
+The population is checkpointed to a JSON file after it is evaluated and
+after it is bred, together with the random generator state. A run that
+is interrupted resumes from the checkpoint and produces the same
+generations as an uninterrupted run.
+
+Usage:
+    python -m tetris.tuning CHECKPOINT [--generations N] [--population N]
+        [--games N] [--max-pieces N] [--workers N] [--fresh]
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .autoplayer import DEFAULT_WEIGHTS, HeuristicWeights, play_heuristic_game
+from .placements import PlacementGenerator
+from .simulator import Simulator
+
+CHECKPOINT_VERSION = 1
+
+# Placement results cached per worker; boards repeat across individuals
+# only in the first moves of each seed
+_CACHE_CAPACITY = 4096
+
+
+class TuningError(ValueError):
+    """Raised when a checkpoint file is malformed or does not match the run."""
+
+
+class TuningConfig(NamedTuple):
+    """Parameters of a tuning run, stored in its checkpoint."""
+    population_size: int = 16
+    seeds: Tuple[int, ...] = (0, 1, 2, 3)
+    max_pieces: int = 200
+    tournament_size: int = 4
+    offspring_fraction: float = 0.3
+    mutation_rate: float = 0.1
+    mutation_scale: float = 0.2
+    random_seed: int = 0
+
+
+DEFAULT_CONFIG = TuningConfig()
+
+
+class Checkpoint(NamedTuple):
+    """
+    State of a tuning run between two steps.
+    
+    ``fitness`` is None until the population of ``generation`` has been
+    evaluated.
+    """
+    config: TuningConfig
+    generation: int
+    population: List[HeuristicWeights]
+    fitness: Optional[List[float]]
+    rng_state: tuple
+
+
+class GenerationReport(NamedTuple):
+    """Outcome of one evaluated generation."""
+    generation: int
+    best: HeuristicWeights
+    best_fitness: float
+    mean_fitness: float
+    seconds: float
+    generations_per_hour: float
+
+
+def normalize(values: Sequence[float]) -> HeuristicWeights:
+    """Scale a weight vector to unit length."""
+    norm = math.sqrt(sum(value * value for value in values)) or 1.0
+    return HeuristicWeights(*(value / norm for value in values))
+
+
+def random_population(size: int, rng: random.Random) -> List[HeuristicWeights]:
+    """Draw unit weight vectors uniformly from the cube [-1, 1]^n."""
+    count = len(HeuristicWeights._fields)
+    return [normalize([rng.uniform(-1.0, 1.0) for _ in range(count)]) for _ in range(size)]
+
+
+def initial_population(size: int, rng: random.Random) -> List[HeuristicWeights]:
+    """
+    Start from the hand-tuned weights and random ones.
+    
+    Random weights mostly clear no lines at all, so the hand-tuned
+    individual gives the selection something to build on from the start.
+    """
+    return [normalize(DEFAULT_WEIGHTS)] + random_population(size - 1, rng)
+
+
+def crossover(first: HeuristicWeights, first_fitness: float,
+              second: HeuristicWeights, second_fitness: float) -> HeuristicWeights:
+    """Average two parents, weighted by their fitness."""
+    total = first_fitness + second_fitness
+    share = first_fitness / total if total > 0 else 0.5
+    return normalize([share * a + (1.0 - share) * b for a, b in zip(first, second)])
+
+
+def mutate(weights: HeuristicWeights, scale: float, rng: random.Random) -> HeuristicWeights:
+    """Nudge one random weight by up to scale."""
+    values = list(weights)
+    values[rng.randrange(len(values))] += rng.uniform(-scale, scale)
+    return normalize(values)
+
+
+def next_generation(population: Sequence[HeuristicWeights], fitness: Sequence[float],
+                    config: TuningConfig, rng: random.Random) -> List[HeuristicWeights]:
+    """
+    Breed the next population, best individuals first.
+    
+    Args:
+        population: Current individuals
+        fitness: Fitness of each individual
+        config: Selection and mutation parameters
+        rng: Random generator of the run
+    
+    Returns:
+        The survivors followed by their offspring
+    """
+    size = len(population)
+    offspring_count = min(size, max(1, round(size * config.offspring_fraction)))
+    tournament_size = min(size, config.tournament_size)
+    offspring = []
+    for _ in range(offspring_count):
+        entrants = sorted(rng.sample(range(size), tournament_size),
+                          key=lambda index: fitness[index], reverse=True)
+        first, second = entrants[0], entrants[min(1, tournament_size - 1)]
+        child = crossover(population[first], fitness[first], population[second], fitness[second])
+        if rng.random() < config.mutation_rate:
+            child = mutate(child, config.mutation_scale, rng)
+        offspring.append(child)
+    ranked = sorted(range(size), key=lambda index: fitness[index], reverse=True)
+    return [population[index] for index in ranked[:size - offspring_count]] + offspring
+
+
+# Per-process state of the pool workers
+_worker_simulator: Optional[Simulator] = None
+_worker_generator: Optional[PlacementGenerator] = None
+
+
+def _init_worker() -> None:
+    """Create the simulator and placement cache reused by every game of a worker."""
+    global _worker_simulator, _worker_generator
+    _worker_simulator = Simulator()
+    _worker_generator = PlacementGenerator(_CACHE_CAPACITY)
+
+
+def _play(weights: HeuristicWeights, seed: int, max_pieces: int) -> int:
+    """Play one game and get the number of lines cleared."""
+    if _worker_simulator is None:
+        _init_worker()
+    return play_heuristic_game(_worker_simulator, seed, weights, max_pieces,
+                               _worker_generator).lines
+
+
+def evaluate_population(population: Sequence[HeuristicWeights], seeds: Sequence[int],
+                        max_pieces: int, pool: Optional[Executor] = None) -> List[float]:
+    """
+    Get the mean number of lines each individual clears over the seeds.
+    
+    Args:
+        population: Individuals to evaluate
+        seeds: Seeds every individual plays
+        max_pieces: Piece limit per game
+        pool: Worker processes, None to play in the calling process
+    
+    Returns:
+        The fitness of each individual
+    """
+    tasks = [(weights, seed) for weights in population for seed in seeds]
+    individuals = [task[0] for task in tasks]
+    task_seeds = [task[1] for task in tasks]
+    if pool is None:
+        lines = list(map(_play, individuals, task_seeds, repeat(max_pieces)))
+    else:
+        chunk_size = max(1, len(tasks) // (4 * (os.cpu_count() or 1)))
+        lines = list(pool.map(_play, individuals, task_seeds, repeat(max_pieces),
+                              chunksize=chunk_size))
+    count = len(seeds)
+    return [statistics.fmean(lines[i:i + count]) for i in range(0, len(lines), count)]
+
+
+def save_checkpoint(path: str, checkpoint: Checkpoint) -> None:
+    """
+    Write a checkpoint, replacing the previous one atomically.
+    
+    The new file is written and synced next to the old one, then renamed
+    over it, so an interruption leaves either checkpoint intact.
+    """
+    version, internal, gauss = checkpoint.rng_state
+    data = {
+        "version": CHECKPOINT_VERSION,
+        "config": checkpoint.config._asdict(),
+        "generation": checkpoint.generation,
+        "population": [list(weights) for weights in checkpoint.population],
+        "fitness": checkpoint.fitness,
+        "rng_state": [version, list(internal), gauss],
+    }
+    temporary = path + ".tmp"
+    with open(temporary, "w") as file:
+        json.dump(data, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+
+def load_checkpoint(path: str) -> Checkpoint:
+    """
+    Read a checkpoint.
+    
+    Raises:
+        TuningError: If the file is not a checkpoint of this version
+    """
+    try:
+        with open(path) as file:
+            data = json.load(file)
+        version = data["version"]
+    except (json.JSONDecodeError, KeyError, TypeError) as error:
+        raise TuningError(f"Malformed checkpoint {path!r}: {error}") from error
+    if version != CHECKPOINT_VERSION:
+        raise TuningError(f"Unsupported checkpoint version {version}")
+    try:
+        config = data["config"]
+        config["seeds"] = tuple(config["seeds"])
+        state_version, internal, gauss = data["rng_state"]
+        return Checkpoint(
+            config=TuningConfig(**config),
+            generation=data["generation"],
+            population=[HeuristicWeights(*weights) for weights in data["population"]],
+            fitness=data["fitness"],
+            rng_state=(state_version, tuple(internal), gauss),
+        )
+    except (KeyError, TypeError, ValueError) as error:
+        raise TuningError(f"Malformed checkpoint {path!r}: {error}") from error
+
+
+def tune(path: str, generations: int, config: TuningConfig = DEFAULT_CONFIG,
+         workers: Optional[int] = None, resume: bool = True) -> Iterator[GenerationReport]:
+    """
+    Evolve the weights, checkpointing every step, and report each generation.
+    
+    Args:
+        path: Checkpoint file
+        generations: Total number of generations of the run, counting
+            those of the checkpoint
+        config: Parameters of a new run; a resumed run keeps its own
+        workers: Number of worker processes; None for one per CPU, 0 to
+            play in the calling process
+        resume: Continue from the checkpoint when it exists
+    
+    Yields:
+        One report per generation evaluated by this call
+    
+    Raises:
+        TuningError: If the checkpoint is malformed
+    """
+    if resume and os.path.exists(path):
+        checkpoint = load_checkpoint(path)
+        rng = random.Random()
+        rng.setstate(checkpoint.rng_state)
+    else:
+        rng = random.Random(config.random_seed)
+        population = initial_population(config.population_size, rng)
+        checkpoint = Checkpoint(config, 0, population, None, rng.getstate())
+        save_checkpoint(path, checkpoint)
+    config = checkpoint.config
+    
+    pool = None
+    if workers != 0:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    try:
+        start = time.perf_counter()
+        evaluated = 0
+        generation = checkpoint.generation
+        population, fitness = checkpoint.population, checkpoint.fitness
+        while generation < generations:
+            if fitness is None:
+                fitness = evaluate_population(population, config.seeds, config.max_pieces, pool)
+                evaluated += 1
+                save_checkpoint(path, Checkpoint(config, generation, population, fitness,
+                                                 rng.getstate()))
+            
+            elapsed = time.perf_counter() - start
+            best = max(range(len(population)), key=lambda index: fitness[index])
+            yield GenerationReport(
+                generation=generation,
+                best=population[best],
+                best_fitness=fitness[best],
+                mean_fitness=statistics.fmean(fitness),
+                seconds=elapsed,
+                generations_per_hour=evaluated * 3600 / elapsed if elapsed > 0 else 0.0,
+            )
+            
+            population = next_generation(population, fitness, config, rng)
+            generation += 1
+            fitness = None
+            save_checkpoint(path, Checkpoint(config, generation, population, None, rng.getstate()))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def main() -> None:
+    """Command line entry point of the tuner."""
+    parser = argparse.ArgumentParser(description="Tune the autoplayer heuristic weights.")
+    parser.add_argument("checkpoint")
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--population", type=int, default=DEFAULT_CONFIG.population_size)
+    parser.add_argument("--games", type=int, default=len(DEFAULT_CONFIG.seeds),
+                        help="seeds 0..N-1 played by every individual")
+    parser.add_argument("--max-pieces", type=int, default=DEFAULT_CONFIG.max_pieces)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--fresh", action="store_true", help="ignore an existing checkpoint")
+    args = parser.parse_args()
+    
+    config = TuningConfig(population_size=args.population, seeds=tuple(range(args.games)),
+                          max_pieces=args.max_pieces)
+    for report in tune(args.checkpoint, args.generations, config, args.workers,
+                       resume=not args.fresh):
+        weights = ", ".join(f"{name}={value:+.4f}"
+                            for name, value in report.best._asdict().items())
+        print(f"generation {report.generation:>4}  best {report.best_fitness:7.2f}  "
+              f"mean {report.mean_fitness:7.2f}  {report.generations_per_hour:7.1f} gen/h  "
+              f"{weights}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Zobrist hashing for the Tetris game.
+
+Every cell of the visible grid and every piece type gets a fixed random
+64-bit key. The hash of a board is the XOR of the keys of its occupied
+cells, so occupying or freeing a cell updates it with one XOR; the hash
+of a game state adds the keys of the current and next piece types.
+
+The keys are drawn from a generator with a fixed seed, so hashes are
+stable across runs and processes and can be stored or shared.
+"""
+
+import random
+from typing import Iterable, Tuple
+
+from .constants import GRID_WIDTH, GRID_HEIGHT, PIECE_CONFIGURATIONS
+
+_ZOBRIST_SEED = 0x5EED7E7215
+
+_keys = random.Random(_ZOBRIST_SEED)
+
+# CELL_KEYS[y][x] -> key of the occupied cell (x, y)
+CELL_KEYS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_keys.getrandbits(64) for _ in range(GRID_WIDTH)) for _ in range(GRID_HEIGHT)
+)
+
+# Keys of the current and of the next piece type
+PIECE_KEYS: Tuple[int, ...] = tuple(_keys.getrandbits(64) for _ in PIECE_CONFIGURATIONS)
+NEXT_PIECE_KEYS: Tuple[int, ...] = tuple(_keys.getrandbits(64) for _ in PIECE_CONFIGURATIONS)
+
+del _keys
+
+
+def hash_cells(cells: Iterable[Tuple[int, int]]) -> int:
+    """
+    Hash a set of occupied cells from scratch.
+    
+    Args:
+        cells: (x, y) positions inside the visible grid
+    
+    Returns:
+        XOR of the keys of the cells
+    """
+    value = 0
+    for x, y in cells:
+        value ^= CELL_KEYS[y][x]
+    return value
+
+
+def state_hash(board_hash: int, piece_type: int, next_piece_type: int) -> int:
+    """
+    Hash a game state at the spawn of a piece.
+    
+    Args:
+        board_hash: Zobrist hash of the settled cells
+        piece_type: Type of the current piece, -1 for none
+        next_piece_type: Type of the next piece
+    
+    Returns:
+        Hash of the board and both piece types
+    """
+    value = board_hash ^ NEXT_PIECE_KEYS[next_piece_type]
+    if piece_type >= 0:
+        value ^= PIECE_KEYS[piece_type]
+    return value